@@ -0,0 +1,75 @@
+# backend_python/accessibility_features.py
+"""
+Course accessibility features in one normalized form: a sorted list of
+kebab-case AccessibilityFeature values, e.g. ``["captions", "screen-reader"]``.
+
+Older documents and clients send dicts (``{"screen_reader": True}``) or
+snake_case names; ``normalize_features`` converts all of them. The list is
+multikey-indexed with ``is_published`` so "usable with my assistive tech"
+queries are a single indexed ``$all`` match.
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+from backend_python.mongodb_db import ASCENDING, get_courses_collection
+
+FEATURE_ALIASES = {
+    "transcript": "transcripts",
+    "tts": "text-to-speech",
+    "keyboard": "keyboard-navigation",
+    "simplified-navigation": "simplified-ui",
+}
+
+# AccessibilitySettings.settings keys (as sent by the frontend) that require a
+# course feature when enabled
+SETTING_FEATURES = {
+    "screenReaderEnabled": "screen-reader",
+    "textToSpeechEnabled": "text-to-speech",
+    "highContrastMode": "high-contrast",
+    "captionsEnabled": "captions",
+    "transcriptsEnabled": "transcripts",
+    "signLanguageEnabled": "sign-language",
+    "keyboardOnlyNavigation": "keyboard-navigation",
+    "voiceCommandNavigation": "voice-control",
+    "simplifiedNavigation": "simplified-ui",
+}
+
+def normalize_feature(name: str) -> str:
+    feature = name.strip().lower().replace("_", "-").replace(" ", "-")
+    return FEATURE_ALIASES.get(feature, feature)
+
+def normalize_features(value: Any) -> List[str]:
+    """Sorted, de-duplicated feature list from a list, dict or comma-separated string."""
+    if not value:
+        return []
+    if isinstance(value, dict):
+        names: Iterable[str] = (key for key, enabled in value.items() if enabled)
+    elif isinstance(value, str):
+        names = value.split(",")
+    else:
+        names = value
+    return sorted({normalize_feature(str(name)) for name in names if str(name).strip()})
+
+def features_for_settings(settings: Optional[Dict[str, Any]]) -> List[str]:
+    """Features a course must support for a user's accessibility settings."""
+    if not settings:
+        return []
+    required = []
+    for key, feature in SETTING_FEATURES.items():
+        # Accept snake_case keys too (screen_reader_enabled, ...)
+        snake_key = "".join(f"_{c.lower()}" if c.isupper() else c for c in key)
+        if settings.get(key, settings.get(snake_key)):
+            required.append(feature)
+    return sorted(required)
+
+def features_query(features: Iterable[str]) -> Dict[str, Any]:
+    """Published courses supporting every one of ``features``."""
+    query: Dict[str, Any] = {"is_published": True}
+    features = normalize_features(list(features))
+    if features:
+        query["accessibility_features"] = {"$all": features}
+    return query
+
+async def ensure_feature_indexes() -> None:
+    await get_courses_collection().create_index(
+        [("is_published", ASCENDING), ("accessibility_features", ASCENDING)]
+    )
@@ -0,0 +1,40 @@
+"""Index quizzes, questions and assignments in creation order
+
+Revision ID: 3a7f9c1e5d24
+Revises: 8e4d2c6b9a10
+Create Date: 2026-10-19 20:12:41.208315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a7f9c1e5d24'
+down_revision: Union[str, Sequence[str], None] = '8e4d2c6b9a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (new index, table, columns, index it supersedes) -- mirrors models.py
+INDEXES = [
+    ('ix_quizzes_course_created', 'quizzes', ['course_id', 'created_at', 'id'], None),
+    ('ix_questions_quiz_created', 'questions', ['quiz_id', 'created_at', 'id'], ('ix_questions_quiz_id', ['quiz_id'])),
+    ('ix_assignments_course_created', 'assignments', ['course_id', 'created_at', 'id'], ('ix_assignments_course_id', ['course_id'])),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns, superseded in INDEXES:
+        op.create_index(name, table, columns)
+        if superseded:
+            op.drop_index(superseded[0], table_name=table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _, superseded in reversed(INDEXES):
+        if superseded:
+            op.create_index(superseded[0], table, superseded[1])
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,40 @@
+"""Add quiz item analytics table and submissions keyset index
+
+Revision ID: 5c9e2b7a1f3d
+Revises: d41a8e6f0c27
+Create Date: 2026-10-19 13:27:05.913442
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c9e2b7a1f3d'
+down_revision: Union[str, Sequence[str], None] = 'd41a8e6f0c27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('quiz_item_analytics',
+    sa.Column('quiz_id', sa.UUID(), nullable=False),
+    sa.Column('submission_count', sa.Integer(), nullable=False),
+    sa.Column('last_submitted_at', sa.DateTime(), nullable=True),
+    sa.Column('last_submission_id', sa.String(length=36), nullable=True),
+    sa.Column('state', sa.JSON(), nullable=True),
+    sa.Column('items', sa.JSON(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['quiz_id'], ['quizzes.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('quiz_id')
+    )
+    op.create_index('ix_submissions_quiz_submitted', 'submissions', ['quiz_id', 'submitted_at', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_submissions_quiz_submitted', table_name='submissions')
+    op.drop_table('quiz_item_analytics')
@@ -0,0 +1,33 @@
+"""Order discussion threads by last activity
+
+Revision ID: 7d2e4b9c1f60
+Revises: 3a7f9c1e5d24
+Create Date: 2026-10-19 21:04:17.530942
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2e4b9c1f60'
+down_revision: Union[str, Sequence[str], None] = '3a7f9c1e5d24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Postgres sorts NULLs first in DESC order; they would head every thread list
+    op.execute('UPDATE discussions SET last_activity_at = created_at WHERE last_activity_at IS NULL')
+    op.create_index(
+        'ix_discussions_course_parent_activity', 'discussions', ['course_id', 'parent_id', 'last_activity_at', 'id']
+    )
+    op.drop_index('ix_discussions_course_parent_created', table_name='discussions')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_discussions_course_parent_created', 'discussions', ['course_id', 'parent_id', 'created_at', 'id'])
+    op.drop_index('ix_discussions_course_parent_activity', table_name='discussions')
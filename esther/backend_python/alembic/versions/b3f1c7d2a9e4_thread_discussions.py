@@ -0,0 +1,39 @@
+"""Thread discussions: parent_id, reply counts and keyset indexes
+
+Revision ID: b3f1c7d2a9e4
+Revises: 66ebade295e9
+Create Date: 2026-10-19 10:12:41.208113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f1c7d2a9e4'
+down_revision: Union[str, Sequence[str], None] = '66ebade295e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('discussions', sa.Column('parent_id', sa.UUID(), nullable=True))
+    op.add_column('discussions', sa.Column('reply_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('discussions', sa.Column('last_activity_at', sa.DateTime(), nullable=True))
+    op.create_foreign_key('discussions_parent_id_fkey', 'discussions', 'discussions', ['parent_id'], ['id'], ondelete='CASCADE')
+    op.execute('UPDATE discussions SET last_activity_at = created_at')
+    op.create_index('ix_discussions_course_parent_created', 'discussions', ['course_id', 'parent_id', 'created_at', 'id'])
+    op.create_index('ix_discussions_parent_created', 'discussions', ['parent_id', 'created_at', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_discussions_parent_created', table_name='discussions')
+    op.drop_index('ix_discussions_course_parent_created', table_name='discussions')
+    op.drop_constraint('discussions_parent_id_fkey', 'discussions', type_='foreignkey')
+    op.drop_column('discussions', 'last_activity_at')
+    op.drop_column('discussions', 'reply_count')
+    op.drop_column('discussions', 'parent_id')
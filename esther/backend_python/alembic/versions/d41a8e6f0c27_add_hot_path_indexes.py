@@ -0,0 +1,44 @@
+"""Add composite indexes for the SQL hot paths
+
+Revision ID: d41a8e6f0c27
+Revises: b3f1c7d2a9e4
+Create Date: 2026-10-19 11:03:17.554902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41a8e6f0c27'
+down_revision: Union[str, Sequence[str], None] = 'b3f1c7d2a9e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns) -- mirrors the __table_args__ in models.py
+INDEXES = [
+    ('ix_progress_user_course', 'progress', ['user_id', 'course_id']),
+    ('ix_mentorship_memberships_group_user', 'mentorship_memberships', ['group_id', 'user_id']),
+    ('ix_questions_quiz_id', 'questions', ['quiz_id']),
+    ('ix_modules_course_order', 'modules', ['course_id', 'order_index']),
+    ('ix_lessons_module_order', 'lessons', ['module_id', 'order_index']),
+    ('ix_resources_course_id', 'resources', ['course_id']),
+    ('ix_resources_module_id', 'resources', ['module_id']),
+    ('ix_resources_lesson_id', 'resources', ['lesson_id']),
+    ('ix_assignments_course_id', 'assignments', ['course_id']),
+    ('ix_announcements_course_created', 'announcements', ['course_id', 'created_at']),
+    ('ix_pages_course_order', 'pages', ['course_id', 'order_index']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
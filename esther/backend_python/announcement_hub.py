@@ -0,0 +1,82 @@
+# backend_python/announcement_hub.py
+"""
+In-process fan-out of new announcements to server-sent-event clients.
+
+Each client gets a bounded queue; a client that stops reading loses its oldest
+pending events instead of growing memory without bound, and can catch up with
+the ``since`` parameter of the polling endpoint. The hub reaches clients
+connected to this worker only.
+"""
+import asyncio
+import json
+from collections import defaultdict
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Set
+
+CLIENT_QUEUE_SIZE = 100
+KEEPALIVE_SECONDS = 15.0
+
+class Subscription:
+    def __init__(self, topics: Iterable[str], maxsize: int = CLIENT_QUEUE_SIZE):
+        self.topics = frozenset(topics)
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def offer(self, event: Dict[str, Any]) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+class AnnouncementHub:
+    def __init__(self):
+        self._subscribers: Dict[str, Set[Subscription]] = defaultdict(set)
+
+    def subscribe(self, course_ids: Iterable[str]) -> Subscription:
+        subscription = Subscription(course_ids)
+        for course_id in subscription.topics:
+            self._subscribers[course_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        for course_id in subscription.topics:
+            subscribers = self._subscribers.get(course_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[course_id]
+
+    def publish(self, course_id: str, event: Dict[str, Any]) -> int:
+        """Queue ``event`` for every client following ``course_id``; returns how many."""
+        subscribers = self._subscribers.get(course_id, ())
+        for subscription in subscribers:
+            subscription.offer(event)
+        return len(subscribers)
+
+    def client_count(self) -> int:
+        return len({s for subscribers in self._subscribers.values() for s in subscribers})
+
+def format_sse(data: Dict[str, Any], event: str = "announcement", event_id: Optional[str] = None) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+async def sse_stream(hub: AnnouncementHub, course_ids: Iterable[str], is_disconnected) -> AsyncIterator[str]:
+    """Yields SSE frames for ``course_ids`` until the client disconnects."""
+    subscription = hub.subscribe(course_ids)
+    try:
+        yield ": connected\n\n"
+        while not await is_disconnected():
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), timeout=KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                # Comment frames keep proxies from closing an idle connection
+                yield ": keepalive\n\n"
+                continue
+            yield format_sse(event, event_id=str(event.get("id")))
+    finally:
+        hub.unsubscribe(subscription)
+
+announcement_hub = AnnouncementHub()
\ No newline at end of file
@@ -1,8 +1,7 @@
 from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
-from jose import jwt, JWTError
-from passlib.context import CryptContext
+from functools import lru_cache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 import logging
@@ -13,7 +12,12 @@ from .settings_configuration import settings
 # ==================== Password / JWT Config ====================
 # Use PBKDF2-SHA256 to avoid relying on the system `bcrypt` extension
 # which has platform-specific build issues and a 72-byte input limit.
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# The context is built on first use; passlib's handler registry is slow to import.
+@lru_cache(maxsize=1)
+def get_pwd_context():
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 SECRET_KEY = settings.SECRET_KEY
@@ -24,24 +28,28 @@ REFRESH_SECRET_KEY = settings.REFRESH_SECRET_KEY
 
 # ==================== Password Utilities ====================
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 # ==================== JWT Utilities ====================
+# python-jose is imported inside each function so it stays off the cold-start path.
 def create_access_token(subject: str, expires_minutes: Optional[int] = None) -> str:
     expire = datetime.utcnow() + timedelta(minutes=(expires_minutes or ACCESS_TOKEN_EXPIRE_MINUTES))
     to_encode = {"sub": str(subject), "exp": expire.timestamp(), "type": "access"}
+    from jose import jwt
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 def create_refresh_token(subject: str, expires_minutes: Optional[int] = None) -> str:
     expire = datetime.utcnow() + timedelta(minutes=(expires_minutes or REFRESH_TOKEN_EXPIRE_MINUTES))
     to_encode = {"sub": str(subject), "exp": expire.timestamp(), "type": "refresh"}
+    from jose import jwt
     return jwt.encode(to_encode, REFRESH_SECRET_KEY, algorithm=ALGORITHM)
 
 def decode_token(token: str, refresh: bool = False) -> Optional[dict]:
+    from jose import jwt, JWTError
     key = REFRESH_SECRET_KEY if refresh else SECRET_KEY
     try:
         payload = jwt.decode(token, key, algorithms=[ALGORITHM])
@@ -0,0 +1,63 @@
+# backend_python/cache_invalidation.py
+"""
+Subscribers that keep this worker's in-process caches coherent with writes
+made anywhere (see event_bus.py). With these in place cache TTLs are only a
+backstop, not the consistency mechanism.
+"""
+from backend_python.cache import TTLCache
+from backend_python.catalogue import course_changed, facet_cache
+from backend_python.course_content import outline_cache
+from backend_python.event_bus import ChangeEvent, ChangeFeed, EventBus, event_bus
+from backend_python.gradebook import gradebook_cache, grading_policy_cache, invalidate_gradebook
+from backend_python.search_index import course_search_index, remove_course
+from backend_python.user_settings import settings_cache
+
+# Course updates that touch only these fields change no cached read model
+COURSE_COUNTER_FIELDS = frozenset({"enrollment_count", "updated_at"})
+
+def on_course_event(event: ChangeEvent) -> None:
+    if event.is_invalidate_all:
+        outline_cache.clear()
+        facet_cache.clear()
+        grading_policy_cache.clear()
+        course_search_index.reset()
+        return
+    if event.changed_fields is not None and event.changed_fields <= COURSE_COUNTER_FIELDS:
+        return
+    outline_cache.invalidate(event.document_id)
+    grading_policy_cache.invalidate(event.document_id)
+    if event.operation == "delete" or event.document is None:
+        facet_cache.clear()
+        remove_course(event.document_id)
+    else:
+        course_changed(event.document)
+
+def _invalidate_per_user(cache: TTLCache):
+    def handler(event: ChangeEvent) -> None:
+        if event.is_invalidate_all:
+            cache.clear()
+        else:
+            cache.invalidate(event.document_id)
+    return handler
+
+def on_enrollment_event(event: ChangeEvent) -> None:
+    """A roster change adds or removes a gradebook row."""
+    course_id = (event.document or {}).get("course_id")
+    if course_id is None:
+        # Deletes carry no document, so the course is unknown
+        gradebook_cache.clear()
+    else:
+        invalidate_gradebook(course_id)
+
+def register_cache_invalidation(bus: EventBus) -> None:
+    bus.subscribe("courses", on_course_event)
+    # Settings live in SQL; saving them touches the user document so the
+    # change reaches every worker through the users stream.
+    bus.subscribe("users", _invalidate_per_user(settings_cache))
+    bus.subscribe("enrollments", on_enrollment_event)
+
+def start_change_feed(poll_interval: float = 5.0) -> ChangeFeed:
+    register_cache_invalidation(event_bus)
+    feed = ChangeFeed(event_bus, poll_interval=poll_interval)
+    feed.start()
+    return feed
\ No newline at end of file
@@ -0,0 +1,60 @@
+# backend_python/catalogue.py
+"""
+Catalogue-wide read models: facet counts for the filter sidebar, plus the
+``course_changed`` hook that course writes call to keep them (and the search
+index) current.
+"""
+from typing import Any, Dict, List, Optional
+
+from backend_python.cache import TTLCache
+from backend_python.mongodb_db import get_courses_collection
+from backend_python.search_index import index_course
+
+FACETS_KEY = "published"
+facet_cache = TTLCache(maxsize=1, ttl=300)
+
+def _count_by(field: str, unwind: bool = False) -> List[Dict[str, Any]]:
+    stages: List[Dict[str, Any]] = []
+    if unwind:
+        stages.append({"$unwind": f"${field}"})
+    stages += [
+        {"$group": {"_id": f"${field}", "count": {"$sum": 1}}},
+        {"$match": {"_id": {"$ne": None}}},
+        {"$sort": {"count": -1, "_id": 1}},
+    ]
+    return stages
+
+def facets_pipeline() -> List[Dict[str, Any]]:
+    return [
+        {"$match": {"is_published": True}},
+        {"$project": {"category": 1, "difficulty": 1, "tags": 1, "accessibility_features": 1}},
+        {"$facet": {
+            "category": _count_by("category"),
+            "difficulty": _count_by("difficulty"),
+            "accessibility_features": _count_by("accessibility_features", unwind=True),
+            "tags": _count_by("tags", unwind=True),
+            "total": [{"$count": "count"}],
+        }},
+    ]
+
+async def get_facets() -> Dict[str, Any]:
+    """All facet counts over published courses, from one aggregation."""
+    facets = facet_cache.get(FACETS_KEY)
+    if facets is not None:
+        return facets
+
+    rows = await get_courses_collection().aggregate(facets_pipeline()).to_list(1)
+    row = rows[0] if rows else {}
+    facets = {
+        name: [{"value": bucket["_id"], "count": bucket["count"]} for bucket in row.get(name, [])]
+        for name in ("category", "difficulty", "accessibility_features", "tags")
+    }
+    total = row.get("total") or [{"count": 0}]
+    facets["total"] = total[0]["count"]
+    facet_cache.set(FACETS_KEY, facets)
+    return facets
+
+def course_changed(course: Optional[Dict[str, Any]]) -> None:
+    """Call after any course write so catalogue read models stay current."""
+    facet_cache.clear()
+    index_course(course)
@@ -0,0 +1,72 @@
+"""
+Check that the course tree lists every resource once, at its own level.
+
+Resources attached to a lesson also carry the lesson's module_id (and often
+course_id), so a module or course level that only filters on its own key would
+list them a second time. Seeds one course, module and lesson in an in-memory
+SQLite database with a resource at each level and loads the full tree.
+
+Run: python -m backend_python.check_course_tree
+"""
+import sys
+import os
+from uuid import uuid4
+
+# Add parent directory to path for imports
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from backend_python.database import Base
+from backend_python.models import Course, Lesson, Module, Resource, User
+from backend_python import course_tree
+
+def main():
+    try:
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=engine)
+        user, course, module, lesson = (str(uuid4()) for _ in range(4))
+
+        with Session(engine) as db:
+            db.add_all([
+                User(id=user, email="mentor@example.com", name="Mentor", password_hash="x"),
+                Course(id=course, title="Course", instructor_id=user),
+                Module(id=module, course_id=course, title="Module", order_index=0),
+                Lesson(id=lesson, module_id=module, title="Lesson", lesson_type="text", order_index=0),
+                Resource(id=str(uuid4()), course_id=course, title="Syllabus"),
+                Resource(id=str(uuid4()), course_id=course, module_id=module, title="Module slides"),
+                # Lesson-level, with every parent key set as the resource forms do
+                Resource(id=str(uuid4()), course_id=course, module_id=module, lesson_id=lesson, title="Lesson worksheet"),
+            ])
+            db.commit()
+            tree = course_tree.load_course_tree(db, course, course_tree.MAX_DEPTH)
+
+        tree_module = tree["modules"][0]
+        levels = {
+            "course": [r["title"] for r in tree["resources"]],
+            "module": [r["title"] for r in tree_module["resources"]],
+            "lesson": [r["title"] for r in tree_module["lessons"][0]["resources"]],
+        }
+        expected = {"course": ["Syllabus"], "module": ["Module slides"], "lesson": ["Lesson worksheet"]}
+
+        failures = 0
+        for level, titles in levels.items():
+            if titles == expected[level]:
+                print(f"[OK] {level} resources: {titles}")
+            else:
+                failures += 1
+                print(f"[ERROR] {level} resources: {titles}, expected {expected[level]}")
+        if failures:
+            sys.exit(1)
+        print("\n[SUCCESS] Every resource appears once, at its own level")
+    except Exception as e:
+        print(f"[ERROR] Course tree check failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+Check that every SQL query the routers issue is served by an index.
+
+Creates the schema in an in-memory SQLite database with one row of each kind,
+then calls the same functions the routers call (handlers, repositories,
+gradebook, analytics, course tree) and records every statement they execute.
+Each recorded statement goes through EXPLAIN QUERY PLAN with the parameters it
+actually ran with, so ``IN`` lists from selectinload and batched loads are
+checked too. A plan fails on a full table scan or a temporary B-tree for ORDER
+BY unless its probe allows it. Add a probe whenever a router gains a query.
+
+Run: python -m backend_python.check_query_plans
+"""
+import asyncio
+import sys
+import os
+from datetime import datetime, timedelta
+from typing import Callable, List, NamedTuple, Tuple
+from uuid import uuid4
+
+# Add parent directory to path for imports
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+from starlette.responses import Response
+
+from backend_python.database import Base
+from backend_python.models import (
+    Announcement, Assignment, Course, Discussion, Lesson, MentorshipGroup, Module, Question, Quiz, Resource, Submission, User
+)
+from backend_python import course_tree, gradebook, quiz_analytics, user_settings
+from backend_python.repositories.sql import SqlProgressRepository, SqlQuizRepository
+from backend_python.routers import announcements, assignments, dashboard, discussions, mentorship, modules, pages, resources, users
+from backend_python.schemas import AssignmentGradeIn, DiscussionCreate
+
+# CTE names a plan may scan: they are built from indexed lookups
+CTE_NAMES = ("ancestors",)
+
+class Probe(NamedTuple):
+    label: str
+    run: Callable[[Session], object]
+    # Plan steps accepted for this probe, e.g. a scan of an intentionally unfiltered list
+    allow: Tuple[str, ...] = ()
+
+class Fixture(NamedTuple):
+    user: str
+    course: str
+    module: str
+    lesson: str
+    quiz: str
+    assignment: str
+    group: str
+    thread: str
+
+def seed(db: Session) -> Fixture:
+    """One row of each kind, so relationship loads and IN queries are issued."""
+    ids = Fixture(*(str(uuid4()) for _ in Fixture._fields))
+    now = datetime.utcnow()
+    db.add_all([
+        User(id=ids.user, email="learner@example.com", name="Learner", password_hash="x"),
+        Course(id=ids.course, title="Course", instructor_id=ids.user),
+        Module(id=ids.module, course_id=ids.course, title="Module", order_index=0),
+        Lesson(id=ids.lesson, module_id=ids.module, title="Lesson", lesson_type="text", order_index=0),
+        Resource(id=str(uuid4()), course_id=ids.course, module_id=ids.module, lesson_id=ids.lesson, title="Resource"),
+        Quiz(id=ids.quiz, course_id=ids.course, title="Quiz"),
+        Question(id=str(uuid4()), quiz_id=ids.quiz, question_text="2 + 2?", options=["3", "4"], correct_answer="4"),
+        Submission(id=str(uuid4()), quiz_id=ids.quiz, user_id=ids.user, answers={}, score=0, submitted_at=now),
+        Assignment(id=ids.assignment, course_id=ids.course, title="Assignment", points=10, due_date=now + timedelta(days=7)),
+        Announcement(id=str(uuid4()), course_id=ids.course, author_id=ids.user, title="Welcome", content="Hi"),
+        Discussion(id=ids.thread, course_id=ids.course, user_id=ids.user, title="Thread", content="Hi", reply_count=0),
+        MentorshipGroup(id=ids.group, title="Group"),
+    ])
+    db.commit()
+    return ids
+
+def probes(ids: Fixture, session_factory: Callable[[], Session]) -> List[Probe]:
+    """Each probe calls the code a router runs for one endpoint or write."""
+    user = {"_id": ids.user, "name": "Learner", "role": "mentor"}
+    progress_repo = SqlProgressRepository(session_factory)
+    quiz_repo = SqlQuizRepository(session_factory)
+    week_ago = datetime.utcnow() - timedelta(days=7)
+
+    def thread_page(db):
+        first = discussions.get_course_discussions(ids.course, Response(), None, 1, db)
+        reply = discussions.create_discussion(
+            DiscussionCreate(course_id=ids.course, parent_id=ids.thread, title="Re", description="Reply"), db, user
+        )
+        cursor = discussions.encode_cursor(first[0], discussions.THREAD_SORT_KEY)
+        discussions.get_course_discussions(ids.course, Response(), cursor, 20, db)
+        return discussions.get_discussion_replies(reply.parent_id, Response(), discussions.encode_cursor(reply), 50, db)
+
+    return [
+        Probe("users: by email", lambda db: users.find_user_by_email(db, "learner@example.com")),
+        Probe("progress: list for user", lambda db: asyncio.run(progress_repo.list_for_user(ids.user))),
+        Probe("progress: upsert", lambda db: asyncio.run(progress_repo.upsert(ids.user, ids.course, {"percent": 10}))),
+        Probe("quizzes: quiz and questions", lambda db: (
+            asyncio.run(quiz_repo.get_quiz(ids.quiz)), asyncio.run(quiz_repo.list_questions(ids.quiz))
+        )),
+        Probe("quizzes: submit (gradebook cell)", lambda db: asyncio.run(quiz_repo.add_submission(ids.quiz, ids.user, {}, 50))),
+        # Keyset scan over (quiz_id, submitted_at); the second refresh reads from the watermark
+        Probe("quizzes: analytics refresh", lambda db: (
+            quiz_analytics.refresh_quiz_analytics(db, ids.quiz, full=True), quiz_analytics.refresh_quiz_analytics(db, ids.quiz)
+        )),
+        Probe("modules: by course", lambda db: modules.get_course_modules(ids.course, db)),
+        Probe("lessons: by module", lambda db: modules.get_module_lessons(ids.module, db)),
+        # selectinload: modules, then one IN query per level. Each level is
+        # sorted in memory over rows of this one course.
+        Probe("modules: course tree", lambda db: course_tree.load_course_tree(db, ids.course, course_tree.MAX_DEPTH),
+              allow=("USE TEMP B-TREE FOR ORDER BY",)),
+        Probe("resources: by course", lambda db: resources.get_course_resources(ids.course, db)),
+        Probe("resources: by module", lambda db: resources.get_module_resources(ids.module, db)),
+        Probe("resources: by lesson", lambda db: resources.get_lesson_resources(ids.lesson, db)),
+        Probe("assignments: by course", lambda db: assignments.get_course_assignments(ids.course, db)),
+        Probe("assignments: grade", lambda db: assignments.grade_assignment(
+            ids.assignment, ids.user, AssignmentGradeIn(score=8), db, user
+        )),
+        Probe("announcements: latest", lambda db: announcements.course_announcements(db, ids.course, None, 50)),
+        Probe("announcements: since", lambda db: announcements.course_announcements(db, ids.course, week_ago, 50)),
+        Probe("discussions: threads, reply and replies", thread_page),
+        Probe("pages: by course", lambda db: pages.get_course_pages(ids.course, db)),
+        Probe("mentorship: list groups", lambda db: mentorship.list_groups(db), allow=("SCAN mentorship_groups",)),
+        Probe("mentorship: join", lambda db: mentorship.join_group(ids.group, db, user)),
+        Probe("dashboard: announcements", lambda db: dashboard._recent_announcements(db, [ids.course])),
+        # Sorted over the learner's enrolled courses' future assignments, at most ASSIGNMENT_LIMIT kept
+        Probe("dashboard: upcoming assignments", lambda db: dashboard._upcoming_assignments(db, [ids.course], datetime.utcnow()),
+              allow=("USE TEMP B-TREE FOR ORDER BY",)),
+        # The roster of student IDs comes from Mongo enrollments
+        Probe("gradebook: matrix", lambda db: gradebook.build_gradebook(db, ids.course, gradebook.DEFAULT_WEIGHTS, [ids.user])),
+        Probe("gradebook: csv page", lambda db: gradebook.page_entries(db, ids.course, [ids.user])),
+        Probe("accessibility: load and save", lambda db: (
+            user_settings.save_accessibility_settings(db, ids.user, {"captions": True}),
+            user_settings.settings_cache.clear(),
+            user_settings.load_accessibility_settings(db, ids.user),
+        )),
+    ]
+
+class StatementRecorder:
+    """Collects the (SQL, parameters) of every read or update the engine executes."""
+
+    def __init__(self, engine):
+        self.statements: List[Tuple[str, tuple]] = []
+        event.listen(engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        verb = statement.lstrip().split(None, 1)[0].upper()
+        if not executemany and verb in ("SELECT", "WITH", "UPDATE", "DELETE"):
+            self.statements.append((statement, tuple(parameters or ())))
+
+    def take(self) -> List[Tuple[str, tuple]]:
+        statements, self.statements = list(dict.fromkeys(self.statements)), []
+        return statements
+
+def query_plan(engine, statement: str, parameters: tuple) -> list:
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    return [row[-1] for row in rows]
+
+def unindexed_steps(plan: list, allow: Tuple[str, ...] = ()) -> list:
+    bad = []
+    for step in plan:
+        if not (step.startswith("SCAN ") or "TEMP B-TREE" in step):
+            continue
+        if step.split()[1] in CTE_NAMES or any(step.startswith(allowed) for allowed in allow):
+            continue
+        bad.append(step)
+    return bad
+
+def main():
+    try:
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=engine)
+
+        def session_factory():
+            return Session(engine)
+
+        with session_factory() as db:
+            ids = seed(db)
+        recorder = StatementRecorder(engine)
+        failures = checked = 0
+        for probe in probes(ids, session_factory):
+            with session_factory() as db:
+                probe.run(db)
+            statements = recorder.take()
+            if not statements:
+                failures += 1
+                print(f"[ERROR] {probe.label}: issued no queries")
+                continue
+            for statement, parameters in statements:
+                checked += 1
+                plan = query_plan(engine, statement, parameters)
+                bad = unindexed_steps(plan, probe.allow)
+                if bad:
+                    failures += 1
+                    print(f"[ERROR] {probe.label}: {'; '.join(bad)}\n        {' '.join(statement.split())[:160]}")
+                else:
+                    print(f"[OK] {probe.label}: {'; '.join(plan)}")
+        if failures:
+            print(f"\n[ERROR] {failures} of {checked} queries are not fully served by an index")
+            sys.exit(1)
+        print(f"\n[SUCCESS] All {checked} router queries use an index")
+    except Exception as e:
+        print(f"[ERROR] Query plan check failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
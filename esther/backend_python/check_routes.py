@@ -0,0 +1,85 @@
+"""
+Check that every course-scoped path reaches the router that owns it.
+
+The courses router is mounted at /api/courses ahead of the /api-prefixed
+routers (modules, discussions, gradebook, ...), so a catch-all such as
+``/{course_id}/{section}`` there would shadow their /api/courses/{id}/...
+paths. This lists every default router's routes in registry (mount) order and
+resolves each sample path the way Starlette does: the first route whose
+compiled path and method match wins.
+
+Run: python -m backend_python.check_routes
+"""
+import importlib
+import sys
+import os
+from typing import List, Optional, Tuple
+
+# Add parent directory to path for imports
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+from starlette.routing import compile_path
+
+from backend_python.router_registry import ROUTERS, enabled_router_names
+
+COURSE = "3f2b8c1e-7a4d-4e0f-9b6a-2c5d8e1f0a37"
+
+# (method, path, expected handler as "module.function")
+EXPECTED: List[Tuple[str, str, str]] = [
+    ("GET", f"/api/courses/{COURSE}", "courses.get_course"),
+    ("GET", f"/api/courses/{COURSE}/outline", "courses.get_course_outline"),
+    ("GET", f"/api/courses/{COURSE}/lessons/intro", "courses.get_course_lesson"),
+    ("GET", f"/api/courses/{COURSE}/sections/pages", "courses.get_course_section"),
+    ("GET", f"/api/courses/{COURSE}/modules", "modules.get_course_modules"),
+    ("GET", f"/api/courses/{COURSE}/tree", "modules.get_course_tree"),
+    ("GET", f"/api/courses/{COURSE}/discussions", "discussions.get_course_discussions"),
+    ("GET", f"/api/courses/{COURSE}/gradebook", "gradebook.get_gradebook"),
+    ("GET", f"/api/courses/{COURSE}/gradebook.csv", "gradebook.export_gradebook_csv"),
+    ("GET", f"/api/courses/{COURSE}/announcements", "announcements.get_course_announcements"),
+    ("GET", f"/api/courses/{COURSE}/announcements/stream", "announcements.stream_course_announcements"),
+    ("GET", f"/api/courses/{COURSE}/assignments", "assignments.get_course_assignments"),
+    ("GET", f"/api/courses/{COURSE}/resources", "resources.get_course_resources"),
+    ("GET", f"/api/courses/{COURSE}/pages", "pages.get_course_pages"),
+]
+
+def mounted_routes() -> List[Tuple[str, set, str]]:
+    """(full path, methods, "module.function") for every route, in mount order."""
+    routes = []
+    for name in enabled_router_names("all"):
+        module = importlib.import_module(f"backend_python.routers.{name}")
+        for route in module.router.routes:
+            routes.append((ROUTERS[name].prefix + route.path, route.methods, f"{name}.{route.endpoint.__name__}"))
+    return routes
+
+def resolve(routes: List[Tuple[str, set, str]], method: str, path: str) -> Optional[str]:
+    for route_path, methods, handler in routes:
+        # Path parameters are plain strings here, as in Starlette: an Enum or
+        # UUID annotation is only checked after the route has already won
+        if method in methods and compile_path(route_path)[0].match(path):
+            return handler
+    return None
+
+def main():
+    try:
+        routes = mounted_routes()
+        failures = 0
+        for method, path, expected in EXPECTED:
+            handler = resolve(routes, method, path)
+            if handler == expected:
+                print(f"[OK] {method} {path} -> {handler}")
+            else:
+                failures += 1
+                print(f"[ERROR] {method} {path} -> {handler}, expected {expected}")
+        if failures:
+            print(f"\n[ERROR] {failures} of {len(EXPECTED)} paths reach the wrong handler")
+            sys.exit(1)
+        print(f"\n[SUCCESS] All {len(EXPECTED)} course paths reach their router")
+    except Exception as e:
+        print(f"[ERROR] Route check failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+# backend_python/course_content.py
+"""
+Normalized storage for heavy course content.
+
+Course documents keep only an outline: module metadata plus, per lesson, the
+fields in LESSON_OUTLINE_FIELDS. Modules list lessons under ``lessons``
+(seeded) or ``content`` (created through the API); both are split the same way. Lesson bodies live in the ``lessons``
+collection and the other heavy sub-resources (pages, announcements, ...) in one
+``course_<section>`` collection each, all keyed by ``(course_id, id)`` and
+fetched on demand.
+"""
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from backend_python.cache import TTLCache
+from backend_python.mongodb_db import (
+    ASCENDING,
+    INSERT_ONLY_FIELDS,
+    bulk_upsert,
+    empty_write_counts,
+    get_course_outlines_collection,
+    get_course_section_collection,
+    get_courses_collection,
+    get_lessons_collection,
+    merge_write_counts,
+)
+
+class CourseSection(str, Enum):
+    pages = "pages"
+    announcements = "announcements"
+    resources = "resources"
+    badges = "badges"
+    assignments = "assignments"
+    quizzes = "quizzes"
+
+# Lesson fields kept inline in the course outline; everything else is the body
+LESSON_OUTLINE_FIELDS = ("id", "title", "type", "duration", "order")
+# Module keys that hold a list of lessons
+MODULE_LESSON_KEYS = ("lessons", "content")
+# Lesson body fields found in seeded courses, used to project them away from
+# documents that have not been migrated yet
+LESSON_BODY_FIELDS = (
+    "content", "video_url", "slides", "external_resources", "practice_activity",
+    "code_example", "example", "resources", "downloadables",
+)
+
+# Projection for course reads: drops embedded sub-resources and lesson bodies
+COURSE_OUTLINE_PROJECTION = {
+    **{section.value: 0 for section in CourseSection},
+    **{f"modules.{key}.{field}": 0 for key in MODULE_LESSON_KEYS for field in LESSON_BODY_FIELDS},
+}
+
+def content_key(course_id: str, item_id: Any) -> str:
+    """``_id`` for a split-out item. Seeded item IDs are only unique per course."""
+    return f"{course_id}:{item_id}"
+
+def lesson_outline(lesson: Dict[str, Any]) -> Dict[str, Any]:
+    return {field: lesson[field] for field in LESSON_OUTLINE_FIELDS if field in lesson}
+
+def split_course(course: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, List[Dict[str, Any]]]]:
+    """Split a fully embedded course into its outline and the documents to
+    store per collection (``"lessons"`` plus one entry per CourseSection)."""
+    course_id = course.get("id") or course["_id"]
+    outline = {key: value for key, value in course.items() if key not in CourseSection.__members__}
+    items: Dict[str, List[Dict[str, Any]]] = {"lessons": []}
+
+    modules = []
+    for module in course.get("modules") or []:
+        module = dict(module)
+        for key in MODULE_LESSON_KEYS:
+            if key not in module:
+                continue
+            lessons = [
+                {**lesson, "id": lesson.get("id") or f"{module.get('id')}-{position}"}
+                for position, lesson in enumerate(module[key] or [])
+            ]
+            for position, lesson in enumerate(lessons):
+                items["lessons"].append({
+                    **lesson,
+                    "_id": content_key(course_id, lesson["id"]),
+                    "course_id": course_id,
+                    "module_id": module.get("id"),
+                    "position": position,
+                })
+            module[key] = [lesson_outline(lesson) for lesson in lessons]
+        modules.append(module)
+    if "modules" in course:
+        outline["modules"] = modules
+
+    for section in CourseSection:
+        items[section.value] = [
+            {
+                **item,
+                "_id": content_key(course_id, item.get("id", position)),
+                "course_id": course_id,
+                "position": position,
+            }
+            for position, item in enumerate(course.get(section.value) or [])
+        ]
+    return outline, items
+
+def _content_collection(name: str):
+    return get_lessons_collection() if name == "lessons" else get_course_section_collection(name)
+
+async def store_course_items(
+    items: Dict[str, List[Dict[str, Any]]], insert_only: Iterable[str] = INSERT_ONLY_FIELDS
+) -> Dict[str, int]:
+    """Upsert the split-out documents produced by ``split_course``."""
+    counts = empty_write_counts()
+    for name, docs in items.items():
+        if docs:
+            merge_write_counts(counts, await bulk_upsert(_content_collection(name), docs, insert_only=insert_only))
+    return counts
+
+async def store_module_lessons(course_id: str, module: Dict[str, Any]) -> Dict[str, Any]:
+    """Split one module written through the API: store its lesson bodies, drop
+    stored lessons it no longer lists, and return the module's outline."""
+    outline, items = split_course({"_id": course_id, "modules": [module]})
+    await store_course_items(items)
+    await get_lessons_collection().delete_many({
+        "course_id": course_id,
+        "module_id": module.get("id"),
+        "_id": {"$nin": [lesson["_id"] for lesson in items["lessons"]]},
+    })
+    return outline["modules"][0]
+
+async def delete_module_lessons(course_id: str, module_id: str) -> None:
+    await get_lessons_collection().delete_many({"course_id": course_id, "module_id": module_id})
+
+async def ensure_content_indexes() -> None:
+    lessons = get_lessons_collection()
+    await lessons.create_index([("course_id", ASCENDING), ("id", ASCENDING)])
+    await lessons.create_index([("course_id", ASCENDING), ("module_id", ASCENDING), ("position", ASCENDING)])
+    for section in CourseSection:
+        await get_course_section_collection(section.value).create_index(
+            [("course_id", ASCENDING), ("position", ASCENDING)]
+        )
+
+async def get_lesson(course_id: str, lesson_id: str) -> Optional[Dict[str, Any]]:
+    return await get_lessons_collection().find_one({"_id": content_key(course_id, lesson_id)})
+
+async def list_section(course_id: str, section: CourseSection, limit: int = 1000) -> List[Dict[str, Any]]:
+    cursor = get_course_section_collection(section.value).find({"course_id": course_id}).sort("position", ASCENDING)
+    return await cursor.to_list(limit)
+
+# ==================== Table of contents ====================
+# Precomputed per course and rebuilt only when modules change. Rows are
+# compact arrays so the landing page payload stays small:
+#   modules: [module_id, title, minutes]
+#   lessons: [module_id, lesson_id, title, type, minutes]
+outline_cache = TTLCache(maxsize=2048, ttl=600)
+
+def _module_lessons(module: Dict[str, Any]) -> List[Dict[str, Any]]:
+    # Seeded modules carry "lessons"; modules created through the API carry "content"
+    return module.get("lessons") or module.get("content") or []
+
+def build_outline(course: Dict[str, Any]) -> Dict[str, Any]:
+    course_id = course.get("id") or course["_id"]
+    modules = sorted(course.get("modules") or [], key=lambda m: m.get("order", 0))
+    module_rows, lesson_rows = [], []
+    for module in modules:
+        lessons = _module_lessons(module)
+        lesson_minutes = 0
+        for position, lesson in enumerate(lessons):
+            minutes = lesson.get("duration") or lesson.get("estimated_time") or 0
+            lesson_minutes += minutes
+            lesson_rows.append([
+                module.get("id"),
+                lesson.get("id") or f"{module.get('id')}-{position}",
+                lesson.get("title", ""),
+                lesson.get("type", "text"),
+                minutes,
+            ])
+        module_rows.append([module.get("id"), module.get("title", ""), module.get("estimated_time") or lesson_minutes])
+    return {
+        "_id": course_id,
+        "course_id": course_id,
+        "title": course.get("title", ""),
+        "modules": module_rows,
+        "lessons": lesson_rows,
+        "total_minutes": sum(row[2] for row in module_rows),
+        "updated_at": datetime.utcnow(),
+    }
+
+async def rebuild_outline(course: Dict[str, Any]) -> Dict[str, Any]:
+    """Recompute and store a course's outline. Call after any module write."""
+    outline = build_outline(course)
+    await get_course_outlines_collection().replace_one({"_id": outline["_id"]}, outline, upsert=True)
+    outline_cache.set(outline["_id"], outline)
+    return outline
+
+async def get_outline(course_id: str) -> Optional[Dict[str, Any]]:
+    """Outline from cache, then the outlines collection, then built from the course."""
+    outline = outline_cache.get(course_id)
+    if outline is not None:
+        return outline
+    outline = await get_course_outlines_collection().find_one({"_id": course_id})
+    if outline is None:
+        course = await get_courses_collection().find_one(
+            {"$or": [{"_id": course_id}, {"id": course_id}]}, COURSE_OUTLINE_PROJECTION
+        )
+        if not course:
+            return None
+        outline = await rebuild_outline(course)
+    outline_cache.set(course_id, outline)
+    return outline
@@ -0,0 +1,88 @@
+# backend_python/course_tree.py
+"""
+Full SQL course content tree (modules -> lessons -> resources) in a fixed
+number of queries.
+
+``selectinload`` fetches each level with one ``IN`` query, so a course costs
+at most five queries however many modules and lessons it has. Trees are cached
+per (course, depth); content writes call ``invalidate_course_tree``.
+"""
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import Session, selectinload
+
+from backend_python.cache import TTLCache
+from backend_python.models import Lesson, Module, Resource
+from backend_python.schemas import CourseTreeResponse, LessonTree, ModuleTree, ResourceResponse
+
+MAX_DEPTH = 3  # 1: modules, 2: + lessons, 3: + resources at every level
+course_tree_cache = TTLCache(maxsize=512, ttl=600)
+
+def _resources(resources: List[Resource]) -> List[ResourceResponse]:
+    return [ResourceResponse.model_validate(r) for r in resources]
+
+def _lesson(lesson: Lesson, depth: int) -> LessonTree:
+    return LessonTree(
+        id=lesson.id,
+        module_id=lesson.module_id,
+        title=lesson.title,
+        content=lesson.content,
+        order_index=lesson.order_index,
+        created_at=lesson.created_at,
+        resources=_resources(lesson.resources) if depth >= 3 else None,
+    )
+
+def _module(module: Module, depth: int) -> ModuleTree:
+    return ModuleTree(
+        id=module.id,
+        course_id=module.course_id,
+        title=module.title,
+        description=module.description,
+        order_index=module.order_index,
+        created_at=module.created_at,
+        lessons=[_lesson(lesson, depth) for lesson in module.lessons] if depth >= 2 else None,
+        resources=_resources(module.resources) if depth >= 3 else None,
+    )
+
+def load_course_tree(db: Session, course_id: str, depth: int = MAX_DEPTH) -> Dict[str, Any]:
+    """The tree as a JSON-ready dict (camelCase keys), cached per (course, depth)."""
+    key = (course_id, depth)
+    tree = course_tree_cache.get(key)
+    if tree is not None:
+        return tree
+
+    # Only the levels we will serialize are loaded; nothing lazy-loads later
+    options = []
+    if depth >= 2:
+        lessons = selectinload(Module.lessons)
+        options.append(lessons.selectinload(Lesson.resources) if depth >= 3 else lessons)
+    if depth >= 3:
+        options.append(selectinload(Module.resources))
+    modules = (
+        db.query(Module)
+        .filter(Module.course_id == course_id)
+        .options(*options)
+        .order_by(Module.order_index)
+        .all()
+    )
+    course_resources: Optional[List[Resource]] = None
+    if depth >= 3:
+        course_resources = (
+            db.query(Resource)
+            .filter(Resource.course_id == course_id, Resource.module_id.is_(None), Resource.lesson_id.is_(None))
+            .order_by(Resource.created_at)
+            .all()
+        )
+
+    tree = CourseTreeResponse(
+        course_id=course_id,
+        depth=depth,
+        modules=[_module(module, depth) for module in modules],
+        resources=_resources(course_resources) if course_resources is not None else None,
+    ).model_dump(mode="json", by_alias=True)
+    course_tree_cache.set(key, tree)
+    return tree
+
+def invalidate_course_tree(course_id: str) -> None:
+    for depth in range(1, MAX_DEPTH + 1):
+        course_tree_cache.invalidate((str(course_id), depth))
\ No newline at end of file
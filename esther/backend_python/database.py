@@ -1,37 +1,53 @@
-# database.py
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.exc import OperationalError
-from motor.motor_asyncio import AsyncIOMotorClient
 from backend_python.settings_configuration import settings
 
-# ------------------ MongoDB ------------------
-# Use the MongoDB URL from settings
-mongo_client = AsyncIOMotorClient(settings.MONGODB_URL)
-mongo_db = mongo_client[settings.MONGODB_DATABASE_NAME]
+# Clients are built on first use rather than at import, so cold starts (and
+# routers that never touch SQL) don't pay for the Postgres connection test.
+# ``engine``, ``DATABASE_URL``, ``mongo_client`` and ``mongo_db`` remain
+# importable as module attributes (see __getattr__ below).
 
 # ------------------ PostgreSQL / SQLAlchemy ------------------
-if settings.DISABLE_SQL:
-    # Use local sqlite fallback for development/testing when Postgres isn't available.
-    DATABASE_URL = f"sqlite:///{settings.SQLITE_DB_FILE}"
-    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-else:
-    # Build DATABASE_URL for Postgres
-    DATABASE_URL = f"postgresql+psycopg2://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}"
-    engine = create_engine(DATABASE_URL, connect_args={})
-
-    # Attempt a quick connection test; if it fails, fallback to sqlite
-    try:
-        with engine.connect() as conn:
-            pass
-    except OperationalError as e:
-        print(f"⚠️  Warning: Postgres not available or auth failed: {e}. Falling back to sqlite file '{settings.SQLITE_DB_FILE}' for dev.")
-        DATABASE_URL = f"sqlite:///{settings.SQLITE_DB_FILE}"
-        engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+_engine = None
+_database_url = None
+
+def _sqlite_url() -> str:
+    return f"sqlite:///{settings.SQLITE_DB_FILE}"
+
+def get_engine():
+    global _engine, _database_url
+    if _engine is not None:
+        return _engine
+
+    if settings.DISABLE_SQL:
+        # Use local sqlite fallback for development/testing when Postgres isn't available.
+        _database_url = _sqlite_url()
+        _engine = create_engine(_database_url, connect_args={"check_same_thread": False})
+    else:
+        # Build DATABASE_URL for Postgres
+        _database_url = f"postgresql+psycopg2://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}"
+        _engine = create_engine(_database_url, connect_args={})
+
+        # Attempt a quick connection test; if it fails, fallback to sqlite
+        try:
+            with _engine.connect():
+                pass
+        except OperationalError as e:
+            print(f"⚠️  Warning: Postgres not available or auth failed: {e}. Falling back to sqlite file '{settings.SQLITE_DB_FILE}' for dev.")
+            _database_url = _sqlite_url()
+            _engine = create_engine(_database_url, connect_args={"check_same_thread": False})
+
+    _SessionFactory.configure(bind=_engine)
+    return _engine
+
+_SessionFactory = sessionmaker(autocommit=False, autoflush=False)
 Base = declarative_base()
 
+def SessionLocal():
+    get_engine()
+    return _SessionFactory()
+
 # Dependency for FastAPI routes
 def get_db():
     db = SessionLocal()
@@ -39,3 +55,15 @@ def get_db():
         yield db
     finally:
         db.close()
+
+def __getattr__(name):
+    if name == "engine":
+        return get_engine()
+    if name == "DATABASE_URL":
+        get_engine()
+        return _database_url
+    # ------------------ MongoDB ------------------
+    if name in ("mongo_client", "mongo_db"):
+        from backend_python import mongodb_db
+        return mongodb_db.get_client() if name == "mongo_client" else mongodb_db.get_mongo_db()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
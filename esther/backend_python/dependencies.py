@@ -6,7 +6,9 @@ from .auth_utils import get_current_user
 
 def require_role(allowed_roles: List[str]):
     async def role_dependency(current_user: UserDocument = Depends(get_current_user)):
-        role_value = getattr(current_user.role, "value", str(current_user.role))
+        # get_current_user returns the raw Mongo document
+        role = current_user.get("role") if isinstance(current_user, dict) else current_user.role
+        role_value = getattr(role, "value", str(role))
         if role_value not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -0,0 +1,164 @@
+# backend_python/enrollment_store.py
+"""
+Enrollment write path.
+
+Enrolling is a single conditional upsert keyed on the unique
+``(user_id, course_id)`` index, so "already enrolled" needs no prior read and
+concurrent requests cannot create duplicates. Each course carries a
+denormalized ``enrollment_count`` that enroll/unenroll maintain with ``$inc``,
+which lets the catalogue sort by popularity from an index. ``bulk_enroll``
+applies the same upsert to whole cohorts in unordered batches.
+"""
+from collections import Counter
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+from uuid import uuid4
+
+from backend_python.mongodb_db import (
+    ASCENDING,
+    BULK_BATCH_SIZE,
+    DESCENDING,
+    get_courses_collection,
+    get_enrollments_collection,
+    get_users_collection,
+)
+
+class CourseNotFound(Exception):
+    pass
+
+def new_enrollment_doc(user_id: str, course_id: str) -> Dict[str, Any]:
+    return {
+        "_id": str(uuid4()),
+        "user_id": user_id,
+        "course_id": course_id,
+        "enrolled_at": datetime.utcnow(),
+        "progress": 0.0,
+    }
+
+async def ensure_enrollment_indexes() -> None:
+    await get_enrollments_collection().create_index(
+        [("user_id", ASCENDING), ("course_id", ASCENDING)], unique=True
+    )
+    # Course rosters (gradebook) page by user_id within a course
+    await get_enrollments_collection().create_index([("course_id", ASCENDING), ("user_id", ASCENDING)])
+    await get_courses_collection().create_index(
+        [("enrollment_count", DESCENDING), ("_id", ASCENDING)]
+    )
+
+async def enroll(user_id: str, course_id: str) -> Tuple[Dict[str, Any], bool]:
+    """Returns (enrollment, created). ``created`` is False if the user was already enrolled."""
+    from pymongo.errors import DuplicateKeyError
+
+    doc = new_enrollment_doc(user_id, course_id)
+    try:
+        result = await get_enrollments_collection().update_one(
+            {"user_id": user_id, "course_id": course_id},
+            {"$setOnInsert": doc},
+            upsert=True,
+        )
+    except DuplicateKeyError:
+        # A concurrent request won the upsert race
+        return await get_enrollments_collection().find_one({"user_id": user_id, "course_id": course_id}), False
+    if result.upserted_id is None:
+        return await get_enrollments_collection().find_one({"user_id": user_id, "course_id": course_id}), False
+
+    # The counter update doubles as the course existence check
+    counted = await get_courses_collection().update_one({"_id": course_id}, {"$inc": {"enrollment_count": 1}})
+    if counted.matched_count == 0:
+        await get_enrollments_collection().delete_one({"_id": doc["_id"]})
+        raise CourseNotFound(course_id)
+    return doc, True
+
+async def unenroll(user_id: str, course_id: str) -> Optional[Dict[str, Any]]:
+    """Removes the enrollment and decrements the course counter; None if not enrolled."""
+    removed = await get_enrollments_collection().find_one_and_delete({"user_id": user_id, "course_id": course_id})
+    if removed is not None:
+        await get_courses_collection().update_one(
+            {"_id": course_id, "enrollment_count": {"$gt": 0}}, {"$inc": {"enrollment_count": -1}}
+        )
+    return removed
+
+async def recount_enrollments() -> int:
+    """Recompute every course's enrollment_count from the enrollments collection."""
+    from pymongo import UpdateOne
+
+    counts = {
+        row["_id"]: row["count"]
+        async for row in get_enrollments_collection().aggregate(
+            [{"$group": {"_id": "$course_id", "count": {"$sum": 1}}}]
+        )
+    }
+    updates = []
+    async for course in get_courses_collection().find({}, {"enrollment_count": 1}):
+        count = counts.get(course["_id"], 0)
+        if course.get("enrollment_count") != count:
+            updates.append(UpdateOne({"_id": course["_id"]}, {"$set": {"enrollment_count": count}}))
+    if updates:
+        await get_courses_collection().bulk_write(updates, ordered=False)
+    return len(updates)
+
+# ==================== Bulk enrollment ====================
+DUPLICATE_KEY = 11000
+
+async def resolve_users(user_ids: Iterable[str], emails: Iterable[str]) -> Tuple[List[str], List[str]]:
+    """Map user ids and emails to user ids with one query; returns (ids, unknown identifiers)."""
+    user_ids, emails = list(dict.fromkeys(user_ids)), list(dict.fromkeys(e.lower().strip() for e in emails))
+    found_ids, found_emails = set(), {}
+    cursor = get_users_collection().find(
+        {"$or": [{"_id": {"$in": user_ids}}, {"email": {"$in": emails}}]}, {"_id": 1, "email": 1}
+    )
+    async for user in cursor:
+        found_ids.add(str(user["_id"]))
+        if user.get("email"):
+            found_emails[user["email"].lower()] = str(user["_id"])
+    resolved = [uid for uid in user_ids if uid in found_ids] + [found_emails[e] for e in emails if e in found_emails]
+    unknown = [uid for uid in user_ids if uid not in found_ids] + [e for e in emails if e not in found_emails]
+    return list(dict.fromkeys(resolved)), unknown
+
+async def bulk_enroll(
+    user_ids: List[str], course_ids: List[str], batch_size: int = BULK_BATCH_SIZE
+) -> AsyncIterator[Dict[str, int]]:
+    """
+    Enroll every user in every course with one unordered upsert bulk_write per
+    batch. Yields running counts (processed/total/created/existing/failed) after
+    each batch so callers can stream progress.
+    """
+    from pymongo import UpdateOne
+    from pymongo.errors import BulkWriteError
+
+    pairs = [(user_id, course_id) for course_id in course_ids for user_id in user_ids]
+    counts = {"processed": 0, "total": len(pairs), "created": 0, "existing": 0, "failed": 0}
+    for start in range(0, len(pairs), batch_size):
+        batch = pairs[start:start + batch_size]
+        ops = [
+            UpdateOne(
+                {"user_id": user_id, "course_id": course_id},
+                {"$setOnInsert": new_enrollment_doc(user_id, course_id)},
+                upsert=True,
+            )
+            for user_id, course_id in batch
+        ]
+        try:
+            result = await get_enrollments_collection().bulk_write(ops, ordered=False)
+            upserted = result.upserted_ids.keys()
+            failed = 0
+        except BulkWriteError as e:
+            # Unordered writes keep going past individual failures; a duplicate
+            # key means a concurrent request enrolled the pair first
+            details = e.details
+            upserted = [u["index"] for u in details.get("upserted", [])]
+            errors = details.get("writeErrors", [])
+            failed = sum(1 for err in errors if err.get("code") != DUPLICATE_KEY)
+
+        created_per_course = Counter(batch[index][1] for index in upserted)
+        if created_per_course:
+            await get_courses_collection().bulk_write(
+                [UpdateOne({"_id": cid}, {"$inc": {"enrollment_count": n}}) for cid, n in created_per_course.items()],
+                ordered=False,
+            )
+
+        counts["processed"] += len(batch)
+        counts["created"] += len(upserted)
+        counts["failed"] += failed
+        counts["existing"] += len(batch) - len(upserted) - failed
+        yield dict(counts)
@@ -0,0 +1,165 @@
+# backend_python/event_bus.py
+"""
+In-process event bus fed by MongoDB change streams.
+
+Every worker runs its own ``ChangeFeed``, so a write made by any worker or node
+reaches the subscribers (cache invalidation, search index) in all of them.
+Change streams need a replica set; against a standalone ``mongod`` the feed
+falls back to polling each collection's timestamp field.
+
+Events whose ``document_id`` is None mean "anything derived from this
+collection may be stale" (a drop, a lost resume token, or deletes detected by
+polling); subscribers should clear rather than patch.
+"""
+import asyncio
+import inspect
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Union
+
+from backend_python.mongodb_db import get_mongo_db
+
+logger = logging.getLogger(__name__)
+
+# Collection -> timestamp field used by the polling fallback
+WATCHED_COLLECTIONS: Dict[str, str] = {
+    "courses": "updated_at",
+    "users": "updated_at",
+    "enrollments": "enrolled_at",
+}
+
+CHANGE_STREAMS_UNSUPPORTED = 40573  # "only supported on replica sets"
+RESUME_TOKEN_LOST = (260, 280, 286)  # InvalidResumeToken, ChangeStreamFatalError, ChangeStreamHistoryLost
+MAX_BACKOFF_SECONDS = 30.0
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    collection: str
+    operation: str  # insert | update | replace | delete | invalidate
+    document_id: Optional[str] = None
+    document: Optional[Dict[str, Any]] = None
+    # Top-level fields touched by an update, when the source knows them
+    changed_fields: Optional[FrozenSet[str]] = None
+
+    @property
+    def is_invalidate_all(self) -> bool:
+        return self.document_id is None
+
+Handler = Callable[[ChangeEvent], Union[None, Awaitable[None]]]
+
+class EventBus:
+    def __init__(self):
+        self._subscribers: Dict[str, List[Handler]] = defaultdict(list)
+
+    def subscribe(self, collection: str, handler: Handler) -> None:
+        self._subscribers[collection].append(handler)
+
+    async def publish(self, event: ChangeEvent) -> None:
+        for handler in self._subscribers.get(event.collection, ()):
+            try:
+                result = handler(event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                # One broken subscriber must not stop the others
+                logger.exception("Event handler %r failed for %s", handler, event)
+
+def _event_from_change(collection: str, change: Dict[str, Any]) -> ChangeEvent:
+    operation = change["operationType"]
+    if operation not in ("insert", "update", "replace", "delete"):
+        # drop, rename, dropDatabase, invalidate
+        return ChangeEvent(collection, "invalidate")
+    changed_fields = None
+    if operation == "update":
+        description = change.get("updateDescription", {})
+        fields = list(description.get("updatedFields", {})) + list(description.get("removedFields", []))
+        changed_fields = frozenset(field.split(".", 1)[0] for field in fields)
+    return ChangeEvent(
+        collection,
+        operation,
+        document_id=str(change["documentKey"]["_id"]),
+        document=change.get("fullDocument"),
+        changed_fields=changed_fields,
+    )
+
+class ChangeFeed:
+    """Publishes changes on ``collections`` to ``bus`` until stopped."""
+
+    def __init__(self, bus: EventBus, collections: Dict[str, str] = WATCHED_COLLECTIONS, poll_interval: float = 5.0):
+        self.bus = bus
+        self.collections = collections
+        self.poll_interval = poll_interval
+        self._resume_tokens: Dict[str, Any] = {}
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        for name, poll_field in self.collections.items():
+            self._tasks.append(asyncio.create_task(self._run(name, poll_field), name=f"change-feed:{name}"))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _run(self, name: str, poll_field: str) -> None:
+        from pymongo.errors import OperationFailure
+
+        backoff = 1.0
+        while True:
+            try:
+                await self._watch(name)
+            except OperationFailure as e:
+                if e.code == CHANGE_STREAMS_UNSUPPORTED:
+                    logger.info("Change streams unavailable; polling %s every %ss", name, self.poll_interval)
+                    await self._poll(name, poll_field)
+                    return
+                if e.code in RESUME_TOKEN_LOST:
+                    self._resume_tokens.pop(name, None)
+                logger.warning("Change stream on %s failed: %s", name, e)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Change stream on %s failed: %s", name, e)
+            # Anything may have changed while we were disconnected
+            await self.bus.publish(ChangeEvent(name, "invalidate"))
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+
+    async def _watch(self, name: str) -> None:
+        collection = get_mongo_db()[name]
+        async with collection.watch(full_document="updateLookup", resume_after=self._resume_tokens.get(name)) as stream:
+            async for change in stream:
+                self._resume_tokens[name] = stream.resume_token
+                await self.bus.publish(_event_from_change(name, change))
+
+    async def _poll(self, name: str, field: str) -> None:
+        """Fallback for standalone mongod: new timestamps become update events,
+        a shrinking document count becomes an invalidate (deletes leave no trace)."""
+        collection = get_mongo_db()[name]
+        latest = await collection.find_one({field: {"$exists": True}}, {field: 1}, sort=[(field, -1)])
+        watermark = latest[field] if latest else None
+        seen_at_watermark = {latest["_id"]} if latest else set()
+        count = await collection.estimated_document_count()
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                query = {field: {"$gte": watermark}} if watermark is not None else {field: {"$exists": True}}
+                async for doc in collection.find(query).sort(field, 1):
+                    if doc[field] == watermark and doc["_id"] in seen_at_watermark:
+                        continue
+                    if doc[field] != watermark:
+                        watermark, seen_at_watermark = doc[field], set()
+                    seen_at_watermark.add(doc["_id"])
+                    await self.bus.publish(ChangeEvent(name, "update", document_id=str(doc["_id"]), document=doc))
+                new_count = await collection.estimated_document_count()
+                if new_count < count:
+                    await self.bus.publish(ChangeEvent(name, "invalidate"))
+                count = new_count
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Polling %s failed: %s", name, e)
+
+event_bus = EventBus()
\ No newline at end of file
@@ -0,0 +1,246 @@
+# backend_python/gradebook.py
+"""
+Materialized course gradebook: a student x assessment score matrix.
+
+Each quiz submission and assignment grade upserts one ``GradebookEntry`` cell
+(``record_score``), so reading a gradebook never touches submissions. Totals
+are weighted by the course syllabus ``grading_policy`` from the Mongo course
+document; categories without gradable records here (final project,
+participation) are dropped and the remaining weights renormalized.
+
+Rows are the course's enrolled students (from Mongo enrollments), so a student
+with no graded work yet still appears, with empty cells. The JSON matrix is
+cached per course and invalidated by every score, new assessment and
+enrollment change; the CSV export streams the roster a page at a time.
+"""
+import csv
+import io
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from backend_python.cache import TTLCache
+from backend_python.database import SessionLocal
+from backend_python.models import Assignment, GradebookEntry, Quiz
+from backend_python.mongodb_db import get_courses_collection
+
+QUIZ_MAX_SCORE = 100.0  # quiz submissions are scored as a percentage
+CSV_PAGE_SIZE = 500
+ROSTER_PAGE_SIZE = 1000
+# Syllabus category names -> assessment kind
+POLICY_CATEGORIES = {"quiz": "quiz", "quizzes": "quiz", "assignment": "assignment", "assignments": "assignment"}
+DEFAULT_WEIGHTS = {"quiz": 0.5, "assignment": 0.5}
+
+gradebook_cache = TTLCache(maxsize=256, ttl=300)
+grading_policy_cache = TTLCache(maxsize=1024, ttl=600)
+
+# ==================== Writes ====================
+def record_score(
+    db: Session,
+    course_id: str,
+    user_id: str,
+    kind: str,
+    assessment_id: str,
+    score: float,
+    max_score: float,
+    keep_best: bool = False,
+) -> GradebookEntry:
+    """Upsert one gradebook cell in the caller's transaction (the caller commits).
+
+    Quizzes keep the best attempt; assignment grades overwrite.
+    """
+    def existing():
+        return db.query(GradebookEntry).filter(
+            GradebookEntry.course_id == course_id,
+            GradebookEntry.user_id == user_id,
+            GradebookEntry.assessment_id == assessment_id,
+        ).first()
+
+    entry = existing()
+    if entry is None:
+        entry = GradebookEntry(
+            course_id=course_id, user_id=user_id, assessment_id=str(assessment_id), kind=kind,
+            score=float(score), max_score=float(max_score), attempts=1, updated_at=datetime.utcnow(),
+        )
+        try:
+            # Savepoint: a concurrent first write for the same cell wins the
+            # insert and we fall through to the update below
+            with db.begin_nested():
+                db.add(entry)
+            return entry
+        except IntegrityError:
+            entry = existing()
+
+    entry.score = max(entry.score, float(score)) if keep_best else float(score)
+    entry.max_score = float(max_score)
+    entry.attempts = (entry.attempts or 0) + 1
+    entry.updated_at = datetime.utcnow()
+    return entry
+
+def invalidate_gradebook(course_id: Any) -> None:
+    gradebook_cache.invalidate(str(course_id))
+
+# ==================== Grading policy ====================
+def _weight(value: Any) -> Optional[float]:
+    """"40%", 40 and 0.4 all mean 40%"""
+    try:
+        number = float(str(value).strip().rstrip("%"))
+    except ValueError:
+        return None
+    return number / 100 if number > 1 else number
+
+def parse_grading_policy(policy: Optional[Dict[str, Any]]) -> Dict[str, float]:
+    weights: Dict[str, float] = {}
+    for category, value in (policy or {}).items():
+        kind = POLICY_CATEGORIES.get(str(category).strip().lower())
+        weight = _weight(value)
+        if kind and weight:
+            weights[kind] = weights.get(kind, 0.0) + weight
+    return weights or dict(DEFAULT_WEIGHTS)
+
+async def load_grading_policy(course_id: str) -> Dict[str, float]:
+    """Weights per assessment kind from the course syllabus, cached per course."""
+    weights = grading_policy_cache.get(course_id)
+    if weights is None:
+        course = await get_courses_collection().find_one({"_id": course_id}, {"syllabus.grading_policy": 1})
+        weights = parse_grading_policy(((course or {}).get("syllabus") or {}).get("grading_policy"))
+        grading_policy_cache.set(course_id, weights)
+    return weights
+
+# ==================== Reads ====================
+def list_assessments(db: Session, course_id: str) -> List[Dict[str, Any]]:
+    """Gradebook columns: quizzes, then assignments, each in creation order."""
+    quizzes = db.query(Quiz.id, Quiz.title).filter(Quiz.course_id == course_id).order_by(Quiz.created_at, Quiz.id)
+    assignments = (
+        db.query(Assignment.id, Assignment.title, Assignment.points)
+        .filter(Assignment.course_id == course_id)
+        .order_by(Assignment.created_at, Assignment.id)
+    )
+    return [
+        {"id": str(q.id), "kind": "quiz", "title": q.title, "maxScore": QUIZ_MAX_SCORE} for q in quizzes
+    ] + [
+        {"id": str(a.id), "kind": "assignment", "title": a.title, "maxScore": float(a.points or 100)} for a in assignments
+    ]
+
+def student_totals(scores: List[Optional[float]], columns: List[Dict[str, Any]], weights: Dict[str, float]) -> Dict[str, Any]:
+    """Percent per kind (missing work counts as zero) and the weighted total."""
+    earned: Dict[str, float] = {}
+    possible: Dict[str, float] = {}
+    for score, column in zip(scores, columns):
+        kind = column["kind"]
+        possible[kind] = possible.get(kind, 0.0) + column["maxScore"]
+        earned[kind] = earned.get(kind, 0.0) + (score or 0.0)
+    categories = {kind: round(100 * earned[kind] / possible[kind], 2) for kind in possible if possible[kind]}
+    # Renormalize over the kinds this course actually has
+    active = {kind: weights.get(kind, 0.0) for kind in categories}
+    weight_sum = sum(active.values())
+    total = round(sum(categories[k] * w for k, w in active.items()) / weight_sum, 2) if weight_sum else None
+    return {"categories": categories, "total": total}
+
+def _score_rows(entries: Iterable[Any], index: Dict[str, int], width: int) -> Dict[str, List[Optional[float]]]:
+    """(user_id, assessment_id, score) rows -> {user_id: score per column}"""
+    rows: Dict[str, List[Optional[float]]] = {}
+    for user_id, assessment_id, score in entries:
+        column = index.get(str(assessment_id))
+        if column is not None:
+            rows.setdefault(str(user_id), [None] * width)[column] = score
+    return rows
+
+def build_gradebook(db: Session, course_id: str, weights: Dict[str, float], student_ids: List[str]) -> Dict[str, Any]:
+    """The whole matrix as a JSON-ready dict (camelCase keys); two queries.
+
+    ``student_ids`` is the course roster; entries of students no longer
+    enrolled are left out.
+    """
+    columns = list_assessments(db, course_id)
+    index = {column["id"]: i for i, column in enumerate(columns)}
+    entries = db.query(GradebookEntry.user_id, GradebookEntry.assessment_id, GradebookEntry.score).filter(
+        GradebookEntry.course_id == course_id
+    )
+    rows = _score_rows(entries, index, len(columns))
+    students = []
+    for user_id in student_ids:
+        scores = rows.get(user_id, [None] * len(columns))
+        students.append({"userId": user_id, "scores": scores, **student_totals(scores, columns, weights)})
+    return {
+        "courseId": course_id,
+        "weights": weights,
+        "assessments": columns,
+        "students": students,
+        "generatedAt": datetime.utcnow().isoformat(),
+    }
+
+async def course_roster(course_id: str, roster_page: Callable, page_size: int = ROSTER_PAGE_SIZE) -> List[str]:
+    """Every enrolled student ID; ``roster_page`` is a keyset loader such as
+    ``repos.enrollments.user_ids_for_course``."""
+    student_ids: List[str] = []
+    after: Optional[str] = None
+    while True:
+        page = await roster_page(course_id, after, page_size)
+        student_ids.extend(page)
+        if len(page) < page_size:
+            return student_ids
+        after = page[-1]
+
+# ==================== CSV export ====================
+def _with_session(fn: Callable, *args):
+    db = SessionLocal()
+    try:
+        return fn(db, *args)
+    finally:
+        db.close()
+
+def page_entries(db: Session, course_id: str, user_ids: List[str]) -> List[tuple]:
+    return db.query(GradebookEntry.user_id, GradebookEntry.assessment_id, GradebookEntry.score).filter(
+        GradebookEntry.course_id == course_id, GradebookEntry.user_id.in_(user_ids)
+    ).all()
+
+def _csv_line(values: List[Any]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+async def gradebook_csv(
+    course_id: str,
+    weights: Dict[str, float],
+    roster_page: Callable,
+    resolve_users: Callable,
+    page_size: int = CSV_PAGE_SIZE,
+) -> AsyncIterator[str]:
+    """CSV lines, one page of enrolled students at a time. ``roster_page`` is
+    ``repos.enrollments.user_ids_for_course`` and ``resolve_users`` a batched
+    ``{user_id: user}`` loader such as ``repos.users.get_many``."""
+    columns = await run_in_threadpool(_with_session, list_assessments, course_id)
+    index = {column["id"]: i for i, column in enumerate(columns)}
+    kinds = sorted({column["kind"] for column in columns})
+    yield _csv_line(
+        ["user_id", "name", "email"]
+        + [f"{column['title']} ({column['maxScore']:g})" for column in columns]
+        + [f"{kind}_percent" for kind in kinds]
+        + ["total_percent"]
+    )
+
+    after: Optional[str] = None
+    while True:
+        user_ids = await roster_page(course_id, after, page_size)
+        if not user_ids:
+            break
+        entries = await run_in_threadpool(_with_session, page_entries, course_id, user_ids)
+        rows = _score_rows(entries, index, len(columns))
+        users = await resolve_users(user_ids)
+        for user_id in user_ids:
+            scores = rows.get(user_id, [None] * len(columns))
+            totals = student_totals(scores, columns, weights)
+            user = users.get(user_id) or {}
+            yield _csv_line(
+                [user_id, user.get("name", ""), user.get("email", "")]
+                + ["" if score is None else f"{score:g}" for score in scores]
+                + [totals["categories"].get(kind, "") for kind in kinds]
+                + ["" if totals["total"] is None else totals["total"]]
+            )
+        if len(user_ids) < page_size:
+            break
+        after = user_ids[-1]
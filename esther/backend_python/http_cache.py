@@ -0,0 +1,213 @@
+# backend_python/http_cache.py
+"""
+Response compression and conditional GETs.
+
+``CompressionMiddleware`` compresses single-chunk responses of at least
+``COMPRESSION_MIN_BYTES`` with brotli (when the ``brotli`` package is
+installed) or gzip, negotiated from ``Accept-Encoding``. Streaming responses
+(SSE, CSV, NDJSON) pass through untouched.
+
+``conditional_json`` serves cacheable catalogue reads: the strong ETag comes
+from the resource's key and ``updated_at``, so a matching ``If-None-Match``
+returns 304 without loading or serializing the resource, and each version is
+serialized and compressed once into ``variant_cache``. Listings with no cheap
+version (catalogue filters, search, facets) pass ``version=None`` and get an
+ETag hashed from the body, which still turns a repeat fetch into a 304; their
+bodies are rebuilt per request, so they are not cached and are compressed at
+the middleware's cheaper levels. ETags
+get an encoding suffix (``"abc-gzip"``) so each content-coding has its own
+strong validator.
+"""
+import gzip
+import hashlib
+import json
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from fastapi.encoders import jsonable_encoder
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+
+from backend_python.cache import TTLCache
+from backend_python.settings_configuration import settings
+
+COMPRESSIBLE_TYPES = ("application/json", "text/html", "text/plain", "text/css", "application/javascript", "image/svg+xml")
+# Responses that must reach the client as they are produced
+STREAMING_TYPES = ("text/event-stream", "application/x-ndjson")
+# Levels for the middleware (per request) and for cached variants (once per version)
+GZIP_LEVEL, BROTLI_QUALITY = 6, 5
+VARIANT_GZIP_LEVEL, VARIANT_BROTLI_QUALITY = 9, 9
+
+variant_cache = TTLCache(maxsize=128, ttl=3600)
+
+@lru_cache(maxsize=1)
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Best supported coding the client accepts: br, then gzip; None for identity."""
+    accepted: Dict[str, float] = {}
+    for part in (accept_encoding or "").lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if coding:
+            accepted[coding] = quality
+    candidates = (["br"] if _brotli() else []) + ["gzip"]
+    for coding in candidates:
+        if accepted.get(coding, accepted.get("*", 0.0)) > 0:
+            return coding
+    return None
+
+def compress(body: bytes, encoding: str, gzip_level: int = GZIP_LEVEL, brotli_quality: int = BROTLI_QUALITY) -> bytes:
+    if encoding == "br":
+        return _brotli().compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+def _compressible(content_type: str) -> bool:
+    content_type = content_type.split(";")[0].strip().lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES) and not content_type.startswith(STREAMING_TYPES)
+
+# ==================== ETags ====================
+def etag_for(base: str, encoding: Optional[str] = None) -> str:
+    return f'"{base}-{encoding}"' if encoding else f'"{base}"'
+
+def _etag_bases(if_none_match: Optional[str]) -> List[str]:
+    """Opaque tags from If-None-Match with any W/ prefix and coding suffix removed."""
+    bases = []
+    for tag in (if_none_match or "").split(","):
+        tag = tag.strip()
+        if tag == "*":
+            bases.append(tag)
+            continue
+        tag = tag[2:] if tag.startswith("W/") else tag
+        tag = tag.strip('"')
+        for suffix in ("-gzip", "-br"):
+            if tag.endswith(suffix):
+                tag = tag[: -len(suffix)]
+        if tag:
+            bases.append(tag)
+    return bases
+
+def etag_matches(if_none_match: Optional[str], base: str) -> bool:
+    bases = _etag_bases(if_none_match)
+    return "*" in bases or base in bases
+
+def version_tag(key: str, version: Any) -> str:
+    if isinstance(version, datetime):
+        version = version.isoformat()
+    return hashlib.sha1(f"{key}|{version}".encode()).hexdigest()[:24]
+
+def render_json(data: Any) -> bytes:
+    """Same bytes as FastAPI's JSONResponse."""
+    return json.dumps(
+        jsonable_encoder(data), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+def not_modified(base: str, encoding: Optional[str] = None) -> Response:
+    return Response(status_code=304, headers={
+        "ETag": etag_for(base, encoding), "Cache-Control": "no-cache", "Vary": "Accept-Encoding",
+    })
+
+async def conditional_json(request: Request, key: str, version: Any, build: Callable[[], Awaitable[Any]]) -> Response:
+    """JSON response for ``key`` at ``version`` (usually ``updated_at``) with a
+    strong ETag, 304 on a match, and cached precompressed variants.
+
+    ``build`` is only awaited on a variant-cache miss. When ``version`` is None
+    the ETag falls back to a hash of the serialized body, and nothing is cached:
+    without a version the next request could not find the entry before building.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+
+    base = version_tag(key, version) if version is not None else None
+    variants = variant_cache.get((key, base)) if base is not None else None
+    if base is not None and etag_matches(if_none_match, base):
+        small = variants is not None and len(variants["identity"]) < settings.COMPRESSION_MIN_BYTES
+        return not_modified(base, None if small else encoding)
+
+    if variants is None:
+        body = render_json(await build())
+        if base is None:
+            base = hashlib.sha1(body).hexdigest()[:24]
+            if etag_matches(if_none_match, base):
+                return not_modified(base, encoding)
+        variants = {"identity": body}
+        if version is not None:
+            variant_cache.set((key, base), variants)
+
+    if len(variants["identity"]) < settings.COMPRESSION_MIN_BYTES:
+        encoding = None
+    if encoding and encoding not in variants:
+        # Maximum levels only pay off for a variant that is served again
+        levels = {"gzip_level": VARIANT_GZIP_LEVEL, "brotli_quality": VARIANT_BROTLI_QUALITY} if version is not None else {}
+        variants[encoding] = compress(variants["identity"], encoding, **levels)
+    headers = {"ETag": etag_for(base, encoding), "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(variants[encoding or "identity"], media_type="application/json", headers=headers)
+
+# ==================== Middleware ====================
+class CompressionMiddleware:
+    """Pure ASGI, so streaming responses are never buffered."""
+
+    def __init__(self, app, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+
+        async def send_compressed(message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                # Held back until we see whether the body is a single chunk
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+
+            start, start_message = start_message, None
+            headers = MutableHeaders(scope=start)
+            body = message.get("body", b"")
+            if (
+                message.get("more_body", False)
+                or start["status"] < 200 or start["status"] in (204, 304)
+                or "content-encoding" in headers
+                or len(body) < self.minimum_size
+                or not _compressible(headers.get("content-type", ""))
+            ):
+                await send(start)
+                await send(message)
+                return
+
+            compressed = compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/") and etag.endswith('"'):
+                headers["ETag"] = f'{etag[:-1]}-{encoding}"'
+            await send(start)
+            await send({**message, "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,195 @@
+# backend_python/logging_setup.py
+"""
+Structured, non-blocking application logging.
+
+Loggers under ``backend_python`` hand records to a bounded in-memory queue; a
+``QueueListener`` thread formats them as JSON lines and writes them to stdout,
+so a log call on the event loop never waits on I/O. When the queue is full,
+records are dropped and counted rather than blocking the caller.
+
+``RequestIdMiddleware`` binds a request ID (the client's ``X-Request-ID`` or a
+fresh one) to a contextvar, and every record logged while serving that request
+carries it. Below WARNING, loggers listed in ``LOG_SAMPLE_RATES`` keep only
+that fraction of records, decided before anything is formatted or enqueued.
+"""
+import copy
+import json
+import logging
+import queue
+import random
+import re
+import sys
+import time
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+APP_LOGGER = "backend_python"
+ACCESS_LOGGER = "backend_python.access"
+REQUEST_ID_HEADER = "X-Request-ID"
+QUEUE_SIZE = 10_000
+# Client-supplied request IDs are echoed into logs, so only accept safe ones
+_REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
+
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# Attributes every LogRecord has; anything else came from ``extra=``
+_RECORD_FIELDS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id"}
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message, request ID and extras."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            entry["request_id"] = record.request_id
+        for key, value in vars(record).items():
+            if key not in _RECORD_FIELDS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+class RequestContextFilter(logging.Filter):
+    """Copies the request ID onto the record in the calling task, before the
+    record crosses to the listener thread where the contextvar is not set."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+class SamplingFilter(logging.Filter):
+    """Keeps ``rate`` of the records below WARNING from each listed logger."""
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = rates
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self.rates.get(record.name)
+        return rate is None or random.random() < rate
+
+_traceback_formatter = logging.Formatter()
+
+class DroppingQueueHandler(QueueHandler):
+    """Never blocks: a full queue drops the record and counts it."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Resolve the message and traceback to text in the caller (the stock
+        version folds the traceback into ``msg``), leaving JSON to the writer."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _traceback_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+_listener: Optional[QueueListener] = None
+_handler: Optional[DroppingQueueHandler] = None
+
+def configure_logging(level: str = "INFO", sample_rates: Optional[Dict[str, float]] = None) -> QueueListener:
+    """Route ``backend_python.*`` loggers through the queue and start the writer.
+
+    Idempotent while running; after ``shutdown_logging`` it starts afresh, so an
+    app whose lifespan runs more than once (tests, reloads) keeps logging.
+    """
+    global _listener, _handler
+    if _listener is not None:
+        return _listener
+
+    log_queue: queue.Queue = queue.Queue(maxsize=QUEUE_SIZE)
+    handler = DroppingQueueHandler(log_queue)
+    handler.addFilter(SamplingFilter(sample_rates or {}))
+    handler.addFilter(RequestContextFilter())
+
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(JsonFormatter())
+
+    app_logger = logging.getLogger(APP_LOGGER)
+    app_logger.setLevel(level.upper())
+    app_logger.addHandler(handler)
+    app_logger.propagate = False
+
+    _handler = handler
+    _listener = QueueListener(log_queue, stream, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+def shutdown_logging() -> None:
+    """Flush queued records, stop the writer thread and detach the queue handler,
+    so later records go to the root logger instead of a queue nobody drains."""
+    global _listener, _handler
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _handler is not None:
+        app_logger = logging.getLogger(APP_LOGGER)
+        app_logger.removeHandler(_handler)
+        app_logger.propagate = True
+        _handler = None
+
+def new_request_id(supplied: Optional[str] = None) -> str:
+    if supplied and _REQUEST_ID_PATTERN.match(supplied):
+        return supplied
+    return uuid.uuid4().hex
+
+class RequestIdMiddleware:
+    """Binds a request ID for the request's logs, echoes it in the response
+    and writes one (sampled) access record per request."""
+
+    def __init__(self, app):
+        self.app = app
+        self.access_logger = logging.getLogger(ACCESS_LOGGER)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_id = new_request_id(Headers(scope=scope).get(REQUEST_ID_HEADER))
+        token = request_id_var.set(request_id)
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_id(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            level = logging.ERROR if status >= 500 else logging.INFO
+            if self.access_logger.isEnabledFor(level):
+                self.access_logger.log(level, "%s %s %s", scope["method"], scope["path"], status, extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status,
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+                })
+            request_id_var.reset(token)
@@ -19,8 +19,15 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-# Import routers
-from backend_python.routers import auth
+from backend_python.settings_configuration import settings
+from backend_python.router_registry import enabled_router_names, log_import_report, mount_routers
+from backend_python.http_cache import CompressionMiddleware
+from backend_python.logging_setup import REQUEST_ID_HEADER, RequestIdMiddleware, configure_logging, shutdown_logging
+
+# Handlers log through a queue; the writer thread does the stdout I/O. Started
+# here so import-time records (router import costs) are written too; lifespan
+# startup restarts it if a previous shutdown stopped it.
+configure_logging(settings.LOG_LEVEL, settings.LOG_SAMPLE_RATES)
 
 # CORS configuration
 cors_origins = [
@@ -29,10 +36,25 @@ cors_origins = [
     "https://learning-inclusive-lmke.vercel.app"
 ]
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Paired with shutdown_logging below; a no-op if logging is already running
+    configure_logging(settings.LOG_LEVEL, settings.LOG_SAMPLE_RATES)
+    # Keeps this worker's caches coherent with writes from other workers
+    feed = None
+    if settings.CHANGE_FEED_ENABLED:
+        from backend_python.cache_invalidation import start_change_feed
+        feed = start_change_feed(poll_interval=settings.CHANGE_FEED_POLL_SECONDS)
+    yield
+    if feed is not None:
+        await feed.stop()
+    shutdown_logging()
+
 app = FastAPI(
     title="Inclusive Learning Platform API",
     description="Backend API for the Inclusive Learning Platform",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -42,10 +64,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Keyset pagination cursor (routers/discussions.py) and the request ID
+    expose_headers=["X-Next-Cursor", REQUEST_ID_HEADER],
 )
 
-# Include routers
-app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
+# Compress large JSON responses (gzip, or brotli when installed)
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MIN_BYTES)
+
+# Outermost, so the request ID covers every other middleware and the access log
+# times the whole request
+app.add_middleware(RequestIdMiddleware)
+
+# Include routers: only the ones enabled for this deployment are imported
+router_import_costs = mount_routers(app, enabled_router_names(settings.ENABLED_ROUTERS))
+app.state.router_import_ms = dict(router_import_costs)
+log_import_report(router_import_costs)
 
 # Health check endpoint
 @app.get("/health")
@@ -0,0 +1,44 @@
+"""
+Normalize course accessibility_features to the sorted list form and create the
+(is_published, accessibility_features) multikey index.
+Safe to re-run: only documents whose value changes are rewritten.
+
+Run: python -m backend_python.migrate_accessibility_features
+"""
+import asyncio
+import sys
+import os
+
+from pymongo import UpdateOne
+
+# Add parent directory to path for imports
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+from backend_python.mongodb_db import get_courses_collection
+from backend_python.accessibility_features import ensure_feature_indexes, normalize_features
+
+async def migrate_accessibility_features() -> int:
+    courses_col = get_courses_collection()
+    updates = []
+    async for course in courses_col.find({}, {"accessibility_features": 1}):
+        current = course.get("accessibility_features")
+        normalized = normalize_features(current)
+        if current != normalized:
+            updates.append(UpdateOne({"_id": course["_id"]}, {"$set": {"accessibility_features": normalized}}))
+    if updates:
+        await courses_col.bulk_write(updates, ordered=False)
+    await ensure_feature_indexes()
+    return len(updates)
+
+async def main():
+    try:
+        updated = await migrate_accessibility_features()
+        print(f"[SUCCESS] Normalized accessibility features on {updated} courses")
+    except Exception as e:
+        print(f"[ERROR] Migration failed: {e}")
+        import traceback
+        traceback.print_exc()
+
+if __name__ == "__main__":
+    asyncio.run(main())
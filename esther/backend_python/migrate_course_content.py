@@ -0,0 +1,114 @@
+"""
+Split embedded lessons and sub-resources out of existing course documents.
+
+Copies lesson bodies into ``lessons`` and pages/announcements/resources/badges/
+assignments/quizzes into their own ``course_<section>`` collections, then
+rewrites each course as an outline. Safe to re-run: items are upserted by key
+and already split courses are skipped.
+
+Earlier runs wrote sections into the unprefixed collections shared with
+seeding (``announcements``, ``quizzes``, ...); those items are moved first.
+
+Run: python -m backend_python.migrate_course_content
+"""
+import asyncio
+import sys
+import os
+
+from pymongo import UpdateOne
+
+# Add parent directory to path for imports
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+from backend_python.mongodb_db import bulk_upsert, get_course_section_collection, get_courses_collection, get_mongo_db
+from backend_python.course_content import (
+    CourseSection,
+    LESSON_BODY_FIELDS,
+    MODULE_LESSON_KEYS,
+    ensure_content_indexes,
+    split_course,
+    store_course_items,
+)
+
+BATCH_SIZE = 100
+
+def needs_split_query() -> dict:
+    """Courses that still embed a sub-resource array or a lesson body"""
+    clauses = [{section.value: {"$exists": True}} for section in CourseSection]
+    clauses += [
+        {f"modules.{key}.{field}": {"$exists": True}} for key in MODULE_LESSON_KEYS for field in LESSON_BODY_FIELDS
+    ]
+    return {"$or": clauses}
+
+def legacy_split_query() -> dict:
+    """Split-out items in a legacy unprefixed collection: keyed
+    ``<course_id>:<item_id>`` with a ``position``, unlike seeded documents."""
+    return {"_id": {"$regex": ":"}, "position": {"$exists": True}}
+
+async def relocate_legacy_sections() -> int:
+    moved = 0
+    for section in CourseSection:
+        legacy = get_mongo_db()[section.value]
+        batch = []
+        async for item in legacy.find(legacy_split_query()):
+            batch.append(item)
+            if len(batch) >= BATCH_SIZE:
+                moved += await _relocate_batch(legacy, section, batch)
+                batch = []
+        if batch:
+            moved += await _relocate_batch(legacy, section, batch)
+    return moved
+
+async def _relocate_batch(legacy, section: CourseSection, batch) -> int:
+    # Copy before deleting, so an interrupted run never loses items
+    await bulk_upsert(get_course_section_collection(section.value), batch)
+    await legacy.delete_many({"_id": {"$in": [item["_id"] for item in batch]}})
+    return len(batch)
+
+async def _migrate_batch(courses_col, batch) -> int:
+    course_updates = []
+    for course in batch:
+        outline, items = split_course(course)
+        await store_course_items(items)
+        course_updates.append(UpdateOne(
+            {"_id": course["_id"]},
+            {
+                "$set": {"modules": outline.get("modules", [])},
+                "$unset": {section.value: "" for section in CourseSection},
+            },
+        ))
+    # Content is written before the outline, so an interrupted run never
+    # loses lesson bodies
+    await courses_col.bulk_write(course_updates, ordered=False)
+    return len(batch)
+
+async def migrate_course_content() -> int:
+    courses_col = get_courses_collection()
+    await ensure_content_indexes()
+
+    migrated = 0
+    batch = []
+    async for course in courses_col.find(needs_split_query()):
+        batch.append(course)
+        if len(batch) >= BATCH_SIZE:
+            migrated += await _migrate_batch(courses_col, batch)
+            batch = []
+    if batch:
+        migrated += await _migrate_batch(courses_col, batch)
+    return migrated
+
+async def main():
+    try:
+        moved = await relocate_legacy_sections()
+        if moved:
+            print(f"[OK] Moved {moved} split items out of the legacy section collections")
+        migrated = await migrate_course_content()
+        print(f"[SUCCESS] Split content out of {migrated} courses")
+    except Exception as e:
+        print(f"[ERROR] Migration failed: {e}")
+        import traceback
+        traceback.print_exc()
+
+if __name__ == "__main__":
+    asyncio.run(main())
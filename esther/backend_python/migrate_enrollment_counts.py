@@ -0,0 +1,47 @@
+"""
+Prepare enrollments for the upsert write path: remove duplicate
+(user_id, course_id) enrollments (keeping the earliest), create the unique
+index, and backfill each course's enrollment_count.
+Safe to re-run.
+
+Run: python -m backend_python.migrate_enrollment_counts
+"""
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+from backend_python.mongodb_db import get_enrollments_collection
+from backend_python.enrollment_store import ensure_enrollment_indexes, recount_enrollments
+
+async def remove_duplicate_enrollments() -> int:
+    pipeline = [
+        {"$sort": {"enrolled_at": 1}},
+        {"$group": {"_id": {"user_id": "$user_id", "course_id": "$course_id"}, "ids": {"$push": "$_id"}}},
+        {"$match": {"ids.1": {"$exists": True}}},
+    ]
+    duplicate_ids = []
+    async for group in get_enrollments_collection().aggregate(pipeline, allowDiskUse=True):
+        duplicate_ids.extend(group["ids"][1:])
+    if duplicate_ids:
+        await get_enrollments_collection().delete_many({"_id": {"$in": duplicate_ids}})
+    return len(duplicate_ids)
+
+async def main():
+    try:
+        removed = await remove_duplicate_enrollments()
+        print(f"[OK] Removed {removed} duplicate enrollments")
+        await ensure_enrollment_indexes()
+        print("[OK] Enrollment indexes created")
+        updated = await recount_enrollments()
+        print(f"[SUCCESS] Backfilled enrollment_count on {updated} courses")
+    except Exception as e:
+        print(f"[ERROR] Migration failed: {e}")
+        import traceback
+        traceback.print_exc()
+
+if __name__ == "__main__":
+    asyncio.run(main())
\ No newline at end of file
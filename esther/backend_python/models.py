@@ -2,8 +2,10 @@
 import enum
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Enum, ForeignKey, Text, JSON, Boolean, Integer, TypeDecorator
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy import Column, String, DateTime, Enum, Float, ForeignKey, Text, JSON, Boolean, Integer, Index, TypeDecorator
+# The generic UUID renders as Postgres' native type; importing it from
+# sqlalchemy.dialects.postgresql would load the whole dialect at startup
+from sqlalchemy import UUID as PG_UUID
 from sqlalchemy.orm import relationship
 from .database import Base
 
@@ -101,7 +103,7 @@ class Course(Base):
     progress_entries = relationship("Progress", back_populates="course", cascade="all, delete-orphan")
     enrollments = relationship("Enrollment", back_populates="course", cascade="all, delete-orphan")
     quizzes = relationship("Quiz", back_populates="course", cascade="all, delete-orphan")
-    modules = relationship("Module", back_populates="course", cascade="all, delete-orphan")
+    modules = relationship("Module", back_populates="course", cascade="all, delete-orphan", order_by="Module.order_index")
 
 # ==================== Enrollment Model ====================
 class Enrollment(Base):
@@ -137,6 +139,10 @@ class Progress(Base):
     user = relationship("User", back_populates="progress_entries")
     course = relationship("Course", back_populates="progress_entries")
 
+    __table_args__ = (
+        Index("ix_progress_user_course", "user_id", "course_id"),
+    )
+
 # ==================== Mentorship Models ====================
 class MentorshipGroup(Base):
     __tablename__ = "mentorship_groups"
@@ -159,6 +165,10 @@ class MentorshipMembership(Base):
     group = relationship("MentorshipGroup", back_populates="memberships")
     user = relationship("User", back_populates="mentorship_memberships")
 
+    __table_args__ = (
+        Index("ix_mentorship_memberships_group_user", "group_id", "user_id"),
+    )
+
 # ==================== Quiz Models ====================
 class Quiz(Base):
     __tablename__ = "quizzes"
@@ -172,6 +182,11 @@ class Quiz(Base):
     course = relationship("Course", back_populates="quizzes")
     questions = relationship("Question", back_populates="quiz", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Gradebook columns: a course's quizzes in creation order
+        Index("ix_quizzes_course_created", "course_id", "created_at", "id"),
+    )
+
 class Question(Base):
     __tablename__ = "questions"
     id = Column(UUIDType, primary_key=True, default=uuid.uuid4)
@@ -183,6 +198,11 @@ class Question(Base):
 
     quiz = relationship("Quiz", back_populates="questions")
 
+    __table_args__ = (
+        # Answer keys are read in creation order (quiz_analytics)
+        Index("ix_questions_quiz_created", "quiz_id", "created_at", "id"),
+    )
+
 class Submission(Base):
     __tablename__ = "submissions"
     id = Column(UUIDType, primary_key=True, default=uuid.uuid4)
@@ -195,6 +215,24 @@ class Submission(Base):
     user = relationship("User")
     quiz = relationship("Quiz")
 
+    __table_args__ = (
+        # Incremental analytics read submissions in (submitted_at, id) order
+        Index("ix_submissions_quiz_submitted", "quiz_id", "submitted_at", "id"),
+    )
+
+class QuizItemAnalytics(Base):
+    """Per-quiz item statistics; see quiz_analytics.py for the fields in ``state``."""
+    __tablename__ = "quiz_item_analytics"
+    quiz_id = Column(UUIDType, ForeignKey("quizzes.id", ondelete="CASCADE"), primary_key=True)
+    submission_count = Column(Integer, nullable=False, default=0)
+    # Newest submission folded into the sums; refreshes re-read
+    # quiz_analytics.SAFETY_WINDOW behind it for late commits
+    last_submitted_at = Column(DateTime, nullable=True)
+    last_submission_id = Column(String(36), nullable=True)
+    state = Column(JSON, nullable=True)  # running sums, so refreshes only read new submissions
+    items = Column(JSON, nullable=True)  # computed per-question results
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
 # ==================== Module Model ====================
 class Module(Base):
     __tablename__ = "modules"
@@ -206,7 +244,18 @@ class Module(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     
     course = relationship("Course", back_populates="modules")
-    lessons = relationship("Lesson", back_populates="module", cascade="all, delete-orphan")
+    lessons = relationship("Lesson", back_populates="module", cascade="all, delete-orphan", order_by="Lesson.order_index")
+    # Module-level resources only: lesson resources also carry module_id
+    resources = relationship(
+        "Resource",
+        primaryjoin="and_(Module.id == Resource.module_id, Resource.lesson_id.is_(None))",
+        order_by="Resource.created_at",
+        viewonly=True,
+    )
+
+    __table_args__ = (
+        Index("ix_modules_course_order", "course_id", "order_index"),
+    )
 
 # ==================== Lesson Model ====================
 class Lesson(Base):
@@ -224,6 +273,11 @@ class Lesson(Base):
     
     module = relationship("Module", back_populates="lessons")
     progress_entries = relationship("LessonProgress", back_populates="lesson", cascade="all, delete-orphan")
+    resources = relationship("Resource", order_by="Resource.created_at")
+
+    __table_args__ = (
+        Index("ix_lessons_module_order", "module_id", "order_index"),
+    )
 
 # ==================== Resource Model ====================
 class Resource(Base):
@@ -239,6 +293,12 @@ class Resource(Base):
     lesson_id = Column(UUIDType, ForeignKey("lessons.id", ondelete="CASCADE"), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_resources_course_id", "course_id"),
+        Index("ix_resources_module_id", "module_id"),
+        Index("ix_resources_lesson_id", "lesson_id"),
+    )
+
 # ==================== Lesson Progress Model ====================
 class LessonProgress(Base):
     __tablename__ = "lesson_progress"
@@ -262,6 +322,33 @@ class Assignment(Base):
     points = Column(Integer, default=100)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # Gradebook columns: a course's assignments in creation order
+        Index("ix_assignments_course_created", "course_id", "created_at", "id"),
+    )
+
+# ==================== Gradebook Model ====================
+class GradebookEntry(Base):
+    """One cell of a course gradebook: a student's score on one quiz or assignment.
+
+    Written on every quiz submission and assignment grade, so the gradebook is
+    read from this table instead of being recomputed from submissions.
+    """
+    __tablename__ = "gradebook_entries"
+    id = Column(UUIDType, primary_key=True, default=uuid.uuid4)
+    course_id = Column(UUIDType, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(UUIDType, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    assessment_id = Column(String(36), nullable=False)  # quiz or assignment id
+    kind = Column(String(20), nullable=False)  # "quiz" | "assignment"
+    score = Column(Float, nullable=False)
+    max_score = Column(Float, nullable=False)
+    attempts = Column(Integer, default=1)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ux_gradebook_course_user_assessment", "course_id", "user_id", "assessment_id", unique=True),
+    )
+
 # ==================== Announcement Model ====================
 class Announcement(Base):
     __tablename__ = "announcements"
@@ -273,16 +360,32 @@ class Announcement(Base):
     is_pinned = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_announcements_course_created", "course_id", "created_at"),
+    )
+
 # ==================== Discussion Model ====================
 class Discussion(Base):
     __tablename__ = "discussions"
     id = Column(UUIDType, primary_key=True, default=uuid.uuid4)
     course_id = Column(UUIDType, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(UUIDType, ForeignKey("users.id"), nullable=False)
+    # NULL for a thread's opening post; replies point at the post they answer
+    parent_id = Column(UUIDType, ForeignKey("discussions.id", ondelete="CASCADE"), nullable=True)
     title = Column(String(500), nullable=False)
     content = Column(Text, nullable=False)
+    # Denormalized: direct replies, and the newest post in the thread
+    reply_count = Column(Integer, nullable=False, default=0)
+    last_activity_at = Column(DateTime, default=datetime.utcnow)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # Keyset pagination: (course_id, parent_id IS NULL) threads ordered by
+        # (last_activity_at, id), parent_id replies by (created_at, id)
+        Index("ix_discussions_course_parent_activity", "course_id", "parent_id", "last_activity_at", "id"),
+        Index("ix_discussions_parent_created", "parent_id", "created_at", "id"),
+    )
+
 # ==================== Page Model ====================
 class Page(Base):
     __tablename__ = "pages"
@@ -293,3 +396,7 @@ class Page(Base):
     slug = Column(String(500), nullable=True)
     order_index = Column(Integer, default=0)
     created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_pages_course_order", "course_id", "order_index"),
+    )
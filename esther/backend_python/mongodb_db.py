@@ -1,32 +1,122 @@
 # mongodb_db.py
-from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure
+from typing import Any, Dict, Iterable, List
 import os
 
 # MongoDB connection URL
 MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
 DB_NAME = os.getenv("MONGODB_DATABASE_NAME", "inclusive_learning")
 
-# Create a MongoDB client
-client = AsyncIOMotorClient(MONGODB_URL)
-mongo_client = client  # For backward compatibility
+# The client is created on first use: importing motor and building the client
+# at import time is a large share of serverless cold start.
+_client = None
+_db = None
 
-# Get database
-db = client[DB_NAME]
+# pymongo's sort/index directions, so index and sort specs need no pymongo import
+ASCENDING, DESCENDING = 1, -1
+
+def get_client():
+    global _client
+    if _client is None:
+        from motor.motor_asyncio import AsyncIOMotorClient
+        _client = AsyncIOMotorClient(MONGODB_URL)
+    return _client
+
+def __getattr__(name):
+    # ``client``, ``mongo_client`` (backward compatibility) and ``db``
+    if name in ("client", "mongo_client"):
+        return get_client()
+    if name == "db":
+        return get_mongo_db()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Collection getters
+def get_mongo_db():
+    global _db
+    if _db is None:
+        _db = get_client()[DB_NAME]
+    return _db
+
 def get_users_collection():
-    return db["users"]
+    return get_mongo_db()["users"]
 
 def get_courses_collection():
-    return db["courses"]
+    return get_mongo_db()["courses"]
 
 def get_enrollments_collection():
-    return db["enrollments"]
+    return get_mongo_db()["enrollments"]
 
 def get_progress_collection():
-    return db["progress"]
+    return get_mongo_db()["progress"]
 
 def get_announcements_collection():
-    return db["announcements"]
\ No newline at end of file
+    return get_mongo_db()["announcements"]
+
+def get_lessons_collection():
+    return get_mongo_db()["lessons"]
+
+def get_course_outlines_collection():
+    return get_mongo_db()["course_outlines"]
+
+def get_course_section_collection(section: str):
+    """Collection holding one kind of split-out course sub-resource, e.g.
+    ``course_pages``. Prefixed so it never mixes with the top-level
+    ``announcements``/``assignments``/``quizzes`` collections seeding writes."""
+    return get_mongo_db()[f"course_{section}"]
+
+# ==================== Bulk helpers ====================
+BULK_BATCH_SIZE = 1000
+# Set when a document is first upserted and never overwritten by a re-run
+INSERT_ONLY_FIELDS = ("created_at", "enrollment_count")
+
+def empty_write_counts() -> Dict[str, int]:
+    return {"inserted": 0, "updated": 0, "unchanged": 0, "failed": 0}
+
+def merge_write_counts(total: Dict[str, int], counts: Dict[str, int]) -> Dict[str, int]:
+    for key, value in counts.items():
+        total[key] = total.get(key, 0) + value
+    return total
+
+async def bulk_upsert(
+    collection,
+    docs: List[Dict[str, Any]],
+    batch_size: int = BULK_BATCH_SIZE,
+    insert_only: Iterable[str] = INSERT_ONLY_FIELDS,
+) -> Dict[str, int]:
+    """Upsert ``docs`` by ``_id`` with one unordered bulk_write per batch.
+
+    Only the fields in each doc are written (``$set``), so fields maintained
+    elsewhere, such as ``enrollment_count`` or ``updated_at``, survive a
+    re-seed. Fields in ``insert_only`` are written only when the document is
+    created.
+    """
+    from pymongo import UpdateOne
+    from pymongo.errors import BulkWriteError
+
+    insert_only = frozenset(insert_only)
+    counts = empty_write_counts()
+    for start in range(0, len(docs), batch_size):
+        batch = docs[start:start + batch_size]
+        ops = []
+        for doc in batch:
+            update: Dict[str, Any] = {}
+            fields = {k: v for k, v in doc.items() if k != "_id" and k not in insert_only}
+            on_insert = {k: v for k, v in doc.items() if k in insert_only}
+            if fields:
+                update["$set"] = fields
+            if on_insert:
+                update["$setOnInsert"] = on_insert
+            ops.append(UpdateOne({"_id": doc["_id"]}, update or {"$setOnInsert": {"_id": doc["_id"]}}, upsert=True))
+        try:
+            result = await collection.bulk_write(ops, ordered=False)
+            inserted, updated, failed = result.upserted_count, result.modified_count, 0
+        except BulkWriteError as e:
+            # Unordered writes keep going past individual failures
+            details = e.details
+            inserted = details.get("nUpserted", 0)
+            updated = details.get("nModified", 0)
+            failed = len(details.get("writeErrors", []))
+        counts["inserted"] += inserted
+        counts["updated"] += updated
+        counts["failed"] += failed
+        counts["unchanged"] += len(batch) - inserted - updated - failed
+    return counts
@@ -20,6 +20,17 @@ class CourseDifficulty(str, Enum):
     intermediate = "intermediate"
     advanced = "advanced"
 
+class AccessibilityFeature(str, Enum):
+    screen_reader = "screen-reader"
+    captions = "captions"
+    transcripts = "transcripts"
+    sign_language = "sign-language"
+    text_to_speech = "text-to-speech"
+    keyboard_navigation = "keyboard-navigation"
+    voice_control = "voice-control"
+    simplified_ui = "simplified-ui"
+    high_contrast = "high-contrast"
+
 # MongoDB Document Models (as Pydantic models for validation)
 class UserDocument(BaseModel):
     id: Optional[str] = Field(default_factory=lambda: str(uuid4()), alias="_id")
@@ -42,11 +53,14 @@ class CourseDocument(BaseModel):
     category: CourseCategory = CourseCategory.general
     difficulty: CourseDifficulty = CourseDifficulty.beginner
     instructor_id: str
-    accessibility_features: Optional[Dict[str, Any]] = None
+    # Normalized, sorted AccessibilityFeature values (multikey-indexed)
+    accessibility_features: List[str] = []
     captions: Optional[Dict[str, Any]] = None
     duration: Optional[int] = 0
     modules: Optional[List[Dict[str, Any]]] = []
     is_published: Optional[bool] = False
+    # Denormalized; maintained with $inc by enrollment_store
+    enrollment_count: int = 0
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
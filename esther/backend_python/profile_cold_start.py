@@ -0,0 +1,112 @@
+# backend_python/profile_cold_start.py
+"""
+Cold-start profile for the serverless entry point.
+
+Reports the slowest imports (``python -X importtime``) when loading ``main`` and
+times a fresh interpreter from launch to its first ``/health`` response, which
+is what a Vercel cold start pays before serving a request.
+
+Run: python -m backend_python.profile_cold_start [--top 25] [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+
+COLD_START_TARGET_MS = 300
+
+# Drives the ASGI app directly so the measurement needs no HTTP client or server.
+FIRST_RESPONSE_SNIPPET = """
+import asyncio
+from backend_python.main import app
+
+async def first_response():
+    scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+             "scheme": "http", "path": "/health", "raw_path": b"/health", "root_path": "",
+             "query_string": b"", "headers": [], "client": ("127.0.0.1", 0), "server": ("127.0.0.1", 80)}
+    sent = []
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+    async def send(message):
+        sent.append(message)
+    await app(scope, receive, send)
+    return sent[0]["status"]
+
+print(asyncio.run(first_response()))
+"""
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    # Only warnings reach the log stream, so stdout carries just the snippet's output
+    env = {**os.environ, "LOG_LEVEL": "WARNING"}
+    return subprocess.run([sys.executable, *args], cwd=project_root, capture_output=True, text=True, env=env)
+
+def import_times(module: str = "backend_python.main") -> List[Tuple[int, int, str]]:
+    """(self_us, cumulative_us, module) for every import made while loading ``module``."""
+    result = _run_python("-X", "importtime", "-c", f"import {module}")
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else "import failed")
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return rows
+
+def print_import_report(rows: List[Tuple[int, int, str]], top: int) -> None:
+    # Top-level packages only (no leading indentation) give the per-dependency cost
+    packages = sorted((r for r in rows if not r[2].startswith("  ")), key=lambda r: r[1], reverse=True)
+    total_us = sum(r[1] for r in packages)
+    print(f"Total import time: {total_us / 1000:.1f} ms across {len(rows)} modules\n")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  package")
+    for self_us, cumulative_us, name in packages[:top]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {name.strip()}")
+
+    print("\nSlowest individual modules (self time):")
+    for self_us, _, name in sorted(rows, reverse=True)[:top]:
+        print(f"{self_us / 1000:>9.1f} ms  {name.strip()}")
+
+def time_first_response(runs: int) -> List[float]:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = _run_python("-c", FIRST_RESPONSE_SNIPPET)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if result.returncode != 0 or result.stdout.strip() != "200":
+            raise RuntimeError(result.stderr.strip() or f"unexpected response: {result.stdout.strip()}")
+        timings.append(elapsed_ms)
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile serverless cold start")
+    parser.add_argument("--top", type=int, default=25, help="rows to show in the import report")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to time")
+    args = parser.parse_args()
+
+    try:
+        print("=== Import time (-X importtime) ===\n")
+        print_import_report(import_times(), args.top)
+
+        print("\n=== Cold start to first /health response ===\n")
+        timings = time_first_response(args.runs)
+        median = statistics.median(timings)
+        print(f"runs: {', '.join(f'{t:.0f}' for t in timings)} ms")
+        print(f"median: {median:.0f} ms (target {COLD_START_TARGET_MS} ms)")
+        if median <= COLD_START_TARGET_MS:
+            print("[OK] Cold start is within target")
+        else:
+            print("[WARN] Cold start is over target; see the import report above")
+    except Exception as e:
+        print(f"[ERROR] {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
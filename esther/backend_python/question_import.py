@@ -0,0 +1,101 @@
+# backend_python/question_import.py
+"""
+Parse and validate quiz question banks (JSON or CSV) in one pass.
+
+Every row is checked before anything is written, so an import either inserts
+all valid rows in one transaction or reports each bad row with its errors.
+
+JSON: a list of objects (or ``{"questions": [...]}``) with ``prompt``,
+``options`` (list) and ``answer``.
+CSV: a header row with ``prompt``, ``answer`` and either ``options``
+(``|``-separated) or ``option_1``, ``option_2``, ... columns.
+"""
+import csv
+import io
+import json
+from typing import Any, Dict, List, Tuple
+
+MAX_QUESTIONS = 5000
+OPTION_SEPARATOR = "|"
+# Accepted spellings of the prompt column
+PROMPT_KEYS = ("prompt", "question", "question_text")
+
+class QuestionBankError(ValueError):
+    """The file as a whole could not be read (bad JSON, no header, too many rows)."""
+
+def detect_format(filename: str = "", content_type: str = "") -> str:
+    name, content_type = (filename or "").lower(), (content_type or "").lower()
+    if name.endswith(".csv") or "csv" in content_type:
+        return "csv"
+    if name.endswith(".json") or "json" in content_type:
+        return "json"
+    raise QuestionBankError("Unsupported file type; upload .json or .csv")
+
+def _json_rows(text: str) -> List[Dict[str, Any]]:
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise QuestionBankError(f"Invalid JSON: {e}")
+    if isinstance(data, dict):
+        data = data.get("questions")
+    if not isinstance(data, list):
+        raise QuestionBankError("Expected a list of questions or {\"questions\": [...]}")
+    return data
+
+def _csv_rows(text: str) -> List[Dict[str, Any]]:
+    reader = csv.DictReader(io.StringIO(text))
+    if not reader.fieldnames:
+        raise QuestionBankError("CSV has no header row")
+    option_columns = sorted(
+        (f for f in reader.fieldnames if f and f.strip().lower().startswith("option_")),
+        key=lambda f: int(f.rsplit("_", 1)[-1]) if f.rsplit("_", 1)[-1].isdigit() else 0,
+    )
+    rows = []
+    for record in reader:
+        record = {(k or "").strip().lower(): (v or "").strip() for k, v in record.items()}
+        if option_columns:
+            record["options"] = [record[c.strip().lower()] for c in option_columns if record.get(c.strip().lower())]
+        elif record.get("options"):
+            record["options"] = [o.strip() for o in record["options"].split(OPTION_SEPARATOR) if o.strip()]
+        rows.append(record)
+    return rows
+
+def validate_question(raw: Any) -> Tuple[Dict[str, Any], List[str]]:
+    """Returns (question, errors); the question is only usable when errors is empty."""
+    if not isinstance(raw, dict):
+        return {}, ["Expected an object"]
+    errors = []
+    prompt = next((raw[k] for k in PROMPT_KEYS if raw.get(k)), None)
+    if not isinstance(prompt, str) or not prompt.strip():
+        errors.append("prompt is required")
+
+    options = raw.get("options") or []
+    if isinstance(options, str):
+        options = [o.strip() for o in options.split(OPTION_SEPARATOR) if o.strip()]
+    if not isinstance(options, list) or not all(isinstance(o, (str, int, float)) for o in options):
+        errors.append("options must be a list of strings")
+        options = []
+    options = [str(o) for o in options]
+    if len(set(options)) != len(options):
+        errors.append("options must be unique")
+
+    answer = raw.get("answer")
+    answer = None if answer in (None, "") else str(answer)
+    if options and answer is not None and answer not in options:
+        errors.append("answer must be one of the options")
+
+    return {"prompt": (prompt or "").strip(), "options": options, "answer": answer}, errors
+
+def parse_question_bank(text: str, fmt: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Returns (valid questions, per-row errors). Rows are numbered from 1."""
+    rows = _csv_rows(text) if fmt == "csv" else _json_rows(text)
+    if len(rows) > MAX_QUESTIONS:
+        raise QuestionBankError(f"At most {MAX_QUESTIONS} questions per import")
+    questions, errors = [], []
+    for number, raw in enumerate(rows, start=1):
+        question, row_errors = validate_question(raw)
+        if row_errors:
+            errors.append({"row": number, "errors": row_errors})
+        else:
+            questions.append(question)
+    return questions, errors
\ No newline at end of file
@@ -0,0 +1,195 @@
+# backend_python/quiz_analytics.py
+"""
+Item analysis for quizzes: difficulty (p-value), point-biserial discrimination
+and distractor frequencies per question.
+
+Submissions are streamed in chunks into NumPy arrays and folded into running
+sums (n, sum of item scores, sum of totals, sum of squared totals, sum of
+item x total, option counts). Every statistic is derived from those sums, so
+a refresh only reads submissions near or past the stored watermark. Changing a
+quiz's questions or answer key invalidates the sums and triggers a rebuild.
+
+``submitted_at`` is stamped when a submission is created, but the row only
+becomes visible when its transaction commits, so a slow commit can land behind
+the watermark. Each refresh therefore re-reads ``SAFETY_WINDOW`` behind the
+watermark and skips the IDs it already folded (``state["recent_ids"]``).
+
+Discrimination is the corrected (item-rest) point-biserial correlation: each
+item is correlated with the total score excluding that item.
+"""
+import hashlib
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import flag_modified
+
+from backend_python.models import Question, QuizItemAnalytics, Submission
+
+CHUNK_SIZE = 2000
+# Longest a submission's transaction may stay uncommitted (plus clock skew
+# between workers) and still be counted
+SAFETY_WINDOW = timedelta(minutes=10)
+# Flags for instructors
+HARD_P_VALUE = 0.2
+EASY_P_VALUE = 0.9
+LOW_DISCRIMINATION = 0.2
+NO_ANSWER = "(no answer)"
+
+def _answer_key(questions: List[Question]) -> Dict[str, Any]:
+    ids = [str(q.id) for q in questions]
+    options = [[str(o) for o in (q.options or [])] for q in questions]
+    answers = [None if q.correct_answer is None else str(q.correct_answer) for q in questions]
+    digest = hashlib.sha1(json.dumps([ids, options, answers]).encode()).hexdigest()
+    return {"question_ids": ids, "options": options, "answers": answers, "key_hash": digest}
+
+def _empty_state(key: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        **key,
+        "n": 0,
+        "sum_t": 0.0,
+        "sum_t2": 0.0,
+        "sum_x": [0.0] * len(key["question_ids"]),
+        "sum_xt": [0.0] * len(key["question_ids"]),
+        # One column per option plus a final "no answer / other" column
+        "option_counts": [[0] * (len(opts) + 1) for opts in key["options"]],
+        # Folded submission ID -> submitted_at, for IDs inside the safety window
+        "recent_ids": {},
+    }
+
+def _fold_chunk(state: Dict[str, Any], answer_rows: List[Dict[str, Any]]) -> None:
+    """Add one chunk of submissions (their ``answers`` dicts) to the running sums."""
+    import numpy as np
+
+    ids, options, key = state["question_ids"], state["options"], state["answers"]
+    m = len(ids)
+    # Columnar layout: chosen option index per (submission, item); -1 = none/other
+    chosen = np.full((len(answer_rows), m), -1, dtype=np.int32)
+    option_index = [{opt: i for i, opt in enumerate(opts)} for opts in options]
+    for r, answers in enumerate(answer_rows):
+        answers = answers or {}
+        for c, qid in enumerate(ids):
+            given = answers.get(qid)
+            if given is not None:
+                chosen[r, c] = option_index[c].get(str(given), -1)
+    correct_index = np.array(
+        [option_index[c].get(key[c], -2) if key[c] is not None else -2 for c in range(m)], dtype=np.int32
+    )
+    # Items without options are scored on the raw answer string
+    x = (chosen == correct_index).astype(np.float64)
+    for c, qid in enumerate(ids):
+        if not options[c] and key[c] is not None:
+            x[:, c] = [str((a or {}).get(qid)) == key[c] for a in answer_rows]
+    t = x.sum(axis=1)
+
+    state["n"] += len(answer_rows)
+    state["sum_t"] += float(t.sum())
+    state["sum_t2"] += float((t * t).sum())
+    state["sum_x"] = (np.asarray(state["sum_x"]) + x.sum(axis=0)).tolist()
+    state["sum_xt"] = (np.asarray(state["sum_xt"]) + x.T @ t).tolist()
+    for c in range(m):
+        width = len(options[c]) + 1
+        # Shift so -1 (no answer) lands in the last bucket
+        counts = np.bincount(np.where(chosen[:, c] < 0, width - 1, chosen[:, c]), minlength=width)
+        state["option_counts"][c] = (np.asarray(state["option_counts"][c]) + counts).tolist()
+
+def compute_items(state: Dict[str, Any], prompts: Dict[str, str]) -> List[Dict[str, Any]]:
+    import numpy as np
+
+    n = state["n"]
+    sum_x = np.asarray(state["sum_x"], dtype=np.float64)
+    sum_xt = np.asarray(state["sum_xt"], dtype=np.float64)
+    p = sum_x / n if n else np.zeros_like(sum_x)
+
+    # Item-rest correlation from sums: rest = total - item, and x*x = x
+    sum_r = state["sum_t"] - sum_x
+    sum_r2 = state["sum_t2"] - 2 * sum_xt + sum_x
+    sum_xr = sum_xt - sum_x
+    cov = n * sum_xr - sum_x * sum_r
+    var_x = n * sum_x - sum_x ** 2
+    var_r = n * sum_r2 - sum_r ** 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_pb = cov / np.sqrt(var_x * var_r)
+    r_pb = np.where(np.isfinite(r_pb), r_pb, np.nan)
+
+    items = []
+    for c, qid in enumerate(state["question_ids"]):
+        labels = state["options"][c] + [NO_ANSWER]
+        discrimination = None if np.isnan(r_pb[c]) else round(float(r_pb[c]), 4)
+        flags = []
+        if n:
+            if p[c] < HARD_P_VALUE:
+                flags.append("too_hard")
+            elif p[c] > EASY_P_VALUE:
+                flags.append("too_easy")
+        if discrimination is not None:
+            if discrimination < 0:
+                flags.append("negative_discrimination")
+            elif discrimination < LOW_DISCRIMINATION:
+                flags.append("low_discrimination")
+        items.append({
+            "question_id": qid,
+            "prompt": prompts.get(qid, ""),
+            "answer": state["answers"][c],
+            "p_value": round(float(p[c]), 4) if n else None,
+            "discrimination": discrimination,
+            "distractors": {label: int(count) for label, count in zip(labels, state["option_counts"][c])},
+            "flags": flags,
+        })
+    return items
+
+def refresh_quiz_analytics(db: Session, quiz_id: str, full: bool = False, chunk_size: int = CHUNK_SIZE) -> QuizItemAnalytics:
+    """Fold submissions not yet counted into the stored sums and recompute."""
+    questions = db.query(Question).filter(Question.quiz_id == quiz_id).order_by(Question.created_at, Question.id).all()
+    key = _answer_key(questions)
+
+    row = db.query(QuizItemAnalytics).filter(QuizItemAnalytics.quiz_id == quiz_id).first()
+    if row is None:
+        row = QuizItemAnalytics(quiz_id=quiz_id)
+        db.add(row)
+    state = row.state
+    # States saved before recent_ids existed cannot tell which re-read rows were counted
+    if full or not state or state.get("key_hash") != key["key_hash"] or "recent_ids" not in state:
+        state = _empty_state(key)
+        row.last_submitted_at, row.last_submission_id = None, None
+    recent: Dict[str, str] = state["recent_ids"]
+
+    query = db.query(Submission.id, Submission.submitted_at, Submission.answers).filter(Submission.quiz_id == quiz_id)
+    if row.last_submitted_at is not None:
+        query = query.filter(Submission.submitted_at >= row.last_submitted_at - SAFETY_WINDOW)
+    query = query.order_by(Submission.submitted_at, Submission.id)
+
+    chunk: List[Dict[str, Any]] = []
+    last: Optional[tuple] = None
+    for submission_id, submitted_at, answers in query.yield_per(chunk_size):
+        submission_id = str(submission_id)
+        if submission_id in recent:
+            continue
+        chunk.append(answers)
+        if submitted_at is not None:
+            recent[submission_id] = submitted_at.isoformat()
+            last = (submitted_at, submission_id)
+        if len(chunk) >= chunk_size:
+            _fold_chunk(state, chunk)
+            chunk = []
+    if chunk:
+        _fold_chunk(state, chunk)
+    # A late row can be older than the watermark; never move it backwards
+    if last is not None and (row.last_submitted_at is None or last[0] >= row.last_submitted_at):
+        row.last_submitted_at, row.last_submission_id = last
+    if row.last_submitted_at is not None:
+        horizon = row.last_submitted_at - SAFETY_WINDOW
+        state["recent_ids"] = {
+            sid: stamp for sid, stamp in recent.items() if datetime.fromisoformat(stamp) >= horizon
+        }
+
+    prompts = {str(q.id): q.question_text for q in questions}
+    row.state = state
+    flag_modified(row, "state")  # the sums may have been updated in place
+    row.submission_count = state["n"]
+    row.items = compute_items(state, prompts)
+    row.updated_at = datetime.utcnow()
+    db.commit()
+    db.refresh(row)
+    return row
\ No newline at end of file
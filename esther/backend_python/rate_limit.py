@@ -0,0 +1,173 @@
+# backend_python/rate_limit.py
+"""
+Token-bucket rate limiting keyed by route policy plus client IP or user.
+
+A policy such as ``"10/minute"`` allows bursts of 10 and refills at 10 per
+minute. Each bucket is two floats (tokens, last refill time), checked and
+updated in O(1). The in-memory store is per worker and LRU-bounded to
+``RATE_LIMIT_MAX_KEYS`` buckets. With ``RATE_LIMIT_BACKEND="sqlite"`` the
+buckets live in one SQLite file, so every worker on a host shares them.
+
+Limits are enforced in dependencies (or at the top of a handler) so a
+throttled request is rejected with 429 and ``Retry-After`` before any password
+hashing or database work happens.
+"""
+import math
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, NamedTuple
+
+from fastapi import Depends, HTTPException, Request, status
+from starlette.concurrency import run_in_threadpool
+
+from backend_python.settings_configuration import settings
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+class RatePolicy(NamedTuple):
+    capacity: float
+    refill_per_second: float
+
+    @classmethod
+    def parse(cls, spec: str) -> "RatePolicy":
+        """``"<count>/<second|minute|hour|day>"``, e.g. ``"5/minute"``"""
+        count, _, period = spec.partition("/")
+        seconds = PERIODS.get(period.strip().rstrip("s"))
+        if not seconds or float(count) <= 0:
+            raise ValueError(f"Invalid rate limit {spec!r}; expected e.g. '5/minute'")
+        return cls(float(count), float(count) / seconds)
+
+def _refill(tokens: float, stamp: float, policy: RatePolicy, now: float) -> float:
+    return min(policy.capacity, tokens + max(0.0, now - stamp) * policy.refill_per_second)
+
+def _retry_after(tokens: float, policy: RatePolicy) -> float:
+    return (1 - tokens) / policy.refill_per_second
+
+# ==================== Stores ====================
+class MemoryBucketStore:
+    """Per-worker buckets, least recently used evicted beyond ``maxsize``."""
+    blocking = False
+
+    def __init__(self, maxsize: int = 100_000):
+        self.maxsize = maxsize
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, policy: RatePolicy) -> float:
+        """Consume one token; returns 0 if allowed, else seconds until one is available."""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [policy.capacity, now]
+                if len(self._buckets) > self.maxsize:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+            tokens = _refill(bucket[0], bucket[1], policy, now)
+            bucket[1] = now
+            if tokens < 1:
+                bucket[0] = tokens
+                return _retry_after(tokens, policy)
+            bucket[0] = tokens - 1
+            return 0.0
+
+class SqliteBucketStore:
+    """Buckets shared by every worker on the host through one SQLite file."""
+    blocking = True
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._connect().execute(
+            "CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL NOT NULL, stamp REAL NOT NULL)"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")  # losing a bucket on crash is harmless
+            self._local.conn = conn
+        return conn
+
+    def take(self, key: str, policy: RatePolicy) -> float:
+        conn = self._connect()
+        now = time.time()  # wall clock: monotonic clocks are not comparable across processes
+        # IMMEDIATE takes the write lock up front, so read-modify-write is atomic
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT tokens, stamp FROM buckets WHERE key = ?", (key,)).fetchone()
+            tokens = _refill(row[0], row[1], policy, now) if row else policy.capacity
+            allowed = tokens >= 1
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (key, tokens, stamp) VALUES (?, ?, ?)",
+                (key, tokens - 1 if allowed else tokens, now),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return 0.0 if allowed else _retry_after(tokens, policy)
+
+# ==================== Limiter ====================
+class RateLimiter:
+    def __init__(self, store, policies: Dict[str, str], enabled: bool = True):
+        self.store = store
+        self.policies = {name: RatePolicy.parse(spec) for name, spec in policies.items()}
+        self.enabled = enabled
+
+    def check(self, policy_name: str, key: str) -> None:
+        """Raises 429 when ``key`` is over the named policy; unknown policies are unlimited."""
+        policy = self.policies.get(policy_name)
+        if not self.enabled or policy is None:
+            return
+        wait = self.store.take(f"{policy_name}:{key}", policy)
+        if wait > 0:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests, please try again later",
+                headers={"Retry-After": str(max(1, math.ceil(wait)))},
+            )
+
+    async def acheck(self, policy_name: str, key: str) -> None:
+        """``check`` for async handlers; a shared store's file I/O runs in the threadpool."""
+        if self.store.blocking:
+            await run_in_threadpool(self.check, policy_name, key)
+        else:
+            self.check(policy_name, key)
+
+@lru_cache(maxsize=1)
+def get_limiter() -> RateLimiter:
+    if settings.RATE_LIMIT_BACKEND == "sqlite":
+        store = SqliteBucketStore(settings.RATE_LIMIT_SQLITE_PATH)
+    else:
+        store = MemoryBucketStore(settings.RATE_LIMIT_MAX_KEYS)
+    return RateLimiter(store, settings.RATE_LIMITS, enabled=settings.RATE_LIMIT_ENABLED)
+
+def client_ip(request: Request) -> str:
+    if settings.RATE_LIMIT_TRUST_FORWARDED:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+# ==================== Dependencies ====================
+def limit_by_ip(policy_name: str):
+    """Dependency enforcing ``policy_name`` per client IP."""
+    async def dependency(request: Request) -> None:
+        await get_limiter().acheck(policy_name, client_ip(request))
+    return dependency
+
+def limit_by_user(policy_name: str):
+    """Dependency enforcing ``policy_name`` per authenticated user."""
+    from backend_python.auth_utils import get_current_user
+
+    async def dependency(current_user: dict = Depends(get_current_user)) -> dict:
+        await get_limiter().acheck(policy_name, str(current_user["_id"]))
+        return current_user
+    return dependency
@@ -0,0 +1,62 @@
+# backend_python/repositories/__init__.py
+"""
+Storage layer: one authoritative backend per domain behind an async interface.
+
+    users, courses, enrollments -> MongoDB
+    progress, quizzes           -> SQL
+
+Handlers take ``repos: Repositories = Depends(get_repositories)``; tests swap
+in ``in_memory_repositories()`` via ``app.dependency_overrides``.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+from .base import (
+    CourseRepository,
+    EnrollmentRepository,
+    ProgressRepository,
+    QuizRepository,
+    UserRepository,
+)
+
+@dataclass
+class Repositories:
+    users: UserRepository
+    courses: CourseRepository
+    enrollments: EnrollmentRepository
+    progress: ProgressRepository
+    quizzes: QuizRepository
+
+_repositories: Optional[Repositories] = None
+
+def get_repositories() -> Repositories:
+    """FastAPI dependency returning the process-wide production repositories."""
+    global _repositories
+    if _repositories is None:
+        from .mongo import MongoCourseRepository, MongoEnrollmentRepository, MongoUserRepository
+        from .sql import SqlProgressRepository, SqlQuizRepository
+        _repositories = Repositories(
+            users=MongoUserRepository(),
+            courses=MongoCourseRepository(),
+            enrollments=MongoEnrollmentRepository(),
+            progress=SqlProgressRepository(),
+            quizzes=SqlQuizRepository(),
+        )
+    return _repositories
+
+def in_memory_repositories(**data) -> Repositories:
+    """Fakes for tests; keyword arguments seed users, courses, enrollments or quizzes."""
+    from .memory import (
+        InMemoryCourseRepository,
+        InMemoryEnrollmentRepository,
+        InMemoryProgressRepository,
+        InMemoryQuizRepository,
+        InMemoryUserRepository,
+    )
+    return Repositories(
+        users=InMemoryUserRepository(data.get("users", ())),
+        courses=InMemoryCourseRepository(data.get("courses", ())),
+        enrollments=InMemoryEnrollmentRepository(data.get("enrollments", ())),
+        progress=InMemoryProgressRepository(),
+        quizzes=InMemoryQuizRepository(data.get("quizzes", ())),
+    )
@@ -0,0 +1,65 @@
+# backend_python/repositories/base.py
+"""
+Async storage interfaces, one per domain.
+
+Handlers depend on these instead of a particular store, so every domain has a
+single authoritative backend and can be swapped for the in-memory fakes in
+tests. ``get_many`` methods are the batched loaders: one query for any number
+of IDs.
+"""
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional
+
+Doc = Dict[str, Any]
+
+class UserRepository(ABC):
+    @abstractmethod
+    async def get(self, user_id: str) -> Optional[Doc]: ...
+
+    @abstractmethod
+    async def get_many(self, user_ids: Iterable[str]) -> Dict[str, Doc]: ...
+
+    @abstractmethod
+    async def get_by_email(self, email: str) -> Optional[Doc]: ...
+
+class CourseRepository(ABC):
+    @abstractmethod
+    async def get(self, course_id: str) -> Optional[Doc]: ...
+
+    @abstractmethod
+    async def get_many(self, course_ids: Iterable[str]) -> Dict[str, Doc]: ...
+
+class EnrollmentRepository(ABC):
+    @abstractmethod
+    async def list_for_user(self, user_id: str) -> List[Doc]: ...
+
+    @abstractmethod
+    async def get(self, user_id: str, course_id: str) -> Optional[Doc]: ...
+
+    @abstractmethod
+    async def user_ids_for_course(self, course_id: str, after: Optional[str] = None, limit: int = 1000) -> List[str]:
+        """Keyset page of the course's enrolled user IDs in ID order, starting after ``after``."""
+
+class ProgressRepository(ABC):
+    @abstractmethod
+    async def list_for_user(self, user_id: str) -> List[Doc]: ...
+
+    @abstractmethod
+    async def upsert(self, user_id: str, course_id: str, progress_data: Dict[str, Any]) -> Doc: ...
+
+class QuizRepository(ABC):
+    @abstractmethod
+    async def get_quiz(self, quiz_id: str) -> Optional[Doc]: ...
+
+    @abstractmethod
+    async def list_questions(self, quiz_id: str) -> List[Doc]: ...
+
+    @abstractmethod
+    async def add_question(self, quiz_id: str, prompt: str, options: List[str], answer: Optional[str]) -> Doc: ...
+
+    @abstractmethod
+    async def add_questions(self, quiz_id: str, questions: List[Doc]) -> int:
+        """Insert many {prompt, options, answer} rows in one transaction; returns the count."""
+
+    @abstractmethod
+    async def add_submission(self, quiz_id: str, user_id: str, answers: Dict[str, Any], score: int) -> Doc: ...
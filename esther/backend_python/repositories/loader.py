@@ -0,0 +1,70 @@
+# backend_python/repositories/loader.py
+"""
+Request-scoped batching loaders.
+
+``await loaders.users.load(id)`` calls issued in the same event-loop tick are
+coalesced into one ``get_many`` (a single ``$in`` / ``IN`` query), and results
+are memoized for the rest of the request. Handlers that gather over a list of
+rows therefore make a constant number of queries.
+"""
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional
+
+from fastapi import Depends
+
+from . import Repositories, get_repositories
+
+BatchFn = Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]]
+
+class DataLoader:
+    def __init__(self, batch_fn: BatchFn):
+        self.batch_fn = batch_fn
+        self._cache: Dict[Hashable, asyncio.Future] = {}
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+
+    def load(self, key: Hashable) -> "asyncio.Future[Optional[Any]]":
+        future = self._cache.get(key)
+        if future is not None:
+            return future
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._cache[key] = future
+        if not self._pending:
+            # Dispatch after everything scheduled in this tick has called load()
+            loop.call_soon(lambda: asyncio.ensure_future(self._dispatch()))
+        self._pending[key] = future
+        return future
+
+    async def load_many(self, keys: Iterable[Hashable]) -> List[Optional[Any]]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    async def _dispatch(self) -> None:
+        batch, self._pending = self._pending, {}
+        try:
+            results = await self.batch_fn(list(batch))
+        except Exception as e:
+            for key, future in batch.items():
+                # Failed keys are not memoized, so a later load can retry
+                self._cache.pop(key, None)
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(key))
+
+@dataclass
+class RequestLoaders:
+    users: DataLoader
+    courses: DataLoader
+
+def make_loaders(repos: Repositories) -> RequestLoaders:
+    return RequestLoaders(
+        users=DataLoader(repos.users.get_many),
+        courses=DataLoader(repos.courses.get_many),
+    )
+
+def get_loaders(repos: Repositories = Depends(get_repositories)) -> RequestLoaders:
+    """FastAPI dependency; FastAPI resolves it once per request, so memoization is request-scoped."""
+    return make_loaders(repos)
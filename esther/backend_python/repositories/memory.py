@@ -0,0 +1,130 @@
+# backend_python/repositories/memory.py
+"""
+In-memory implementations of every repository, for tests and local tooling.
+
+Each fake counts ``calls`` so tests can assert how many round trips a handler
+made, e.g. that a listing used one ``get_many`` instead of N ``get`` calls.
+"""
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+from uuid import uuid4
+
+from .base import (
+    CourseRepository,
+    Doc,
+    EnrollmentRepository,
+    ProgressRepository,
+    QuizRepository,
+    UserRepository,
+)
+
+class _Counted:
+    def __init__(self):
+        self.calls: Counter = Counter()
+
+class InMemoryUserRepository(_Counted, UserRepository):
+    def __init__(self, users: Iterable[Doc] = ()):
+        super().__init__()
+        self.users = {str(u["_id"]): u for u in users}
+
+    async def get(self, user_id: str) -> Optional[Doc]:
+        self.calls["get"] += 1
+        return self.users.get(user_id)
+
+    async def get_many(self, user_ids: Iterable[str]) -> Dict[str, Doc]:
+        self.calls["get_many"] += 1
+        return {i: self.users[i] for i in set(user_ids) if i in self.users}
+
+    async def get_by_email(self, email: str) -> Optional[Doc]:
+        self.calls["get_by_email"] += 1
+        normalized_email = email.lower().strip()
+        return next((u for u in self.users.values() if u.get("email") == normalized_email), None)
+
+class InMemoryCourseRepository(_Counted, CourseRepository):
+    def __init__(self, courses: Iterable[Doc] = ()):
+        super().__init__()
+        self.courses = {str(c["_id"]): c for c in courses}
+
+    async def get(self, course_id: str) -> Optional[Doc]:
+        self.calls["get"] += 1
+        return self.courses.get(course_id)
+
+    async def get_many(self, course_ids: Iterable[str]) -> Dict[str, Doc]:
+        self.calls["get_many"] += 1
+        return {i: self.courses[i] for i in set(course_ids) if i in self.courses}
+
+class InMemoryEnrollmentRepository(_Counted, EnrollmentRepository):
+    def __init__(self, enrollments: Iterable[Doc] = ()):
+        super().__init__()
+        self.enrollments = list(enrollments)
+
+    async def list_for_user(self, user_id: str) -> List[Doc]:
+        self.calls["list_for_user"] += 1
+        return [e for e in self.enrollments if e["user_id"] == user_id]
+
+    async def get(self, user_id: str, course_id: str) -> Optional[Doc]:
+        self.calls["get"] += 1
+        return next((e for e in self.enrollments if e["user_id"] == user_id and e["course_id"] == course_id), None)
+
+    async def user_ids_for_course(self, course_id: str, after: Optional[str] = None, limit: int = 1000) -> List[str]:
+        self.calls["user_ids_for_course"] += 1
+        user_ids = sorted(
+            str(e["user_id"]) for e in self.enrollments
+            if e["course_id"] == course_id and (after is None or str(e["user_id"]) > after)
+        )
+        return user_ids[:limit]
+
+class InMemoryProgressRepository(_Counted, ProgressRepository):
+    def __init__(self):
+        super().__init__()
+        self.rows: Dict[tuple, Doc] = {}
+
+    async def list_for_user(self, user_id: str) -> List[Doc]:
+        self.calls["list_for_user"] += 1
+        return [row for (uid, _), row in self.rows.items() if uid == user_id]
+
+    async def upsert(self, user_id: str, course_id: str, progress_data: Dict[str, Any]) -> Doc:
+        self.calls["upsert"] += 1
+        row = {"user_id": user_id, "course_id": course_id, "progress_data": progress_data}
+        self.rows[(user_id, course_id)] = row
+        return row
+
+class InMemoryQuizRepository(_Counted, QuizRepository):
+    def __init__(self, quizzes: Iterable[Doc] = ()):
+        super().__init__()
+        self.quizzes = {q["id"]: q for q in quizzes}
+        self.questions: List[Doc] = []
+        self.submissions: List[Doc] = []
+
+    async def get_quiz(self, quiz_id: str) -> Optional[Doc]:
+        self.calls["get_quiz"] += 1
+        return self.quizzes.get(quiz_id)
+
+    async def list_questions(self, quiz_id: str) -> List[Doc]:
+        self.calls["list_questions"] += 1
+        return [q for q in self.questions if q["quiz_id"] == quiz_id]
+
+    async def add_question(self, quiz_id: str, prompt: str, options: List[str], answer: Optional[str]) -> Doc:
+        self.calls["add_question"] += 1
+        question = {"id": str(uuid4()), "quiz_id": quiz_id, "prompt": prompt, "options": options, "answer": answer}
+        self.questions.append(question)
+        return question
+
+    async def add_questions(self, quiz_id: str, questions: List[Doc]) -> int:
+        self.calls["add_questions"] += 1
+        for q in questions:
+            self.questions.append({
+                "id": str(uuid4()), "quiz_id": quiz_id, "prompt": q["prompt"],
+                "options": q.get("options") or [], "answer": q.get("answer"),
+            })
+        return len(questions)
+
+    async def add_submission(self, quiz_id: str, user_id: str, answers: Dict[str, Any], score: int) -> Doc:
+        self.calls["add_submission"] += 1
+        submission = {
+            "id": str(uuid4()), "quiz_id": quiz_id, "user_id": user_id,
+            "answers": answers, "score": score, "submitted_at": datetime.utcnow(),
+        }
+        self.submissions.append(submission)
+        return submission
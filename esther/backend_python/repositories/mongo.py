@@ -0,0 +1,53 @@
+# backend_python/repositories/mongo.py
+"""MongoDB backends: users, courses and enrollments live in Mongo."""
+from typing import Dict, Iterable, List, Optional
+
+from backend_python.mongodb_db import (
+    get_courses_collection,
+    get_enrollments_collection,
+    get_users_collection,
+)
+from backend_python.course_content import COURSE_OUTLINE_PROJECTION
+from .base import CourseRepository, Doc, EnrollmentRepository, UserRepository
+
+async def _find_many(collection, ids: Iterable[str], projection: Optional[dict] = None) -> Dict[str, Doc]:
+    unique_ids = list({str(i) for i in ids})
+    if not unique_ids:
+        return {}
+    docs = await collection.find({"_id": {"$in": unique_ids}}, projection).to_list(len(unique_ids))
+    return {str(doc["_id"]): doc for doc in docs}
+
+class MongoUserRepository(UserRepository):
+    async def get(self, user_id: str) -> Optional[Doc]:
+        return await get_users_collection().find_one({"_id": user_id})
+
+    async def get_many(self, user_ids: Iterable[str]) -> Dict[str, Doc]:
+        return await _find_many(get_users_collection(), user_ids)
+
+    async def get_by_email(self, email: str) -> Optional[Doc]:
+        normalized_email = email.lower().strip()
+        return await get_users_collection().find_one({"email": normalized_email})
+
+class MongoCourseRepository(CourseRepository):
+    """Course reads return outlines; lesson bodies are fetched separately."""
+
+    async def get(self, course_id: str) -> Optional[Doc]:
+        return await get_courses_collection().find_one({"_id": course_id}, COURSE_OUTLINE_PROJECTION)
+
+    async def get_many(self, course_ids: Iterable[str]) -> Dict[str, Doc]:
+        return await _find_many(get_courses_collection(), course_ids, COURSE_OUTLINE_PROJECTION)
+
+class MongoEnrollmentRepository(EnrollmentRepository):
+    async def list_for_user(self, user_id: str) -> List[Doc]:
+        return await get_enrollments_collection().find({"user_id": user_id}).to_list(length=1000)
+
+    async def get(self, user_id: str, course_id: str) -> Optional[Doc]:
+        return await get_enrollments_collection().find_one({"user_id": user_id, "course_id": course_id})
+
+    async def user_ids_for_course(self, course_id: str, after: Optional[str] = None, limit: int = 1000) -> List[str]:
+        query = {"course_id": course_id}
+        if after is not None:
+            query["user_id"] = {"$gt": after}
+        # Covered by the (course_id, user_id) index
+        cursor = get_enrollments_collection().find(query, {"_id": 0, "user_id": 1}).sort("user_id", 1).limit(limit)
+        return [str(doc["user_id"]) for doc in await cursor.to_list(length=limit)]
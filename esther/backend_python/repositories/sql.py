@@ -0,0 +1,126 @@
+# backend_python/repositories/sql.py
+"""
+SQL backends: progress and quizzes live in the SQL database.
+
+Sessions are synchronous, so each call runs in the threadpool with its own
+short-lived session and returns plain dicts rather than ORM objects.
+"""
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from uuid import uuid4
+
+from starlette.concurrency import run_in_threadpool
+
+from backend_python.database import SessionLocal
+from backend_python.gradebook import QUIZ_MAX_SCORE, invalidate_gradebook, record_score
+from backend_python.models import Progress, Question, Quiz, Submission
+from .base import Doc, ProgressRepository, QuizRepository
+
+class _SqlRepository:
+    def __init__(self, session_factory: Callable = SessionLocal):
+        self.session_factory = session_factory
+
+    async def _run(self, fn: Callable, *args):
+        def call():
+            db = self.session_factory()
+            try:
+                return fn(db, *args)
+            finally:
+                db.close()
+        return await run_in_threadpool(call)
+
+def _progress_doc(row: Progress) -> Doc:
+    return {"user_id": str(row.user_id), "course_id": str(row.course_id), "progress_data": row.progress_data or {}}
+
+def _question_doc(row: Question) -> Doc:
+    return {
+        "id": str(row.id),
+        "quiz_id": str(row.quiz_id),
+        "prompt": row.question_text,
+        "options": row.options or [],
+        "answer": row.correct_answer,
+    }
+
+def _submission_doc(row: Submission) -> Doc:
+    return {
+        "id": str(row.id),
+        "quiz_id": str(row.quiz_id),
+        "user_id": str(row.user_id),
+        "answers": row.answers or {},
+        "score": row.score,
+        "submitted_at": row.submitted_at,
+    }
+
+class SqlProgressRepository(_SqlRepository, ProgressRepository):
+    async def list_for_user(self, user_id: str) -> List[Doc]:
+        def query(db):
+            return [_progress_doc(r) for r in db.query(Progress).filter(Progress.user_id == user_id).all()]
+        return await self._run(query)
+
+    async def upsert(self, user_id: str, course_id: str, progress_data: Dict[str, Any]) -> Doc:
+        def write(db):
+            existing = db.query(Progress).filter(Progress.user_id == user_id, Progress.course_id == course_id).first()
+            if not existing:
+                existing = Progress(user_id=user_id, course_id=course_id, progress_data=progress_data)
+                db.add(existing)
+            else:
+                existing.progress_data = progress_data
+            db.commit()
+            db.refresh(existing)
+            return _progress_doc(existing)
+        return await self._run(write)
+
+class SqlQuizRepository(_SqlRepository, QuizRepository):
+    async def get_quiz(self, quiz_id: str) -> Optional[Doc]:
+        def query(db):
+            q = db.query(Quiz).filter(Quiz.id == quiz_id).first()
+            return {"id": str(q.id), "course_id": str(q.course_id), "title": q.title, "description": q.description} if q else None
+        return await self._run(query)
+
+    async def list_questions(self, quiz_id: str) -> List[Doc]:
+        def query(db):
+            return [_question_doc(r) for r in db.query(Question).filter(Question.quiz_id == quiz_id).all()]
+        return await self._run(query)
+
+    async def add_question(self, quiz_id: str, prompt: str, options: List[str], answer: Optional[str]) -> Doc:
+        def write(db):
+            question = Question(id=str(uuid4()), quiz_id=quiz_id, question_text=prompt, options=options, correct_answer=answer)
+            db.add(question)
+            db.commit()
+            db.refresh(question)
+            return _question_doc(question)
+        return await self._run(write)
+
+    async def add_questions(self, quiz_id: str, questions: List[Doc]) -> int:
+        def write(db):
+            now = datetime.utcnow()
+            # One executemany INSERT and one commit for the whole bank
+            db.bulk_insert_mappings(Question, [
+                {
+                    "id": str(uuid4()),
+                    "quiz_id": quiz_id,
+                    "question_text": q["prompt"],
+                    "options": q.get("options") or [],
+                    "correct_answer": q.get("answer"),
+                    "created_at": now,
+                }
+                for q in questions
+            ])
+            db.commit()
+            return len(questions)
+        return await self._run(write)
+
+    async def add_submission(self, quiz_id: str, user_id: str, answers: Dict[str, Any], score: int) -> Doc:
+        def write(db):
+            s = Submission(id=str(uuid4()), user_id=user_id, quiz_id=quiz_id, answers=answers, score=score)
+            db.add(s)
+            # The gradebook cell is written in the same transaction as the submission
+            quiz = db.query(Quiz.course_id).filter(Quiz.id == quiz_id).first()
+            if quiz:
+                record_score(db, str(quiz.course_id), user_id, "quiz", quiz_id, score, QUIZ_MAX_SCORE, keep_best=True)
+            db.commit()
+            if quiz:
+                invalidate_gradebook(quiz.course_id)
+            db.refresh(s)
+            return _submission_doc(s)
+        return await self._run(write)
@@ -0,0 +1,82 @@
+# backend_python/router_registry.py
+"""
+Config-driven router registry.
+
+Each router is imported only when ``settings.ENABLED_ROUTERS`` enables it, so a
+lean deployment (auth-only, catalogue-only) never pays the import cost or the
+memory of the routers it does not serve. ``mount_routers`` times every import
+and returns the costs; ``log_import_report`` logs them at DEBUG.
+"""
+import importlib
+import logging
+import time
+from typing import Dict, List, NamedTuple, Tuple, Union
+
+from fastapi import FastAPI
+
+logger = logging.getLogger(__name__)
+
+class RouterSpec(NamedTuple):
+    prefix: str
+    tags: List[str]
+    default: bool = True
+
+# Order matters: routers are included in this order, and the first matching
+# route wins.
+ROUTERS: Dict[str, RouterSpec] = {
+    "auth": RouterSpec("/api/auth", ["auth"]),
+    "users": RouterSpec("/api/users", ["users"]),
+    "courses": RouterSpec("/api/courses", ["courses"]),
+    "enrollments": RouterSpec("/api/enrollments", ["enrollments"]),
+    "progress": RouterSpec("/api/progress", ["progress"]),
+    "accessibility": RouterSpec("/api/accessibility", ["accessibility"]),
+    "quizzes": RouterSpec("/api/quizzes", ["quizzes"]),
+    "mentorship": RouterSpec("/api/mentorship", ["mentorship"]),
+    "admin": RouterSpec("/api/admin", ["admin"]),
+    "modules": RouterSpec("/api", ["modules"]),
+    "assignments": RouterSpec("/api", ["assignments"]),
+    "announcements": RouterSpec("/api", ["announcements"]),
+    "discussions": RouterSpec("/api", ["discussions"]),
+    "resources": RouterSpec("/api", ["resources"]),
+    "pages": RouterSpec("/api", ["pages"]),
+    "gradebook": RouterSpec("/api", ["gradebook"]),
+    "dashboard": RouterSpec("/api/dashboard", ["dashboard"]),
+    # Mongo-only, read-only catalogue. It serves the same paths as ``courses``
+    # and the section routers, so it is opt-in for catalogue-only nodes.
+    "courses_mongo": RouterSpec("/api/courses", ["courses"], default=False),
+}
+
+def enabled_router_names(value: Union[str, List[str]]) -> List[str]:
+    """Resolve an ENABLED_ROUTERS setting to registry names, in registry order."""
+    if isinstance(value, str):
+        value = [name.strip() for name in value.split(",")]
+    names = {name for name in value if name}
+    if "all" in names:
+        names.discard("all")
+        names |= {name for name, spec in ROUTERS.items() if spec.default}
+    unknown = sorted(names - ROUTERS.keys())
+    if unknown:
+        raise ValueError(f"Unknown routers in ENABLED_ROUTERS: {', '.join(unknown)}")
+    return [name for name in ROUTERS if name in names]
+
+def mount_routers(app: FastAPI, names: List[str]) -> List[Tuple[str, float]]:
+    """Import and include each named router; returns (name, import ms) per router."""
+    costs = []
+    for name in names:
+        spec = ROUTERS[name]
+        start = time.perf_counter()
+        module = importlib.import_module(f"backend_python.routers.{name}")
+        costs.append((name, (time.perf_counter() - start) * 1000))
+        app.include_router(module.router, prefix=spec.prefix, tags=spec.tags)
+    return costs
+
+def log_import_report(costs: List[Tuple[str, float]]) -> None:
+    """Per-router import cost at DEBUG (``LOG_LEVEL=DEBUG`` to see it)."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    # Modules shared between routers are charged to the first router that imports them
+    total = sum(ms for _, ms in costs)
+    logger.debug(
+        "Mounted %d routers in %.1f ms", len(costs), total,
+        extra={"router_import_ms": {name: round(ms, 1) for name, ms in sorted(costs, key=lambda c: c[1], reverse=True)}},
+    )
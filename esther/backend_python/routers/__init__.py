@@ -1,16 +1,2 @@
-from . import auth
-from . import users
-from . import courses
-from . import progress
-from . import accessibility
-from . import mentorship
-from . import quizzes
-from . import enrollments
-from . import admin
-from . import modules
-from . import assignments
-from . import announcements
-from . import discussions
-from . import resources
-from . import pages
-from . import courses_mongo
\ No newline at end of file
+# Routers are imported individually (``from backend_python.routers import auth``)
+# so that loading one router does not import all of them.
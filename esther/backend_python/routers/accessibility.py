@@ -1,29 +1,27 @@
 # backend_python/routers/accessibility.py
+from datetime import datetime
+
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from backend_python.database import get_db
+from backend_python.mongodb_db import get_users_collection
 from backend_python.auth_utils import get_current_user
-from backend_python.models import AccessibilitySettings, User
 from backend_python.schemas import AccessibilitySettingsIn, AccessibilitySettingsOut
+from backend_python.user_settings import load_accessibility_settings, save_accessibility_settings
 
 router = APIRouter()
 
 @router.get("/", response_model=AccessibilitySettingsOut)
-def get_settings(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    s = db.query(AccessibilitySettings).filter(AccessibilitySettings.user_id == str(current_user.id)).first()
-    if not s:
-        return AccessibilitySettingsOut(user_id=current_user.id, settings={})
-    return AccessibilitySettingsOut(user_id=current_user.id, settings=s.settings or {})
+def get_settings(db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+    user_id = str(current_user["_id"])
+    return AccessibilitySettingsOut(user_id=user_id, settings=load_accessibility_settings(db, user_id))
 
 @router.put("/", response_model=AccessibilitySettingsOut)
-def update_settings(payload: AccessibilitySettingsIn, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    s = db.query(AccessibilitySettings).filter(AccessibilitySettings.user_id == str(current_user.id)).first()
-    if not s:
-        s = AccessibilitySettings(user_id=str(current_user.id), settings=payload.settings)
-        db.add(s)
-    else:
-        s.settings = payload.settings
-    db.commit()
-    db.refresh(s)
-    return AccessibilitySettingsOut(user_id=current_user.id, settings=s.settings or {})
+async def update_settings(payload: AccessibilitySettingsIn, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+    user_id = str(current_user["_id"])
+    settings = await run_in_threadpool(save_accessibility_settings, db, user_id, payload.settings)
+    # Broadcasts the change so other workers drop their cached settings
+    await get_users_collection().update_one({"_id": current_user["_id"]}, {"$set": {"updated_at": datetime.utcnow()}})
+    return AccessibilitySettingsOut(user_id=user_id, settings=settings)
@@ -1,8 +1,11 @@
 # backend_python/routers/admin.py
-from fastapi import APIRouter, Depends, HTTPException, Body
+from fastapi import APIRouter, Depends, HTTPException, Body, Query
+from fastapi.responses import StreamingResponse
 from typing import List
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from uuid import UUID
+import json
+from datetime import datetime
 from backend_python.mongodb_db import (
     get_users_collection, get_courses_collection,
     get_enrollments_collection, get_progress_collection
@@ -11,12 +14,20 @@ from backend_python.auth_utils import get_current_user
 from backend_python.mongodb_models import UserDocument, UserRole
 from backend_python.schemas import UserResponse
 from backend_python.dependencies import require_role
+from backend_python.enrollment_store import bulk_enroll, resolve_users
 
 router = APIRouter()
 
 class UpdateUserRole(BaseModel):
     role: str
 
+MAX_BULK_ENROLLMENTS = 100_000
+
+class BulkEnrollIn(BaseModel):
+    user_ids: List[str] = []
+    emails: List[str] = []
+    course_ids: List[str] = Field(..., min_length=1)
+
 @router.get("/stats")
 async def get_platform_stats(current_user: UserDocument = Depends(require_role(["administrator"]))):
     """Get platform statistics - admin only"""
@@ -75,7 +86,7 @@ async def update_user_role(
     # Update role
     await users_collection.update_one(
         {"_id": user_id},
-        {"$set": {"role": payload.role}}
+        {"$set": {"role": payload.role, "updated_at": datetime.utcnow()}}
     )
     
     # Fetch updated user
@@ -88,3 +99,37 @@ async def update_user_role(
         role=updated_doc.get("role", "learner"),
         created_at=updated_user.created_at
     )
+
+@router.post("/enrollments/bulk")
+async def bulk_enroll_users(
+    payload: BulkEnrollIn,
+    stream: bool = Query(False, description="Stream newline-delimited JSON progress after each batch"),
+    current_user: UserDocument = Depends(require_role(["administrator"]))
+):
+    """Enroll a cohort (user ids and/or emails) into several courses - admin only"""
+    user_ids, unknown_users = await resolve_users(payload.user_ids, payload.emails)
+    course_ids = list(dict.fromkeys(payload.course_ids))
+    found_courses = {
+        doc["_id"] async for doc in get_courses_collection().find({"_id": {"$in": course_ids}}, {"_id": 1})
+    }
+    unknown_courses = [cid for cid in course_ids if cid not in found_courses]
+    course_ids = [cid for cid in course_ids if cid in found_courses]
+    
+    if len(user_ids) * len(course_ids) > MAX_BULK_ENROLLMENTS:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BULK_ENROLLMENTS} enrollments per request")
+    
+    unresolved = {"unknown_users": unknown_users, "unknown_courses": unknown_courses}
+    progress = bulk_enroll(user_ids, course_ids)
+    
+    if stream:
+        async def lines():
+            summary = {"processed": 0, "total": 0, "created": 0, "existing": 0, "failed": 0}
+            async for summary in progress:
+                yield json.dumps(summary) + "\n"
+            yield json.dumps({**summary, **unresolved, "done": True}) + "\n"
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+    
+    summary = {"processed": 0, "total": 0, "created": 0, "existing": 0, "failed": 0}
+    async for summary in progress:
+        pass
+    return {**summary, **unresolved}
\ No newline at end of file
@@ -1,24 +1,84 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from uuid import UUID
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
 from backend_python.database import get_db
-from backend_python.models import Announcement, User
+from backend_python.models import Announcement
 from backend_python.schemas import AnnouncementCreate, AnnouncementResponse
 from backend_python.auth_utils import get_current_user
+from backend_python.repositories import Repositories, get_repositories
+from backend_python.repositories.loader import RequestLoaders, get_loaders
+from backend_python.announcement_hub import announcement_hub, sse_stream
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
 
 router = APIRouter()
 
+def course_announcements(db: Session, course_id: str, since: Optional[datetime], limit: int) -> List[Announcement]:
+    q = db.query(Announcement).filter(Announcement.course_id == course_id)
+    if since is not None:
+        # Ascending, so a truncated page is followed by the next one rather
+        # than skipping everything between since and the newest `limit`
+        return q.filter(Announcement.created_at > since).order_by(Announcement.created_at).limit(limit).all()
+    return q.order_by(Announcement.created_at.desc()).limit(limit).all()
+
 @router.get("/courses/{course_id}/announcements", response_model=List[AnnouncementResponse])
-def get_course_announcements(course_id: UUID, db: Session = Depends(get_db)):
-    announcements = db.query(Announcement).filter(Announcement.course_id == str(course_id)).order_by(Announcement.created_at.desc()).all()
-    return announcements
+async def get_course_announcements(
+    course_id: UUID,
+    since: Optional[datetime] = Query(
+        None, description="Only announcements created after this time, oldest first; pass the last createdAt to page forward"
+    ),
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    loaders: RequestLoaders = Depends(get_loaders)
+):
+    announcements = await run_in_threadpool(course_announcements, db, str(course_id), since, limit)
+    # One batched query for all authors
+    authors = await loaders.users.load_many(str(a.author_id) for a in announcements)
+    return [
+        AnnouncementResponse.model_validate(a).model_copy(update={"author_name": (author or {}).get("name")})
+        for a, author in zip(announcements, authors)
+    ]
+
+@router.get("/courses/{course_id}/announcements/stream")
+async def stream_course_announcements(course_id: UUID, request: Request):
+    """Server-sent events: pushes each new announcement for one course"""
+    return StreamingResponse(
+        sse_stream(announcement_hub, [str(course_id)], request.is_disconnected),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+@router.get("/announcements/stream")
+async def stream_my_announcements(
+    request: Request,
+    current_user: dict = Depends(get_current_user),
+    repos: Repositories = Depends(get_repositories)
+):
+    """Server-sent events: new announcements across the current user's enrolled courses"""
+    enrollments = await repos.enrollments.list_for_user(str(current_user["_id"]))
+    course_ids = [str(e["course_id"]) for e in enrollments]
+    return StreamingResponse(
+        sse_stream(announcement_hub, course_ids, request.is_disconnected),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
 
 @router.post("/announcements", response_model=AnnouncementResponse)
-def create_announcement(payload: AnnouncementCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    announcement = Announcement(**payload.dict(), author_id=str(current_user.id))
-    db.add(announcement)
-    db.commit()
-    db.refresh(announcement)
-    return announcement
+async def create_announcement(payload: AnnouncementCreate, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+    def save():
+        announcement = Announcement(**payload.dict(), author_id=str(current_user["_id"]))
+        db.add(announcement)
+        db.commit()
+        db.refresh(announcement)
+        return announcement
+    
+    announcement = await run_in_threadpool(save)
+    response = AnnouncementResponse.model_validate(announcement).model_copy(update={"author_name": current_user.get("name")})
+    # Pushed only after the commit succeeded
+    announcement_hub.publish(str(announcement.course_id), response.model_dump(mode="json", by_alias=True))
+    return response
\ No newline at end of file
@@ -5,9 +5,10 @@ from typing import List
 
 from backend_python.database import get_db
 from backend_python.models import Assignment
-from backend_python.schemas import AssignmentCreate, AssignmentResponse
+from backend_python.schemas import AssignmentCreate, AssignmentGradeIn, AssignmentResponse
 from backend_python.auth_utils import get_current_user
 from backend_python.models import User
+from backend_python.gradebook import invalidate_gradebook, record_score
 
 router = APIRouter()
 
@@ -22,6 +23,8 @@ def create_assignment(payload: AssignmentCreate, db: Session = Depends(get_db),
     db.add(assignment)
     db.commit()
     db.refresh(assignment)
+    # New gradebook column
+    invalidate_gradebook(assignment.course_id)
     return assignment
 
 @router.get("/assignments/{assignment_id}", response_model=AssignmentResponse)
@@ -30,3 +33,26 @@ def get_assignment(assignment_id: UUID, db: Session = Depends(get_db)):
     if not assignment:
         raise HTTPException(status_code=404, detail="Assignment not found")
     return assignment
+
+@router.put("/assignments/{assignment_id}/grades/{user_id}")
+def grade_assignment(
+    assignment_id: UUID,
+    user_id: UUID,
+    payload: AssignmentGradeIn,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """Record (or replace) a student's grade; updates the course gradebook"""
+    if current_user.get("role", "learner") not in ["mentor", "administrator"]:
+        raise HTTPException(status_code=403, detail="Only mentors and administrators can grade assignments")
+    assignment = db.query(Assignment).filter(Assignment.id == str(assignment_id)).first()
+    if not assignment:
+        raise HTTPException(status_code=404, detail="Assignment not found")
+    max_score = assignment.points or 100
+    if payload.score > max_score:
+        raise HTTPException(status_code=400, detail=f"Score cannot exceed {max_score} points")
+    
+    entry = record_score(db, str(assignment.course_id), str(user_id), "assignment", str(assignment.id), payload.score, max_score)
+    db.commit()
+    invalidate_gradebook(assignment.course_id)
+    return {"assignment_id": str(assignment.id), "user_id": str(user_id), "score": entry.score, "max_score": entry.max_score}
\ No newline at end of file
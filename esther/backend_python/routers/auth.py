@@ -1,9 +1,10 @@
 # routers/auth.py
+import logging
 from fastapi import APIRouter, HTTPException, status, Depends
 from pydantic import BaseModel, EmailStr, Field
 from uuid import uuid4, UUID
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from backend_python.mongodb_db import get_users_collection
 from backend_python.mongodb_models import UserRole
@@ -14,8 +15,10 @@ from backend_python.auth_utils import (
     create_refresh_token,
     decode_token
 )
+from backend_python.rate_limit import get_limiter, limit_by_ip
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 class SignupIn(BaseModel):
     email: EmailStr
@@ -43,6 +46,8 @@ class LoginResponse(BaseModel):
     refresh_token: str
     token_type: str = "bearer"
     user: UserResponse
+    # Delivered with the tokens so the first page can apply them without another request
+    accessibility_settings: Dict[str, Any] = {}
 
 
 class RefreshIn(BaseModel):
@@ -54,12 +59,14 @@ class RefreshOut(BaseModel):
     refresh_token: str
     token_type: str = "bearer"
 
-@router.post("/login", response_model=LoginResponse)
+@router.post("/login", response_model=LoginResponse, dependencies=[Depends(limit_by_ip("login"))])
 async def login(payload: LoginIn):
     users_collection = get_users_collection()
+    normalized_email = payload.email.lower().strip()
+    # Per account as well as per IP, before any password hashing
+    await get_limiter().acheck("login_account", normalized_email)
     
     try:
-        normalized_email = payload.email.lower().strip()
         user_doc = await users_collection.find_one(
             {"email": {"$regex": f"^{normalized_email}$", "$options": "i"}}
         )
@@ -80,6 +87,9 @@ async def login(payload: LoginIn):
 
         access_token = create_access_token(str(user_doc["_id"]))
         refresh_token = create_refresh_token(str(user_doc["_id"]))
+        # Imported here: it pulls in SQLAlchemy, which /health and signup never need
+        from backend_python.user_settings import get_accessibility_settings
+        accessibility_settings = await get_accessibility_settings(str(user_doc["_id"]))
 
         return {
             "access_token": access_token,
@@ -91,19 +101,20 @@ async def login(payload: LoginIn):
                 "name": user_doc.get("name"),
                 "role": user_doc.get("role", "learner"),
                 "created_at": user_doc.get("created_at", datetime.utcnow())
-            }
+            },
+            "accessibility_settings": accessibility_settings
         }
         
     except HTTPException:
         raise
-    except Exception as e:
-        print(f"Login error: {str(e)}")
+    except Exception:
+        logger.exception("Login error")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
         )
 
-@router.post("/signup", response_model=UserResponse)
+@router.post("/signup", response_model=UserResponse, dependencies=[Depends(limit_by_ip("signup"))])
 async def signup(payload: SignupIn):
     users_collection = get_users_collection()
     
@@ -143,15 +154,15 @@ async def signup(payload: SignupIn):
         
     except HTTPException:
         raise
-    except Exception as e:
-        print(f"Signup error: {str(e)}")
+    except Exception:
+        logger.exception("Signup error")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
         )
 
 
-@router.post("/refresh", response_model=RefreshOut)
+@router.post("/refresh", response_model=RefreshOut, dependencies=[Depends(limit_by_ip("refresh"))])
 async def refresh_token(payload: RefreshIn):
     """Exchange a valid refresh token for a new access token (and rotate refresh token)."""
     try:
@@ -162,6 +173,7 @@ async def refresh_token(payload: RefreshIn):
         user_id = token_payload.get("sub")
         if not user_id:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
+        await get_limiter().acheck("refresh_user", str(user_id))
 
         users_collection = get_users_collection()
         user_doc = await users_collection.find_one({"_id": user_id})
@@ -179,6 +191,6 @@ async def refresh_token(payload: RefreshIn):
 
     except HTTPException:
         raise
-    except Exception as e:
-        print(f"Refresh token error: {str(e)}")
+    except Exception:
+        logger.exception("Refresh token error")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
\ No newline at end of file
@@ -1,14 +1,32 @@
 # backend_python/routers/courses.py
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, status
+from typing import Any, Dict, List, Optional, Union
 from datetime import datetime
+from urllib.parse import urlencode
 from uuid import uuid4
 from pydantic import BaseModel
 
 from backend_python.mongodb_db import get_courses_collection, get_users_collection
+from backend_python.course_content import (
+    COURSE_OUTLINE_PROJECTION,
+    CourseSection,
+    delete_module_lessons,
+    get_lesson,
+    get_outline,
+    list_section,
+    rebuild_outline,
+    split_course,
+    store_course_items,
+    store_module_lessons,
+)
+from backend_python.search_index import search_courses
+from backend_python.catalogue import course_changed, get_facets
+from backend_python.http_cache import conditional_json
 from backend_python.mongodb_models import CourseDocument
 from backend_python.schemas import CourseResponse
 from backend_python.auth_utils import get_current_user
+from backend_python.repositories.loader import RequestLoaders, get_loaders
+from backend_python.accessibility_features import features_for_settings, features_query, normalize_features
 
 router = APIRouter()
 
@@ -18,7 +36,8 @@ class CourseCreate(BaseModel):
     description: Optional[str] = None
     category: Optional[str] = "general"
     difficulty: Optional[str] = "beginner"
-    accessibility_features: Optional[dict] = {}
+    # List of feature names; the legacy {"feature": true} dict form is accepted too
+    accessibility_features: Optional[Union[List[str], Dict[str, Any]]] = []
     duration: Optional[int] = 0
     modules: Optional[List[dict]] = []
 
@@ -46,16 +65,22 @@ async def create_course(payload: CourseCreate, current_user: dict = Depends(get_
         "category": payload.category or "general",
         "difficulty": payload.difficulty or "beginner",
         "instructor_id": str(current_user["_id"]),
-        "accessibility_features": payload.accessibility_features or {},
+        "accessibility_features": normalize_features(payload.accessibility_features),
         "duration": payload.duration or 0,
         "modules": payload.modules or [],
         "is_published": False,
+        "enrollment_count": 0,
         "created_at": datetime.utcnow(),
         "updated_at": datetime.utcnow()
     }
     
+    # Lesson bodies go to the lessons collection; the course keeps the outline
+    course_doc, items = split_course(course_doc)
+    await store_course_items(items)
+    
     # Insert into MongoDB
     await courses_collection.insert_one(course_doc)
+    course_changed(course_doc)
     
     # Return course response
     return {
@@ -84,7 +109,7 @@ async def get_my_courses(current_user: dict = Depends(get_current_user)):
     instructor_id = str(current_user["_id"])
     
     # Find all courses by this instructor
-    cursor = courses_collection.find({"instructor_id": instructor_id})
+    cursor = courses_collection.find({"instructor_id": instructor_id}, COURSE_OUTLINE_PROJECTION)
     courses = await cursor.to_list(length=1000)
     
     # Convert to response format
@@ -97,7 +122,7 @@ async def get_my_courses(current_user: dict = Depends(get_current_user)):
             "category": course.get("category", "general"),
             "difficulty": course.get("difficulty", "beginner"),
             "instructor_id": course.get("instructor_id", ""),
-            "accessibility_features": course.get("accessibility_features", {}),
+            "accessibility_features": course.get("accessibility_features", []),
             "duration": course.get("duration", 0),
             "modules": course.get("modules", []),
             "is_published": course.get("is_published", False),
@@ -107,71 +132,193 @@ async def get_my_courses(current_user: dict = Depends(get_current_user)):
     
     return result
 
+def _query_key(prefix: str, request: Request) -> str:
+    """Cache key for a listing: the path's prefix plus its sorted query string"""
+    return f"{prefix}:{urlencode(sorted(request.query_params.multi_items()))}"
+
 @router.get("/")
 async def list_courses(
+    request: Request,
     category: Optional[str] = Query(None),
     difficulty: Optional[str] = Query(None),
-    instructor_id: Optional[str] = Query(None)
+    instructor_id: Optional[str] = Query(None),
+    features: Optional[str] = Query(None, description="Comma-separated accessibility features the course must all support"),
+    sort: Optional[str] = Query(None, pattern="^(popular|newest)$"),
+    loaders: RequestLoaders = Depends(get_loaders)
+):
+    """List all courses from MongoDB, with an ETag so an unchanged listing is a 304"""
+    async def build():
+        courses_collection = get_courses_collection()
+    
+        # Build query
+        query = {}
+        if features:
+            query["accessibility_features"] = {"$all": normalize_features(features)}
+        if category:
+            query["category"] = category
+        if difficulty:
+            query["difficulty"] = difficulty
+        if instructor_id:
+            query["instructor_id"] = instructor_id
+    
+        # Fetch courses
+        cursor = courses_collection.find(query, COURSE_OUTLINE_PROJECTION)
+        if sort == "popular":
+            # Served by the (enrollment_count, _id) index; no count scan
+            cursor = cursor.sort([("enrollment_count", -1), ("_id", 1)])
+        elif sort == "newest":
+            cursor = cursor.sort([("created_at", -1), ("_id", 1)])
+        courses = await cursor.to_list(length=1000)
+    
+        # One batched query for every instructor on the page
+        instructors = await loaders.users.load_many(str(c.get("instructor_id", "")) for c in courses)
+    
+        # Convert to response format
+        result = []
+        for course, instructor in zip(courses, instructors):
+            result.append({
+                "id": str(course["_id"]),
+                "title": course.get("title", ""),
+                "description": course.get("description", ""),
+                "category": course.get("category", "general"),
+                "difficulty": course.get("difficulty", "beginner"),
+                "instructor_id": course.get("instructor_id", ""),
+                "instructor_name": course.get("instructor_name") or (instructor or {}).get("name"),
+                "accessibility_features": course.get("accessibility_features", []),
+                "duration": course.get("duration", 0),
+                "modules": course.get("modules", []),
+                "is_published": course.get("is_published", False),
+                "enrollment_count": course.get("enrollment_count", 0),
+                "created_at": course.get("created_at", datetime.utcnow()).isoformat() if isinstance(course.get("created_at"), datetime) else course.get("created_at"),
+                "updated_at": course.get("updated_at", datetime.utcnow()).isoformat() if isinstance(course.get("updated_at"), datetime) else course.get("updated_at")
+            })
+    
+        return result
+
+    return await conditional_json(request, _query_key("courses", request), None, build)
+
+@router.get("/search")
+async def search(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    prefix: bool = Query(True)
 ):
-    """List all courses from MongoDB"""
+    """Ranked full-text search over published courses. With prefix=true the
+    last word matches as a prefix, for typeahead."""
+    async def build():
+        results = await search_courses(q, limit=limit, prefix=prefix)
+        return [{**course, "score": score} for course, score in results]
+
+    return await conditional_json(request, _query_key("search", request), None, build)
+
+@router.get("/for-me")
+async def courses_for_me(
+    features: Optional[str] = Query(None, description="Override the features taken from the saved settings"),
+    current_user: dict = Depends(get_current_user)
+):
+    """Published courses that support every assistive feature enabled in the
+    current user's accessibility settings, matched in one indexed query"""
+    if features is not None:
+        required = normalize_features(features)
+    else:
+        # Imported here: it pulls in SQLAlchemy, which the catalogue reads never need
+        from backend_python.user_settings import get_accessibility_settings
+        required = features_for_settings(await get_accessibility_settings(str(current_user["_id"])))
+    
+    cursor = get_courses_collection().find(features_query(required), COURSE_OUTLINE_PROJECTION)
+    courses = await cursor.to_list(length=1000)
+    
+    return {
+        "required_features": required,
+        "courses": [
+            {
+                "id": str(course["_id"]),
+                "title": course.get("title", ""),
+                "description": course.get("description", ""),
+                "category": course.get("category", "general"),
+                "difficulty": course.get("difficulty", "beginner"),
+                "accessibility_features": course.get("accessibility_features", []),
+                "duration": course.get("duration", 0)
+            }
+            for course in courses
+        ]
+    }
+
+@router.get("/facets")
+async def facets(request: Request):
+    """Counts per category, difficulty, accessibility feature and tag over
+    published courses, for the catalogue filter sidebar"""
+    return await conditional_json(request, "facets", None, get_facets)
+
+@router.get("/{course_id}")
+async def get_course(request: Request, course_id: str = Path(...)):
+    """Get a single course by ID from MongoDB; conditional on its ETag"""
     courses_collection = get_courses_collection()
     
-    # Build query
-    query = {}
-    if category:
-        query["category"] = category
-    if difficulty:
-        query["difficulty"] = difficulty
-    if instructor_id:
-        query["instructor_id"] = instructor_id
-    
-    # Fetch courses
-    cursor = courses_collection.find(query)
-    courses = await cursor.to_list(length=1000)
+    # Only the version is read up front; an unchanged course costs no full fetch
+    probe = await courses_collection.find_one({"_id": course_id}, {"updated_at": 1, "created_at": 1})
+    if not probe:
+        raise HTTPException(status_code=404, detail="Course not found")
     
-    # Convert to response format
-    result = []
-    for course in courses:
-        result.append({
+    async def build():
+        course = await courses_collection.find_one({"_id": course_id}, COURSE_OUTLINE_PROJECTION)
+        if not course:
+            raise HTTPException(status_code=404, detail="Course not found")
+        return {
             "id": str(course["_id"]),
             "title": course.get("title", ""),
             "description": course.get("description", ""),
             "category": course.get("category", "general"),
             "difficulty": course.get("difficulty", "beginner"),
             "instructor_id": course.get("instructor_id", ""),
-            "accessibility_features": course.get("accessibility_features", {}),
+            "accessibility_features": course.get("accessibility_features", []),
             "duration": course.get("duration", 0),
             "modules": course.get("modules", []),
             "is_published": course.get("is_published", False),
             "created_at": course.get("created_at", datetime.utcnow()).isoformat() if isinstance(course.get("created_at"), datetime) else course.get("created_at"),
             "updated_at": course.get("updated_at", datetime.utcnow()).isoformat() if isinstance(course.get("updated_at"), datetime) else course.get("updated_at")
-        })
+        }
     
-    return result
+    return await conditional_json(request, f"course:{course_id}", probe.get("updated_at") or probe.get("created_at"), build)
 
-@router.get("/{course_id}")
-async def get_course(course_id: str = Path(...)):
-    """Get a single course by ID from MongoDB"""
-    courses_collection = get_courses_collection()
-    
-    course = await courses_collection.find_one({"_id": course_id})
-    if not course:
+@router.get("/{course_id}/outline")
+async def get_course_outline(request: Request, course_id: str = Path(...)):
+    """Get the precomputed table of contents for a course landing page"""
+    outline = await get_outline(course_id)
+    if not outline:
         raise HTTPException(status_code=404, detail="Course not found")
     
-    return {
-        "id": str(course["_id"]),
-        "title": course.get("title", ""),
-        "description": course.get("description", ""),
-        "category": course.get("category", "general"),
-        "difficulty": course.get("difficulty", "beginner"),
-        "instructor_id": course.get("instructor_id", ""),
-        "accessibility_features": course.get("accessibility_features", {}),
-        "duration": course.get("duration", 0),
-        "modules": course.get("modules", []),
-        "is_published": course.get("is_published", False),
-        "created_at": course.get("created_at", datetime.utcnow()).isoformat() if isinstance(course.get("created_at"), datetime) else course.get("created_at"),
-        "updated_at": course.get("updated_at", datetime.utcnow()).isoformat() if isinstance(course.get("updated_at"), datetime) else course.get("updated_at")
-    }
+    async def build():
+        return {
+            "course_id": outline["course_id"],
+            "title": outline["title"],
+            "modules": outline["modules"],
+            "lessons": outline["lessons"],
+            "total_minutes": outline["total_minutes"],
+            "updated_at": outline["updated_at"].isoformat() if isinstance(outline.get("updated_at"), datetime) else outline.get("updated_at")
+        }
+    
+    return await conditional_json(request, f"outline:{course_id}", outline.get("updated_at"), build)
+
+@router.get("/{course_id}/lessons/{lesson_id}")
+async def get_course_lesson(course_id: str, lesson_id: str):
+    """Get the full body of one lesson; course reads only carry the outline"""
+    lesson = await get_lesson(course_id, lesson_id)
+    if not lesson:
+        raise HTTPException(status_code=404, detail="Lesson not found")
+    lesson.pop("_id", None)
+    return lesson
+
+# Under /sections/ so it never shadows the SQL routers' /api/courses/{id}/...
+# paths (modules, tree, discussions, gradebook, announcements, ...)
+@router.get("/{course_id}/sections/{section}")
+async def get_course_section(course_id: str, section: CourseSection):
+    """Get a course's pages, announcements, resources, badges, assignments or quizzes"""
+    items = await list_section(course_id, section)
+    for item in items:
+        item.pop("_id", None)
+    return items
 
 @router.put("/{course_id}")
 async def update_course(
@@ -209,20 +356,25 @@ async def update_course(
         if payload.difficulty:
             update_data["difficulty"] = payload.difficulty
         if payload.accessibility_features is not None:
-            update_data["accessibility_features"] = payload.accessibility_features
+            update_data["accessibility_features"] = normalize_features(payload.accessibility_features)
         if payload.duration is not None:
             update_data["duration"] = payload.duration
         if payload.modules is not None:
-            update_data["modules"] = payload.modules
+            outline, items = split_course({"_id": course_id, "modules": payload.modules})
+            await store_course_items(items)
+            update_data["modules"] = outline["modules"]
     
     # Update in MongoDB
     await courses_collection.update_one(
         {"_id": course_id},
         {"$set": update_data}
     )
+    if "modules" in update_data:
+        await rebuild_outline({**course, **update_data})
+    course_changed({**course, **update_data})
     
     # Return updated course
-    updated_course = await courses_collection.find_one({"_id": course_id})
+    updated_course = await courses_collection.find_one({"_id": course_id}, COURSE_OUTLINE_PROJECTION)
     return {
         "id": str(updated_course["_id"]),
         "title": updated_course.get("title", ""),
@@ -230,7 +382,7 @@ async def update_course(
         "category": updated_course.get("category", "general"),
         "difficulty": updated_course.get("difficulty", "beginner"),
         "instructor_id": updated_course.get("instructor_id", ""),
-        "accessibility_features": updated_course.get("accessibility_features", {}),
+        "accessibility_features": updated_course.get("accessibility_features", []),
         "duration": updated_course.get("duration", 0),
         "modules": updated_course.get("modules", []),
         "is_published": updated_course.get("is_published", False),
@@ -268,6 +420,8 @@ async def add_module(
         "order": payload.order,
         "estimated_time": payload.estimated_time or 0
     }
+    # Lesson bodies go to the lessons collection; the course keeps the outline
+    module = await store_module_lessons(course_id, module)
     
     # Get existing modules
     modules = course.get("modules", [])
@@ -287,6 +441,9 @@ async def add_module(
         }
     )
     
+    await rebuild_outline({**course, "modules": modules})
+    course_changed({**course, "modules": modules})
+    
     return {"message": "Module added successfully", "module": module}
 
 @router.put("/{course_id}/modules/{module_id}")
@@ -325,7 +482,9 @@ async def update_module(
         if payload.description is not None:
             modules[module_index]["description"] = payload.description
         if payload.content is not None:
-            modules[module_index]["content"] = payload.content
+            modules[module_index] = await store_module_lessons(
+                course_id, {**modules[module_index], "content": payload.content}
+            )
         if payload.order is not None:
             modules[module_index]["order"] = payload.order
         if payload.estimated_time is not None:
@@ -345,6 +504,9 @@ async def update_module(
         }
     )
     
+    await rebuild_outline({**course, "modules": modules})
+    course_changed({**course, "modules": modules})
+    
     return {"message": "Module updated successfully", "module": modules[module_index]}
 
 @router.delete("/{course_id}/modules/{module_id}")
@@ -371,6 +533,7 @@ async def delete_module(
     # Get modules and remove the one with matching ID
     modules = course.get("modules", [])
     modules = [m for m in modules if m.get("id") != module_id]
+    await delete_module_lessons(course_id, module_id)
     
     # Update course
     await courses_collection.update_one(
@@ -383,6 +546,9 @@ async def delete_module(
         }
     )
     
+    await rebuild_outline({**course, "modules": modules})
+    course_changed({**course, "modules": modules})
+    
     return {"message": "Module deleted successfully"}
 
 @router.patch("/{course_id}/publish")
@@ -418,4 +584,6 @@ async def toggle_publish(
         }
     )
     
+    course_changed({**course, "is_published": new_status})
+    
     return {"message": f"Course {'published' if new_status else 'unpublished'} successfully", "is_published": new_status}
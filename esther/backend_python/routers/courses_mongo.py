@@ -1,10 +1,13 @@
+import logging
 from fastapi import APIRouter, HTTPException
 from typing import List, Optional
 from datetime import datetime
 
 from backend_python.mongodb_db import get_courses_collection
+from backend_python.course_content import COURSE_OUTLINE_PROJECTION
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 @router.get("/", response_model=None)
 @router.get("", response_model=None)
@@ -19,16 +22,11 @@ async def list_courses(category: Optional[str] = None, difficulty: Optional[str]
         if difficulty:
             query["difficulty"] = difficulty
         
-        courses = await courses_col.find(query).to_list(100)
+        courses = await courses_col.find(query, COURSE_OUTLINE_PROJECTION).to_list(100)
         
         # Convert MongoDB documents to response format
         result = []
         for course in courses:
-            # Convert accessibilityFeatures to array if it's a dict
-            acc_features = course.get("accessibility_features", [])
-            if isinstance(acc_features, dict):
-                acc_features = list(acc_features.keys()) if acc_features else []
-            
             result.append({
                 "id": course.get("id", str(course.get("_id"))),
                 "title": course.get("title"),
@@ -42,7 +40,7 @@ async def list_courses(category: Optional[str] = None, difficulty: Optional[str]
                 "duration": course.get("duration_hours"),
                 "coverImage": course.get("cover_image"),
                 "tags": course.get("tags", []),
-                "accessibilityFeatures": acc_features,
+                "accessibilityFeatures": course.get("accessibility_features", []),
                 "captions": course.get("captions", []),
                 "transcriptUrl": course.get("transcript_url"),
                 "signLanguageVideoUrl": course.get("sign_language_video_url"),
@@ -52,8 +50,8 @@ async def list_courses(category: Optional[str] = None, difficulty: Optional[str]
             })
         
         return result
-    except Exception as e:
-        print(f"Error fetching courses: {e}")
+    except Exception:
+        logger.exception("Error fetching courses", extra={"category": category, "difficulty": difficulty})
         return []
 
 @router.get("/{course_id}")
@@ -61,16 +59,11 @@ async def get_course(course_id: str):
     """Get single course by ID"""
     try:
         courses_col = get_courses_collection()
-        course = await courses_col.find_one({"id": course_id})
+        course = await courses_col.find_one({"id": course_id}, COURSE_OUTLINE_PROJECTION)
         
         if not course:
             raise HTTPException(status_code=404, detail="Course not found")
         
-        # Convert accessibilityFeatures to array if it's a dict
-        acc_features = course.get("accessibility_features", [])
-        if isinstance(acc_features, dict):
-            acc_features = list(acc_features.keys()) if acc_features else []
-        
         return {
             "id": course.get("id", str(course.get("_id"))),
             "title": course.get("title"),
@@ -84,7 +77,7 @@ async def get_course(course_id: str):
             "duration": course.get("duration_hours"),
             "coverImage": course.get("cover_image"),
             "tags": course.get("tags", []),
-            "accessibilityFeatures": acc_features,
+            "accessibilityFeatures": course.get("accessibility_features", []),
             "captions": course.get("captions", []),
             "transcriptUrl": course.get("transcript_url"),
             "signLanguageVideoUrl": course.get("sign_language_video_url"),
@@ -95,5 +88,6 @@ async def get_course(course_id: str):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error fetching course: {e}")
+        logger.exception("Error fetching course", extra={"course_id": course_id})
         raise HTTPException(status_code=500, detail=str(e))
+
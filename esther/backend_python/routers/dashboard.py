@@ -0,0 +1,170 @@
+# backend_python/routers/dashboard.py
+"""
+Learner dashboard in one request.
+
+Every section (profile, enrollments, progress, accessibility settings,
+announcements, upcoming assignments) runs concurrently under its own timeout,
+so the response takes as long as the slowest section, capped at
+``DASHBOARD_SECTION_TIMEOUT_SECONDS``. A section that times out or fails is
+returned as null and reported in ``sections``; the others are still served.
+SQL sections use their own short-lived sessions so they can run in parallel
+threads.
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from starlette.concurrency import run_in_threadpool
+
+from backend_python.auth_utils import get_current_user
+from backend_python.database import SessionLocal
+from backend_python.models import Announcement, Assignment
+from backend_python.repositories import Repositories, get_repositories
+from backend_python.repositories.loader import RequestLoaders, get_loaders
+from backend_python.schemas import AnnouncementResponse, AssignmentResponse, ProgressOut, UserResponse
+from backend_python.settings_configuration import settings
+from backend_python.user_settings import get_accessibility_settings
+
+ANNOUNCEMENT_LIMIT = 10
+ASSIGNMENT_LIMIT = 10
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+def _with_session(fn: Callable, *args):
+    db = SessionLocal()
+    try:
+        return fn(db, *args)
+    finally:
+        db.close()
+
+def _sql_course_ids(course_ids: List[str]) -> List[str]:
+    """Enrollments can reference Mongo-only courses; SQL content is keyed by UUID."""
+    valid = []
+    for course_id in course_ids:
+        try:
+            valid.append(str(UUID(str(course_id))))
+        except ValueError:
+            continue
+    return valid
+
+def _recent_announcements(db, course_ids: List[str]) -> List[Announcement]:
+    return (
+        db.query(Announcement)
+        .filter(Announcement.course_id.in_(course_ids))
+        .order_by(Announcement.created_at.desc())
+        .limit(ANNOUNCEMENT_LIMIT)
+        .all()
+    )
+
+def _upcoming_assignments(db, course_ids: List[str], now: datetime) -> List[Assignment]:
+    return (
+        db.query(Assignment)
+        .filter(Assignment.course_id.in_(course_ids), Assignment.due_date >= now)
+        .order_by(Assignment.due_date)
+        .limit(ASSIGNMENT_LIMIT)
+        .all()
+    )
+
+async def _timed(name: str, section: Awaitable, timeout: float) -> Tuple[str, Any, Dict[str, Any]]:
+    start = time.perf_counter()
+    try:
+        result, status = await asyncio.wait_for(section, timeout), "ok"
+    except asyncio.TimeoutError:
+        result, status = None, "timeout"
+    except Exception:
+        logger.exception("Dashboard section failed", extra={"section": name})
+        result, status = None, "error"
+    return name, result, {"status": status, "ms": round((time.perf_counter() - start) * 1000, 1)}
+
+@router.get("/")
+async def get_dashboard(
+    current_user: dict = Depends(get_current_user),
+    repos: Repositories = Depends(get_repositories),
+    loaders: RequestLoaders = Depends(get_loaders)
+):
+    user_id = str(current_user["_id"])
+    # Shared by the enrollment, announcement and assignment sections
+    enrollments_task = asyncio.ensure_future(repos.enrollments.list_for_user(user_id))
+
+    async def profile():
+        return UserResponse(
+            id=UUID(current_user["_id"]),
+            email=current_user["email"],
+            name=current_user.get("name"),
+            role=current_user.get("role", "learner"),
+            created_at=current_user.get("created_at")
+        ).model_dump(mode="json", by_alias=True)
+
+    async def enrollments():
+        rows = await asyncio.shield(enrollments_task)
+        # One batched query for all enrolled courses
+        courses = await loaders.courses.load_many(str(e["course_id"]) for e in rows)
+        return [
+            {
+                "id": str(e["_id"]),
+                "courseId": str(e["course_id"]),
+                "enrolledAt": e.get("enrolled_at"),
+                "course": {
+                    "id": str(course["_id"]),
+                    "title": course.get("title", ""),
+                    "category": course.get("category", "general"),
+                    "difficulty": course.get("difficulty", "beginner"),
+                    "coverImage": course.get("cover_image")
+                } if course else None
+            }
+            for e, course in zip(rows, courses)
+        ]
+
+    async def progress():
+        rows = await repos.progress.list_for_user(user_id)
+        return [ProgressOut(**r).model_dump(mode="json", by_alias=True) for r in rows]
+
+    async def accessibility():
+        return await get_accessibility_settings(user_id)
+
+    async def enrolled_sql_course_ids() -> List[str]:
+        rows = await asyncio.shield(enrollments_task)
+        return _sql_course_ids([e["course_id"] for e in rows])
+
+    async def announcements():
+        course_ids = await enrolled_sql_course_ids()
+        if not course_ids:
+            return []
+        rows = await run_in_threadpool(_with_session, _recent_announcements, course_ids)
+        # One batched query for all authors
+        authors = await loaders.users.load_many(str(a.author_id) for a in rows)
+        return [
+            AnnouncementResponse.model_validate(a)
+            .model_copy(update={"author_name": (author or {}).get("name")})
+            .model_dump(mode="json", by_alias=True)
+            for a, author in zip(rows, authors)
+        ]
+
+    async def upcoming_assignments():
+        course_ids = await enrolled_sql_course_ids()
+        if not course_ids:
+            return []
+        rows = await run_in_threadpool(_with_session, _upcoming_assignments, course_ids, datetime.utcnow())
+        return [AssignmentResponse.model_validate(a).model_dump(mode="json", by_alias=True) for a in rows]
+
+    timeout = settings.DASHBOARD_SECTION_TIMEOUT_SECONDS
+    sections = {
+        "profile": profile(),
+        "enrollments": enrollments(),
+        "progress": progress(),
+        "accessibility": accessibility(),
+        "announcements": announcements(),
+        "upcomingAssignments": upcoming_assignments(),
+    }
+    results = await asyncio.gather(*(_timed(name, section, timeout) for name, section in sections.items()))
+    if not enrollments_task.done():
+        enrollments_task.cancel()
+
+    dashboard: Dict[str, Any] = {name: result for name, result, _ in results}
+    dashboard["sections"] = {name: meta for name, _, meta in results}
+    return dashboard
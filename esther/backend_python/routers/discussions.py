@@ -1,24 +1,132 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import and_, or_, select, update
 from sqlalchemy.orm import Session
 from uuid import UUID
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Tuple
+import base64
 
 from backend_python.database import get_db
-from backend_python.models import Discussion, User
+from backend_python.models import Discussion
 from backend_python.schemas import DiscussionCreate, DiscussionResponse
 from backend_python.auth_utils import get_current_user
 
 router = APIRouter()
 
+# Pages are keyset-paginated on (sort_key, id): threads on last_activity_at,
+# replies on created_at. The next page's cursor is returned in this header and
+# is absent on the last page.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+THREAD_SORT_KEY = "last_activity_at"
+REPLY_SORT_KEY = "created_at"
+
+def encode_cursor(discussion: Discussion, sort_key: str = REPLY_SORT_KEY) -> str:
+    raw = f"{getattr(discussion, sort_key).isoformat()}|{discussion.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        sort_value, discussion_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(sort_value), str(UUID(discussion_id))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def keyset_page(
+    query, sort_key: str, cursor: Optional[str], limit: int, newest_first: bool, response: Response
+) -> List[Discussion]:
+    column = getattr(Discussion, sort_key)
+    if cursor:
+        sort_value, discussion_id = decode_cursor(cursor)
+        if newest_first:
+            after = or_(column < sort_value, and_(column == sort_value, Discussion.id < discussion_id))
+        else:
+            after = or_(column > sort_value, and_(column == sort_value, Discussion.id > discussion_id))
+        query = query.filter(after)
+    if newest_first:
+        query = query.order_by(column.desc(), Discussion.id.desc())
+    else:
+        query = query.order_by(column.asc(), Discussion.id.asc())
+    # One extra row tells us whether there is a next page
+    rows = query.limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1], sort_key)
+    return rows
+
+def thread_ancestors(post_id: str):
+    """Recursive CTE of ``post_id`` and every post above it, up to the thread's
+    opening post; one query however deep the replies nest."""
+    ancestors = (
+        select(Discussion.id, Discussion.parent_id)
+        .where(Discussion.id == post_id)
+        .cte("ancestors", recursive=True)
+    )
+    return ancestors.union_all(
+        select(Discussion.id, Discussion.parent_id).where(Discussion.id == ancestors.c.parent_id)
+    )
+
 @router.get("/courses/{course_id}/discussions", response_model=List[DiscussionResponse])
-def get_course_discussions(course_id: UUID, db: Session = Depends(get_db)):
-    discussions = db.query(Discussion).filter(Discussion.course_id == str(course_id)).order_by(Discussion.created_at.desc()).all()
-    return discussions
+def get_course_discussions(
+    course_id: UUID,
+    response: Response,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """Thread starters for a course, most recently active first. A thread that
+    gets a reply while a client is paging moves to the front, so later pages
+    skip it rather than repeat it."""
+    query = db.query(Discussion).filter(Discussion.course_id == str(course_id), Discussion.parent_id.is_(None))
+    return keyset_page(query, THREAD_SORT_KEY, cursor, limit, newest_first=True, response=response)
+
+@router.get("/discussions/{discussion_id}/replies", response_model=List[DiscussionResponse])
+def get_discussion_replies(
+    discussion_id: UUID,
+    response: Response,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db)
+):
+    """Direct replies to a post, oldest first"""
+    query = db.query(Discussion).filter(Discussion.parent_id == str(discussion_id))
+    return keyset_page(query, REPLY_SORT_KEY, cursor, limit, newest_first=False, response=response)
 
 @router.post("/discussions", response_model=DiscussionResponse)
-def create_discussion(payload: DiscussionCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    discussion = Discussion(**payload.dict(), user_id=str(current_user.id))
+def create_discussion(payload: DiscussionCreate, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+    now = datetime.utcnow()
+    parent_id = str(payload.parent_id) if payload.parent_id else None
+    if parent_id:
+        parent = db.query(Discussion.course_id).filter(Discussion.id == parent_id).first()
+        if not parent:
+            raise HTTPException(status_code=404, detail="Parent post not found")
+        if str(parent.course_id) != str(payload.course_id):
+            raise HTTPException(status_code=400, detail="Reply must be in the same course as its parent")
+
+    discussion = Discussion(
+        course_id=str(payload.course_id),
+        parent_id=parent_id,
+        user_id=str(current_user["_id"]),
+        title=payload.title,
+        content=payload.description or "",
+        reply_count=0,
+        last_activity_at=now,
+        created_at=now
+    )
     db.add(discussion)
+    if parent_id:
+        # Counter update in SQL, so concurrent replies cannot lose increments
+        db.execute(
+            update(Discussion)
+            .where(Discussion.id == parent_id)
+            .values(reply_count=Discussion.reply_count + 1)
+        )
+        # The parent and every post above it: the thread root's last_activity_at
+        # is what the course's thread list is ordered by
+        db.execute(
+            update(Discussion)
+            .where(Discussion.id.in_(select(thread_ancestors(parent_id).c.id)))
+            .values(last_activity_at=now)
+        )
     db.commit()
     db.refresh(discussion)
-    return discussion
+    return discussion
\ No newline at end of file
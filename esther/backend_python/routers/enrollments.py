@@ -2,47 +2,26 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from typing import List
 from datetime import datetime
-from uuid import uuid4
 
-from backend_python.mongodb_db import get_enrollments_collection, get_courses_collection
-from backend_python.mongodb_models import EnrollmentDocument
+from backend_python.mongodb_db import get_enrollments_collection
+from backend_python.enrollment_store import CourseNotFound, enroll as enroll_user, unenroll as unenroll_user
 from backend_python.schemas import EnrollmentOut
 from backend_python.auth_utils import get_current_user
+from backend_python.repositories.loader import RequestLoaders, get_loaders
 
 router = APIRouter()
 
 @router.post("/{course_id}", response_model=EnrollmentOut, status_code=status.HTTP_201_CREATED)
 async def enroll(course_id: str, current_user: dict = Depends(get_current_user)):
     """Enroll current user in a course - saves to MongoDB"""
-    enrollments_collection = get_enrollments_collection()
-    courses_collection = get_courses_collection()
-    
-    # Check if course exists
-    course = await courses_collection.find_one({"_id": course_id})
-    if not course:
+    try:
+        enrollment_doc, created = await enroll_user(str(current_user["_id"]), course_id)
+    except CourseNotFound:
         raise HTTPException(status_code=404, detail="Course not found")
     
-    # Check if already enrolled
-    existing = await enrollments_collection.find_one({
-        "course_id": course_id,
-        "user_id": str(current_user["_id"])
-    })
-    
-    if existing:
+    if not created:
         raise HTTPException(status_code=400, detail="Already enrolled")
     
-    # Create enrollment document
-    enrollment_doc = {
-        "_id": str(uuid4()),
-        "user_id": str(current_user["_id"]),
-        "course_id": course_id,
-        "enrolled_at": datetime.utcnow(),
-        "progress": 0.0
-    }
-    
-    # Insert into MongoDB
-    await enrollments_collection.insert_one(enrollment_doc)
-    
     # Return enrollment response
     return EnrollmentOut(
         id=enrollment_doc["_id"],
@@ -52,7 +31,7 @@ async def enroll(course_id: str, current_user: dict = Depends(get_current_user))
     )
 
 @router.get("/me", response_model=List[EnrollmentOut])
-async def my_enrollments(current_user: dict = Depends(get_current_user)):
+async def my_enrollments(current_user: dict = Depends(get_current_user), loaders: RequestLoaders = Depends(get_loaders)):
     """Get all enrollments for current user - from MongoDB"""
     enrollments_collection = get_enrollments_collection()
     
@@ -60,14 +39,24 @@ async def my_enrollments(current_user: dict = Depends(get_current_user)):
     cursor = enrollments_collection.find({"user_id": str(current_user["_id"])})
     enrollments = await cursor.to_list(length=1000)
     
+    # One batched query for all enrolled courses
+    courses = await loaders.courses.load_many(e["course_id"] for e in enrollments)
+    
     # Convert to response model
     result = []
-    for enrollment in enrollments:
+    for enrollment, course in zip(enrollments, courses):
         result.append(EnrollmentOut(
             id=str(enrollment["_id"]),
             user_id=enrollment["user_id"],
             course_id=enrollment["course_id"],
-            enrolled_at=enrollment.get("enrolled_at", datetime.utcnow())
+            enrolled_at=enrollment.get("enrolled_at", datetime.utcnow()),
+            course={
+                "id": str(course["_id"]),
+                "title": course.get("title", ""),
+                "category": course.get("category", "general"),
+                "difficulty": course.get("difficulty", "beginner"),
+                "cover_image": course.get("cover_image")
+            } if course else None
         ))
     
     return result
@@ -75,15 +64,9 @@ async def my_enrollments(current_user: dict = Depends(get_current_user)):
 @router.delete("/{course_id}", status_code=status.HTTP_200_OK)
 async def unenroll(course_id: str, current_user: dict = Depends(get_current_user)):
     """Unenroll current user from a course - removes from MongoDB"""
-    enrollments_collection = get_enrollments_collection()
-    
-    # Find and delete enrollment
-    result = await enrollments_collection.delete_one({
-        "course_id": course_id,
-        "user_id": str(current_user["_id"])
-    })
+    removed = await unenroll_user(str(current_user["_id"]), course_id)
     
-    if result.deleted_count == 0:
+    if removed is None:
         raise HTTPException(status_code=404, detail="Enrollment not found")
     
     return {"message": "Successfully unenrolled from course", "course_id": course_id}
@@ -0,0 +1,55 @@
+# backend_python/routers/gradebook.py
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from uuid import UUID
+
+from backend_python.database import get_db
+from backend_python.auth_utils import get_current_user
+from backend_python.repositories import Repositories, get_repositories
+from backend_python.gradebook import build_gradebook, course_roster, gradebook_cache, gradebook_csv, load_grading_policy
+
+router = APIRouter()
+
+def require_instructor(current_user: dict = Depends(get_current_user)) -> dict:
+    if current_user.get("role", "learner") not in ["mentor", "administrator"]:
+        raise HTTPException(status_code=403, detail="Only mentors and administrators can view the gradebook")
+    return current_user
+
+@router.get("/courses/{course_id}/gradebook")
+async def get_gradebook(
+    course_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(require_instructor),
+    repos: Repositories = Depends(get_repositories)
+):
+    """Student x assessment score matrix with weighted totals, cached per course"""
+    key = str(course_id)
+    gradebook = gradebook_cache.get(key)
+    if gradebook is not None:
+        return gradebook
+    
+    weights = await load_grading_policy(key)
+    student_ids = await course_roster(key, repos.enrollments.user_ids_for_course)
+    gradebook = await run_in_threadpool(build_gradebook, db, key, weights, student_ids)
+    # One batched query for every student's name
+    users = await repos.users.get_many(s["userId"] for s in gradebook["students"])
+    for student in gradebook["students"]:
+        student["name"] = (users.get(student["userId"]) or {}).get("name")
+    gradebook_cache.set(key, gradebook)
+    return gradebook
+
+@router.get("/courses/{course_id}/gradebook.csv")
+async def export_gradebook_csv(
+    course_id: UUID,
+    current_user: dict = Depends(require_instructor),
+    repos: Repositories = Depends(get_repositories)
+):
+    """Gradebook as CSV, streamed a page of students at a time"""
+    weights = await load_grading_policy(str(course_id))
+    return StreamingResponse(
+        gradebook_csv(str(course_id), weights, repos.enrollments.user_ids_for_course, repos.users.get_many),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="gradebook-{course_id}.csv"'}
+    )
\ No newline at end of file
@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from uuid import UUID
 from typing import List
 
 from backend_python.database import get_db
 from backend_python.models import Module, Lesson
-from backend_python.schemas import ModuleResponse, LessonResponse
+from backend_python.schemas import ModuleResponse, LessonResponse, CourseTreeResponse
+from backend_python.course_tree import MAX_DEPTH, load_course_tree
 
 router = APIRouter()
 
@@ -18,3 +19,8 @@ def get_course_modules(course_id: UUID, db: Session = Depends(get_db)):
 def get_module_lessons(module_id: UUID, db: Session = Depends(get_db)):
     lessons = db.query(Lesson).filter(Lesson.module_id == str(module_id)).order_by(Lesson.order_index).all()
     return lessons
+
+@router.get("/courses/{course_id}/tree", response_model=CourseTreeResponse)
+def get_course_tree(course_id: UUID, depth: int = Query(MAX_DEPTH, ge=1, le=MAX_DEPTH), db: Session = Depends(get_db)):
+    """Modules -> lessons -> resources in one request; depth 1 stops at modules, 2 at lessons"""
+    return load_course_tree(db, str(course_id), depth)
\ No newline at end of file
@@ -1,48 +1,102 @@
 # backend_python/routers/quizzes.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from sqlalchemy.orm import Session
 from uuid import uuid4, UUID
 from typing import List
 
 from backend_python.database import get_db
-from backend_python.models import Quiz, Question, Submission, User
+from backend_python.models import Quiz
 from backend_python.schemas import QuizCreate, QuizOut, QuestionCreate, SubmissionIn, SubmissionOut
 from backend_python.auth_utils import get_current_user
+from backend_python.gradebook import invalidate_gradebook
+from backend_python.repositories import Repositories, get_repositories
+from backend_python.question_import import QuestionBankError, detect_format, parse_question_bank
+from backend_python.quiz_analytics import refresh_quiz_analytics
+from backend_python.rate_limit import limit_by_user
+
+MAX_IMPORT_BYTES = 5 * 1024 * 1024
 
 router = APIRouter()
 
 @router.post("/", response_model=QuizOut, status_code=status.HTTP_201_CREATED)
-def create_quiz(payload: QuizCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def create_quiz(payload: QuizCreate, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
     q = Quiz(id=str(uuid4()), course_id=str(payload.course_id), title=payload.title, description=payload.description)
     db.add(q)
     db.commit()
     db.refresh(q)
+    # New gradebook column
+    invalidate_gradebook(q.course_id)
     return QuizOut.model_validate(q)
 
 @router.post("/{quiz_id}/questions", status_code=status.HTTP_201_CREATED)
-def add_question(quiz_id: UUID, payload: QuestionCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    q = db.query(Quiz).filter(Quiz.id == str(quiz_id)).first()
+async def add_question(quiz_id: UUID, payload: QuestionCreate, current_user: dict = Depends(get_current_user), repos: Repositories = Depends(get_repositories)):
+    q = await repos.quizzes.get_quiz(str(quiz_id))
     if not q:
         raise HTTPException(status_code=404, detail="Quiz not found")
-    question = Question(id=str(uuid4()), quiz_id=str(quiz_id), prompt=payload.prompt, options=payload.options, answer=payload.answer)
-    db.add(question)
-    db.commit()
-    db.refresh(question)
-    return {"id": question.id, "prompt": question.prompt}
+    question = await repos.quizzes.add_question(str(quiz_id), payload.prompt, payload.options or [], payload.answer)
+    return {"id": question["id"], "prompt": question["prompt"]}
+
+@router.post("/{quiz_id}/questions/import", status_code=status.HTTP_201_CREATED)
+async def import_questions(
+    quiz_id: UUID,
+    file: UploadFile = File(..., description="Question bank as .json or .csv"),
+    partial: bool = Query(False, description="Import the valid rows even if some rows have errors"),
+    current_user: dict = Depends(get_current_user),
+    repos: Repositories = Depends(get_repositories)
+):
+    """Validate a whole question bank, then insert it in one transaction"""
+    if not await repos.quizzes.get_quiz(str(quiz_id)):
+        raise HTTPException(status_code=404, detail="Quiz not found")
+    
+    raw = await file.read(MAX_IMPORT_BYTES + 1)
+    if len(raw) > MAX_IMPORT_BYTES:
+        raise HTTPException(status_code=413, detail="Question bank is larger than 5 MB")
+    try:
+        fmt = detect_format(file.filename, file.content_type)
+        questions, errors = parse_question_bank(raw.decode("utf-8-sig"), fmt)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Question bank must be UTF-8 encoded")
+    except QuestionBankError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if errors and not partial:
+        # Nothing is written unless every row is valid
+        raise HTTPException(status_code=422, detail={"imported": 0, "errors": errors})
+    
+    imported = await repos.quizzes.add_questions(str(quiz_id), questions) if questions else 0
+    return {"imported": imported, "errors": errors}
 
 @router.post("/{quiz_id}/submit", response_model=SubmissionOut, status_code=status.HTTP_201_CREATED)
-def submit_quiz(quiz_id: UUID, payload: SubmissionIn, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def submit_quiz(quiz_id: UUID, payload: SubmissionIn, current_user: dict = Depends(limit_by_user("submit_quiz")), repos: Repositories = Depends(get_repositories)):
     # very basic scoring: compare answers to stored 'answer' fields for each question
-    questions = db.query(Question).filter(Question.quiz_id == str(quiz_id)).all()
+    questions = await repos.quizzes.list_questions(str(quiz_id))
     correct = 0
     total = len(questions)
-    qmap = {q.id: q for q in questions}
+    qmap = {q["id"]: q for q in questions}
     for qid, ans in payload.answers.items():
-        if qid in qmap and qmap[qid].answer is not None and str(qmap[qid].answer) == str(ans):
+        if qid in qmap and qmap[qid]["answer"] is not None and str(qmap[qid]["answer"]) == str(ans):
             correct += 1
     score = int((correct / total) * 100) if total > 0 else 0
-    s = Submission(id=str(uuid4()), user_id=str(current_user.id), quiz_id=str(quiz_id), answers=payload.answers, score=score)
-    db.add(s)
-    db.commit()
-    db.refresh(s)
+    s = await repos.quizzes.add_submission(str(quiz_id), str(current_user["_id"]), payload.answers, score)
     return SubmissionOut.model_validate(s)
+
+@router.get("/{quiz_id}/analytics")
+def get_quiz_analytics(
+    quiz_id: UUID,
+    full: bool = Query(False, description="Recompute from every submission instead of only new ones"),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """Per-question difficulty, discrimination and distractor counts - mentors and admins only"""
+    if current_user.get("role", "learner") not in ["mentor", "administrator"]:
+        raise HTTPException(status_code=403, detail="Only mentors and administrators can view quiz analytics")
+    if not db.query(Quiz.id).filter(Quiz.id == str(quiz_id)).first():
+        raise HTTPException(status_code=404, detail="Quiz not found")
+    
+    analytics = refresh_quiz_analytics(db, str(quiz_id), full=full)
+    return {
+        "quiz_id": str(quiz_id),
+        "submission_count": analytics.submission_count,
+        "updated_at": analytics.updated_at,
+        "items": analytics.items or []
+    }
\ No newline at end of file
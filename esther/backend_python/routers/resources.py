@@ -6,6 +6,7 @@ from typing import List
 from backend_python.database import get_db
 from backend_python.models import Resource
 from backend_python.schemas import ResourceCreate, ResourceResponse
+from backend_python.course_tree import invalidate_course_tree
 
 router = APIRouter()
 
@@ -26,8 +27,16 @@ def get_lesson_resources(lesson_id: UUID, db: Session = Depends(get_db)):
 
 @router.post("/resources", response_model=ResourceResponse)
 def create_resource(payload: ResourceCreate, db: Session = Depends(get_db)):
-    resource = Resource(**payload.dict())
+    resource = Resource(
+        course_id=str(payload.course_id),
+        module_id=str(payload.module_id) if payload.module_id else None,
+        lesson_id=str(payload.lesson_id) if payload.lesson_id else None,
+        title=payload.title,
+        file_url=payload.url,
+        resource_type=payload.resource_type
+    )
     db.add(resource)
     db.commit()
     db.refresh(resource)
+    invalidate_course_tree(payload.course_id)
     return resource
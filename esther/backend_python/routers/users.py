@@ -1,15 +1,14 @@
 # backend_python/routers/users.py
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
 from uuid import UUID, uuid4
+from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, EmailStr
 
-from backend_python.database import get_db
-from backend_python.models import User, UserRole
 from backend_python.schemas import UserResponse, UserCreate
 from backend_python.auth_utils import get_current_user, get_password_hash
 from backend_python.mongodb_db import get_users_collection
+from backend_python.repositories import Repositories, get_repositories
 
 router = APIRouter()
 
@@ -17,22 +16,34 @@ class UserUpdate(BaseModel):
     name: Optional[str] = None
     email: Optional[EmailStr] = None
 
+def find_user_by_email(db, email: str):
+    from backend_python.models import User
+    return db.query(User).filter(User.email == email).first()
+
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def create_user(payload: UserCreate, db: Session = Depends(get_db)):
-    existing = db.query(User).filter(User.email == payload.email).first()
-    if existing:
-        raise HTTPException(status_code=400, detail="Email already registered")
-    user = User(
-        id=str(uuid4()),
-        email=payload.email,
-        name=payload.name,
-        role=UserRole(payload.role) if payload.role in UserRole.__members__ or payload.role in [r.value for r in UserRole] else UserRole.learner,
-        password_hash=get_password_hash(payload.password)
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    return UserResponse.model_validate(user)
+def create_user(payload: UserCreate):
+    # Imported here: SQLAlchemy is the bulk of this router's import cost and
+    # only this endpoint needs it
+    from backend_python.database import SessionLocal
+    from backend_python.models import User, UserRole
+
+    db = SessionLocal()
+    try:
+        if find_user_by_email(db, payload.email):
+            raise HTTPException(status_code=400, detail="Email already registered")
+        user = User(
+            id=str(uuid4()),
+            email=payload.email,
+            name=payload.name,
+            role=UserRole(payload.role) if payload.role in UserRole.__members__ or payload.role in [r.value for r in UserRole] else UserRole.learner,
+            password_hash=get_password_hash(payload.password)
+        )
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        return UserResponse.model_validate(user)
+    finally:
+        db.close()
 
 @router.get("/me", response_model=UserResponse)
 async def me(current_user: dict = Depends(get_current_user)):
@@ -75,6 +86,7 @@ async def update_me(payload: UserUpdate, current_user: dict = Depends(get_curren
         )
     
     # Update in MongoDB
+    update_data["updated_at"] = datetime.utcnow()
     await users_collection.update_one(
         {"_id": user_id},
         {"$set": update_data}
@@ -91,10 +103,16 @@ async def update_me(payload: UserUpdate, current_user: dict = Depends(get_curren
     )
 
 @router.get("/{user_id}", response_model=UserResponse)
-def get_user(user_id: UUID, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    if str(current_user.id) != str(user_id) and current_user.role != UserRole.administrator:
+async def get_user(user_id: UUID, current_user: dict = Depends(get_current_user), repos: Repositories = Depends(get_repositories)):
+    if str(current_user["_id"]) != str(user_id) and current_user.get("role") != "administrator":
         raise HTTPException(status_code=403, detail="Not authorized")
-    user = db.query(User).filter(User.id == str(user_id)).first()
+    user = await repos.users.get(str(user_id))
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return UserResponse.model_validate(user)
+    return UserResponse(
+        id=UUID(user["_id"]),
+        email=user["email"],
+        name=user.get("name"),
+        role=user.get("role", "learner"),
+        created_at=user.get("created_at")
+    )
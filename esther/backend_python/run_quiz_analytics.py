@@ -0,0 +1,46 @@
+"""
+Batch job: refresh item analytics for every quiz that has submissions.
+Incremental by default (only submissions newer than each quiz's watermark are
+read); pass --full to rebuild from scratch.
+
+Run: python -m backend_python.run_quiz_analytics [--full] [--chunk-size 2000]
+"""
+import argparse
+import sys
+import os
+import time
+
+# Add parent directory to path for imports
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+from backend_python.database import SessionLocal
+from backend_python.models import Submission
+from backend_python.quiz_analytics import CHUNK_SIZE, refresh_quiz_analytics
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh quiz item analytics")
+    parser.add_argument("--full", action="store_true", help="rebuild instead of folding in new submissions")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        quiz_ids = [str(row.quiz_id) for row in db.query(Submission.quiz_id).distinct()]
+        print(f"Refreshing analytics for {len(quiz_ids)} quizzes...")
+        start = time.perf_counter()
+        for quiz_id in quiz_ids:
+            analytics = refresh_quiz_analytics(db, quiz_id, full=args.full, chunk_size=args.chunk_size)
+            flagged = sum(1 for item in analytics.items or [] if item["flags"])
+            print(f"[OK] {quiz_id}: {analytics.submission_count} submissions, {flagged} flagged questions")
+        print(f"[SUCCESS] Done in {time.perf_counter() - start:.1f}s")
+    except Exception as e:
+        print(f"[ERROR] Analytics refresh failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,5 +1,5 @@
 # backend_python/schemas.py
-from pydantic import BaseModel, EmailStr, Field, HttpUrl
+from pydantic import AliasChoices, BaseModel, EmailStr, Field, HttpUrl
 from typing import Optional, List, Dict
 from uuid import UUID
 from datetime import datetime
@@ -34,7 +34,7 @@ class CourseCreate(CamelModel):
     description: Optional[str] = None
     category: Optional[str] = "general"
     difficulty: Optional[str] = "beginner"
-    accessibility_features: Optional[Dict] = {}
+    accessibility_features: Optional[List[str]] = []
     sign_language_video_url: Optional[HttpUrl] = None
     transcript_url: Optional[HttpUrl] = None
 
@@ -45,7 +45,7 @@ class CourseResponse(CamelModel):
     category: str
     difficulty: str
     instructor_id: UUID
-    accessibility_features: Optional[Dict] = {}
+    accessibility_features: Optional[List[str]] = []
     captions: Optional[List[Dict]] = []
     transcript_url: Optional[str] = None
     sign_language_video_url: Optional[str] = None
@@ -57,6 +57,7 @@ class EnrollmentOut(CamelModel):
     user_id: str
     course_id: str
     enrolled_at: Optional[datetime]
+    course: Optional[Dict] = None  # course summary, filled in by listing endpoints
 
 # === Progress ===
 class ProgressIn(CamelModel):
@@ -158,12 +159,14 @@ class AssignmentResponse(CamelModel):
     due_date: Optional[datetime] = None
     created_at: Optional[datetime] = None
 
+class AssignmentGradeIn(CamelModel):
+    score: float = Field(..., ge=0)
+
 # === Announcements ===
 class AnnouncementCreate(CamelModel):
     course_id: UUID
     title: str
     content: Optional[str] = None
-    author_id: UUID
 
 class AnnouncementResponse(CamelModel):
     id: UUID
@@ -171,6 +174,7 @@ class AnnouncementResponse(CamelModel):
     title: str
     content: Optional[str] = None
     author_id: UUID
+    author_name: Optional[str] = None
     created_at: Optional[datetime] = None
 
 # === Discussions ===
@@ -178,29 +182,52 @@ class DiscussionCreate(CamelModel):
     course_id: UUID
     title: str
     description: Optional[str] = None
+    parent_id: Optional[UUID] = None
 
 class DiscussionResponse(CamelModel):
     id: UUID
     course_id: UUID
+    parent_id: Optional[UUID] = None
     title: str
-    description: Optional[str] = None
+    description: Optional[str] = Field(None, validation_alias="content")
+    reply_count: int = 0
+    last_activity_at: Optional[datetime] = None
     created_at: Optional[datetime] = None
 
 # === Resources ===
 class ResourceCreate(CamelModel):
     course_id: UUID
+    module_id: Optional[UUID] = None
+    lesson_id: Optional[UUID] = None
     title: str
     url: str
     resource_type: str
 
 class ResourceResponse(CamelModel):
     id: UUID
-    course_id: UUID
+    course_id: Optional[UUID] = None
+    module_id: Optional[UUID] = None
+    lesson_id: Optional[UUID] = None
     title: str
-    url: str
-    resource_type: str
+    # Stored as Resource.file_url
+    url: Optional[str] = Field(None, validation_alias=AliasChoices("file_url", "url", "fileUrl"))
+    resource_type: Optional[str] = None
     created_at: Optional[datetime] = None
 
+# Course content tree; fields below the requested depth are None
+class LessonTree(LessonResponse):
+    resources: Optional[List[ResourceResponse]] = None
+
+class ModuleTree(ModuleResponse):
+    lessons: Optional[List[LessonTree]] = None
+    resources: Optional[List[ResourceResponse]] = None
+
+class CourseTreeResponse(CamelModel):
+    course_id: UUID
+    depth: int
+    modules: List[ModuleTree] = []
+    resources: Optional[List[ResourceResponse]] = None
+
 # === Pages ===
 class PageCreate(CamelModel):
     course_id: UUID
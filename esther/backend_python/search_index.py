@@ -0,0 +1,183 @@
+# backend_python/search_index.py
+"""
+In-process full-text index over published courses.
+
+Indexes titles, descriptions, tags and module/lesson titles with per-field
+weights and ranks with BM25. The last query term is prefix-expanded for
+typeahead. The index is built from MongoDB on first use and then kept current
+by the course write paths calling ``index_course`` / ``remove_course``.
+"""
+import asyncio
+import math
+import re
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from backend_python.mongodb_db import get_courses_collection
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Field weights: a match in the title counts for more than one in the description
+FIELD_WEIGHTS = {
+    "title": 3.0,
+    "tags": 2.0,
+    "lesson_titles": 1.5,
+    "description": 1.0,
+}
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Prefix expansion is capped so a one-letter prefix stays cheap
+MAX_PREFIX_EXPANSIONS = 50
+
+SEARCH_PROJECTION = {
+    "title": 1, "description": 1, "tags": 1, "category": 1, "difficulty": 1,
+    "is_published": 1, "id": 1, "modules.title": 1, "modules.lessons.title": 1,
+}
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_RE.findall(text.lower())
+
+def _course_fields(course: Dict[str, Any]) -> Dict[str, str]:
+    lesson_titles = []
+    for module in course.get("modules") or []:
+        lesson_titles.append(module.get("title") or "")
+        lesson_titles.extend(lesson.get("title") or "" for lesson in module.get("lessons") or [])
+    return {
+        "title": course.get("title") or "",
+        "description": course.get("description") or "",
+        "tags": " ".join(course.get("tags") or []),
+        "lesson_titles": " ".join(lesson_titles),
+    }
+
+class CourseSearchIndex:
+    def __init__(self):
+        self._postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self._doc_terms: Dict[str, Iterable[str]] = {}
+        self._doc_len: Dict[str, float] = {}
+        self._docs: Dict[str, Dict[str, Any]] = {}
+        self._vocabulary: List[str] = []
+        self._total_len = 0.0
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # ---------- writes ----------
+    def add(self, course: Dict[str, Any]) -> None:
+        """Index (or re-index) a course. Unpublished courses are removed."""
+        course_id = str(course.get("id") or course["_id"])
+        self.remove(course_id)
+        if not course.get("is_published", False):
+            return
+
+        term_freqs: Dict[str, float] = defaultdict(float)
+        for field, text in _course_fields(course).items():
+            weight = FIELD_WEIGHTS[field]
+            for term in tokenize(text):
+                term_freqs[term] += weight
+
+        for term, freq in term_freqs.items():
+            postings = self._postings[term]
+            if not postings:
+                insort(self._vocabulary, term)
+            postings[course_id] = freq
+        self._doc_terms[course_id] = tuple(term_freqs)
+        self._doc_len[course_id] = sum(term_freqs.values())
+        self._total_len += self._doc_len[course_id]
+        self._docs[course_id] = {
+            "id": course_id,
+            "title": course.get("title", ""),
+            "description": course.get("description", ""),
+            "category": course.get("category", "general"),
+            "difficulty": course.get("difficulty", "beginner"),
+            "tags": course.get("tags", []),
+        }
+
+    def remove(self, course_id: str) -> None:
+        terms = self._doc_terms.pop(course_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings[term]
+            postings.pop(course_id, None)
+            if not postings:
+                del self._postings[term]
+                index = bisect_left(self._vocabulary, term)
+                if index < len(self._vocabulary) and self._vocabulary[index] == term:
+                    del self._vocabulary[index]
+        self._total_len -= self._doc_len.pop(course_id, 0.0)
+        self._docs.pop(course_id, None)
+
+    # ---------- reads ----------
+    def expand_prefix(self, prefix: str) -> List[str]:
+        start = bisect_left(self._vocabulary, prefix)
+        terms = []
+        for term in self._vocabulary[start:start + MAX_PREFIX_EXPANSIONS]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def search(self, query: str, limit: int = 20, prefix: bool = True) -> List[Tuple[Dict[str, Any], float]]:
+        terms = tokenize(query)
+        if not terms or not self._docs:
+            return []
+
+        # Every term is matched exactly, except the last one while typing
+        term_groups = [[term] for term in terms[:-1]]
+        last = terms[-1]
+        term_groups.append(self.expand_prefix(last) if prefix else [last])
+
+        doc_count = len(self._docs)
+        avg_len = self._total_len / doc_count
+        scores: Dict[str, float] = defaultdict(float)
+        for group in term_groups:
+            for term in group:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for course_id, freq in postings.items():
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self._doc_len[course_id] / avg_len)
+                    scores[course_id] += idf * freq * (BM25_K1 + 1) / (freq + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [(self._docs[course_id], round(score, 4)) for course_id, score in ranked]
+
+    # ---------- loading ----------
+    async def ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            cursor = get_courses_collection().find({"is_published": True}, SEARCH_PROJECTION)
+            async for course in cursor:
+                self.add(course)
+            self._loaded = True
+
+    def reset(self) -> None:
+        """Drop everything; the next search reloads from Mongo."""
+        self._postings.clear()
+        self._doc_terms.clear()
+        self._doc_len.clear()
+        self._docs.clear()
+        self._vocabulary = []
+        self._total_len = 0.0
+        self._loaded = False
+
+course_search_index = CourseSearchIndex()
+
+async def search_courses(query: str, limit: int = 20, prefix: bool = True) -> List[Tuple[Dict[str, Any], float]]:
+    await course_search_index.ensure_loaded()
+    return course_search_index.search(query, limit=limit, prefix=prefix)
+
+def index_course(course: Optional[Dict[str, Any]]) -> None:
+    """Keep the index current after a course write. No-op until first search."""
+    if course and course_search_index._loaded:
+        course_search_index.add(course)
+
+def remove_course(course_id: str) -> None:
+    course_search_index.remove(course_id)
@@ -12,7 +12,7 @@ from datetime import datetime, timedelta
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, parent_dir)
 
-from backend_python.mongodb_db import get_courses_collection
+from backend_python.seeding import seed_catalogue, print_report
 
 # Course 1: Web Development Fundamentals
 WEB_DEV_COURSE = {
@@ -1577,16 +1577,13 @@ ALL_COURSES = [WEB_DEV_COURSE, DIGITAL_LITERACY_COURSE, PYTHON_COURSE]
 async def seed_courses():
     """Seed MongoDB with complete course data"""
     try:
-        courses_col = get_courses_collection()
-        
-        # Clear existing courses
-        await courses_col.delete_many({})
+        # Clear existing courses and upsert the catalogue in one bulk write
+        report = await seed_catalogue(ALL_COURSES, reset=True)
         print("[OK] Cleared existing courses")
+        print_report(report)
         
-        # Insert new courses
         for course in ALL_COURSES:
-            await courses_col.insert_one(course)
-            print(f"[OK] Inserted: {course['title']}")
+            print(f"[OK] Seeded: {course['title']}")
             print(f"  - {len(course['modules'])} modules")
             print(f"  - {len(course.get('assignments', []))} assignments")
             print(f"  - {len(course.get('quizzes', []))} quizzes")
@@ -10,19 +10,14 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from backend_python.mongodb_db import (
-    get_users_collection,
-    get_courses_collection,
-    get_mongo_db
-)
+from backend_python.mongodb_db import INSERT_ONLY_FIELDS, get_users_collection
 from backend_python.auth_utils import get_password_hash
+from backend_python.seeding import print_report, seed_catalogue, stable_id
 
 async def seed_all_content():
     """Seed complete educational content"""
     
-    db = get_mongo_db()
     users_col = get_users_collection()
-    courses_col = get_courses_collection()
     
     # Create instructor
     instructor_id = str(uuid4())
@@ -361,12 +356,38 @@ async def seed_all_content():
         }
     ]
     
-    # Insert courses with all content
+    # Build each course fully embedded with stable IDs; seed_catalogue splits
+    # lesson bodies into ``lessons`` and quizzes/assignments/announcements into
+    # their ``course_<section>`` collections, in the shape course reads expect
+    now = datetime.utcnow()
+    courses = []
     for course_data in courses_data:
-        course_id = str(uuid4())
+        course_id = stable_id("course", course_data["title"])
+        modules = []
+        for mod_idx, module_data in enumerate(course_data.get("modules", [])):
+            module_id = stable_id("module", course_id, module_data["title"])
+            lessons = []
+            for lesson_idx, lesson_data in enumerate(module_data.get("lessons", [])):
+                lesson = {
+                    "id": stable_id("lesson", module_id, lesson_data["title"]),
+                    "title": lesson_data["title"],
+                    "type": lesson_data["type"],
+                    "order": lesson_idx,
+                    "content": lesson_data["content"],
+                    "resources": lesson_data.get("resources", []),
+                }
+                if lesson_data.get("video_url"):
+                    lesson["video_url"] = lesson_data["video_url"]
+                lessons.append(lesson)
+            modules.append({
+                "id": module_id,
+                "title": module_data["title"],
+                "description": module_data["description"],
+                "order": mod_idx,
+                "lessons": lessons
+            })
         
-        # Create course
-        course = {
+        courses.append({
             "id": course_id,
             "_id": course_id,
             "title": course_data["title"],
@@ -378,123 +399,44 @@ async def seed_all_content():
             "learning_outcomes": course_data["learning_outcomes"],
             "is_published": True,
             "tags": [course_data["category"], course_data["difficulty"]],
-            "accessibility_features": {
-                "captions": True,
-                "transcripts": True,
-                "screen_reader": True,
-                "keyboard_navigation": True
-            },
-            "created_at": datetime.utcnow()
-        }
-        
-        existing_course = await courses_col.find_one({"title": course["title"]})
-        if existing_course:
-            print(f"ℹ️  Course already exists: {course['title']}")
-            course_id = existing_course["id"]
-        else:
-            await courses_col.insert_one(course)
-            print(f"✅ Created course: {course['title']}")
-        
-        # Create modules
-        modules_col = db["modules"]
-        for mod_idx, module_data in enumerate(course_data.get("modules", [])):
-            module_id = str(uuid4())
-            module = {
-                "id": module_id,
-                "_id": module_id,
-                "course_id": course_id,
-                "title": module_data["title"],
-                "description": module_data["description"],
-                "order_index": mod_idx,
-                "created_at": datetime.utcnow()
-            }
-            
-            existing_module = await modules_col.find_one({"course_id": course_id, "title": module["title"]})
-            if not existing_module:
-                await modules_col.insert_one(module)
-                print(f"  ✅ Created module: {module['title']}")
-            else:
-                module_id = existing_module["id"]
-            
-            # Create lessons
-            lessons_col = db["lessons"]
-            for lesson_idx, lesson_data in enumerate(module_data.get("lessons", [])):
-                lesson_id = str(uuid4())
-                lesson = {
-                    "id": lesson_id,
-                    "_id": lesson_id,
-                    "module_id": module_id,
-                    "title": lesson_data["title"],
-                    "lesson_type": lesson_data["type"],
-                    "content": lesson_data["content"],
-                    "video_url": lesson_data.get("video_url"),
-                    "resource_links": lesson_data.get("resources", []),
-                    "order_index": lesson_idx,
-                    "created_at": datetime.utcnow()
+            "accessibility_features": ["captions", "keyboard-navigation", "screen-reader", "transcripts"],
+            "modules": modules,
+            "quizzes": [
+                {
+                    "id": stable_id("quiz", course_id, quiz_data["title"]),
+                    "title": quiz_data["title"],
+                    "questions": quiz_data["questions"],
+                    "created_at": now
                 }
-                
-                existing_lesson = await lessons_col.find_one({"module_id": module_id, "title": lesson["title"]})
-                if not existing_lesson:
-                    await lessons_col.insert_one(lesson)
-                    print(f"    ✅ Created lesson: {lesson['title']}")
-        
-        # Create quizzes
-        quizzes_col = db["quizzes"]
-        for quiz_data in course_data.get("quizzes", []):
-            quiz_id = str(uuid4())
-            quiz = {
-                "id": quiz_id,
-                "_id": quiz_id,
-                "course_id": course_id,
-                "title": quiz_data["title"],
-                "questions": quiz_data["questions"],
-                "created_at": datetime.utcnow()
-            }
-            
-            existing_quiz = await quizzes_col.find_one({"course_id": course_id, "title": quiz["title"]})
-            if not existing_quiz:
-                await quizzes_col.insert_one(quiz)
-                print(f"  ✅ Created quiz: {quiz['title']}")
-        
-        # Create assignments
-        assignments_col = db["assignments"]
-        for assign_data in course_data.get("assignments", []):
-            assignment_id = str(uuid4())
-            assignment = {
-                "id": assignment_id,
-                "_id": assignment_id,
-                "course_id": course_id,
-                "title": assign_data["title"],
-                "description": assign_data["description"],
-                "points": assign_data["points"],
-                "due_date": datetime.utcnow() + timedelta(days=assign_data["due_days"]),
-                "created_at": datetime.utcnow()
-            }
-            
-            existing_assignment = await assignments_col.find_one({"course_id": course_id, "title": assignment["title"]})
-            if not existing_assignment:
-                await assignments_col.insert_one(assignment)
-                print(f"  ✅ Created assignment: {assignment['title']}")
-        
-        # Create announcements
-        announcements_col = db["announcements"]
-        for announce_data in course_data.get("announcements", []):
-            announcement_id = str(uuid4())
-            announcement = {
-                "id": announcement_id,
-                "_id": announcement_id,
-                "course_id": course_id,
-                "author_id": instructor_id,
-                "title": announce_data["title"],
-                "content": announce_data["content"],
-                "is_pinned": True,
-                "created_at": datetime.utcnow()
-            }
-            
-            existing_announcement = await announcements_col.find_one({"course_id": course_id, "title": announcement["title"]})
-            if not existing_announcement:
-                await announcements_col.insert_one(announcement)
-                print(f"  ✅ Created announcement: {announcement['title']}")
+                for quiz_data in course_data.get("quizzes", [])
+            ],
+            "assignments": [
+                {
+                    "id": stable_id("assignment", course_id, assign_data["title"]),
+                    "title": assign_data["title"],
+                    "description": assign_data["description"],
+                    "points": assign_data["points"],
+                    "due_date": now + timedelta(days=assign_data["due_days"]),
+                    "created_at": now
+                }
+                for assign_data in course_data.get("assignments", [])
+            ],
+            "announcements": [
+                {
+                    "id": stable_id("announcement", course_id, announce_data["title"]),
+                    "author_id": instructor_id,
+                    "title": announce_data["title"],
+                    "content": announce_data["content"],
+                    "is_pinned": True,
+                    "created_at": now
+                }
+                for announce_data in course_data.get("announcements", [])
+            ],
+            "created_at": now
+        })
+    
+    # Due dates are relative to the first seeding; re-runs must not move them
+    print_report(await seed_catalogue(courses, insert_only=INSERT_ONLY_FIELDS + ("due_date",)))
     
     print("\n🎉 Content seeding completed successfully!")
     print(f"📚 Created {len(courses_data)} courses with modules, lessons, quizzes, and assignments")
@@ -8,9 +8,10 @@ import os
 from datetime import datetime
 
 # Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
 
-from mongodb_db import get_courses_collection
+from backend_python.seeding import seed_catalogue, print_report
 
 COURSES_DATA = [
     {
@@ -349,17 +350,13 @@ COURSES_DATA = [
 async def seed_courses():
     """Seed MongoDB with course data"""
     try:
-        courses_col = get_courses_collection()
-        
-        # Clear existing courses
-        await courses_col.delete_many({})
-        print("✓ Cleared existing courses")
-        
-        # Insert new courses
         for course in COURSES_DATA:
             course["created_at"] = datetime.utcnow()
-            await courses_col.insert_one(course)
-            print(f"✓ Inserted: {course['title']}")
+        
+        # Clear existing courses and upsert the catalogue in one bulk write
+        report = await seed_catalogue(COURSES_DATA, reset=True)
+        print("✓ Cleared existing courses")
+        print_report(report)
         
         print(f"\n✅ Successfully seeded {len(COURSES_DATA)} courses with complete content!")
         
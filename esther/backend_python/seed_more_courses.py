@@ -10,7 +10,7 @@ from datetime import datetime, timedelta
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, parent_dir)
 
-from backend_python.mongodb_db import get_courses_collection
+from backend_python.seeding import seed_catalogue, print_report
 
 # Additional Courses
 ADDITIONAL_COURSES = [
@@ -173,20 +173,11 @@ ADDITIONAL_COURSES = [
 async def seed_additional_courses():
     """Add more courses to MongoDB"""
     try:
-        courses_col = get_courses_collection()
+        # Upsert by stable course ID, so re-running updates instead of duplicating
+        report = await seed_catalogue(ADDITIONAL_COURSES)
+        print_report(report)
         
-        # Insert new courses
-        for course in ADDITIONAL_COURSES:
-            # Check if course already exists
-            existing = await courses_col.find_one({"id": course["id"]})
-            if existing:
-                print(f"[SKIP] Course already exists: {course['title']}")
-                continue
-                
-            await courses_col.insert_one(course)
-            print(f"[OK] Inserted: {course['title']}")
-        
-        print(f"\n[SUCCESS] Added {len(ADDITIONAL_COURSES)} new courses!")
+        print(f"\n[SUCCESS] Added {report['inserted']} new courses!")
         
     except Exception as e:
         print(f"[ERROR] Error seeding courses: {e}")
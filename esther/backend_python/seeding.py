@@ -0,0 +1,214 @@
+"""
+Bulk seeding engine shared by the seed_* scripts.
+Upserts documents keyed on stable IDs with unordered bulk_write, so re-running
+a seed updates existing documents instead of duplicating them, and can pad the
+catalogue with synthetic courses (generated in parallel) up to a target size.
+Courses are stored split: outline in ``courses``, lesson bodies and other
+sub-resources in their own collections, plus a precomputed table of contents
+in ``course_outlines`` (see course_content.py).
+
+Run: python -m backend_python.seeding --target 5000 --workers 4
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+from uuid import NAMESPACE_URL, uuid5
+
+# Add parent directory to path for imports
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+from backend_python.mongodb_db import (
+    INSERT_ONLY_FIELDS,
+    bulk_upsert,
+    empty_write_counts,
+    get_course_outlines_collection,
+    get_course_section_collection,
+    get_courses_collection,
+    get_lessons_collection,
+    merge_write_counts,
+)
+from backend_python.course_content import (
+    CourseSection,
+    build_outline,
+    ensure_content_indexes,
+    split_course,
+    store_course_items,
+)
+from backend_python.accessibility_features import ensure_feature_indexes, normalize_features
+from backend_python.enrollment_store import ensure_enrollment_indexes
+
+SYNTHETIC_CHUNK_SIZE = 500
+SYNTHETIC_PREFIX = "synthetic-course-"
+
+# ==================== Stable IDs ====================
+def stable_id(*parts: Any) -> str:
+    """Deterministic UUID for a seeded entity, derived from its natural key
+    (e.g. ``stable_id("course", title)``), so every run produces the same ID."""
+    return str(uuid5(NAMESPACE_URL, "inclusive-learning:" + ":".join(str(p) for p in parts)))
+
+def with_stable_id(doc: Dict[str, Any], *scope: Any) -> Dict[str, Any]:
+    """Make ``_id`` and ``id`` agree. Existing ``id`` values are kept; documents
+    without one get a stable ID derived from ``scope`` and their title."""
+    doc_id = doc.get("id") or doc.get("_id") or stable_id(*scope, doc["title"])
+    doc["id"] = doc_id
+    doc["_id"] = doc_id
+    return doc
+
+async def upsert_courses(
+    collection, courses: List[Dict[str, Any]], insert_only: Iterable[str] = INSERT_ONLY_FIELDS
+) -> Dict[str, int]:
+    """Split ``courses`` and upsert outlines and content. Counts are for the
+    course documents only. Fields in ``insert_only`` are written only when a
+    document is created, so re-seeding leaves them (and the counts) alone."""
+    outlines = []
+    items: Dict[str, List[Dict[str, Any]]] = {}
+    for course in courses:
+        course["accessibility_features"] = normalize_features(course.get("accessibility_features"))
+        outline, course_items = split_course(course)
+        outlines.append(outline)
+        for name, docs in course_items.items():
+            items.setdefault(name, []).extend(docs)
+    await store_course_items(items, insert_only)
+    await bulk_upsert(get_course_outlines_collection(), [build_outline(outline) for outline in outlines])
+    return await bulk_upsert(collection, outlines, insert_only=insert_only)
+
+# ==================== Synthetic data ====================
+CATEGORIES = ["technology", "vocational", "literacy", "soft_skills"]
+DIFFICULTIES = ["beginner", "intermediate", "advanced"]
+ACCESSIBILITY_FEATURES = [
+    "screen-reader", "captions", "text-to-speech", "keyboard-navigation",
+    "high-contrast", "sign-language", "simplified-ui",
+]
+TOPICS = [
+    "Web Development", "Python", "Digital Literacy", "Data Analysis", "Graphic Design",
+    "Business Skills", "Mobile Apps", "Cybersecurity", "English", "Agriculture",
+    "Communication", "Financial Literacy", "Customer Service", "Tailoring", "Carpentry",
+]
+LESSON_TYPES = ["video", "text", "quiz", "activity"]
+# Fixed timestamp so regenerated synthetic courses compare equal across runs
+SYNTHETIC_EPOCH = datetime(2025, 1, 1)
+
+def generate_synthetic_courses(start: int, stop: int) -> List[Dict[str, Any]]:
+    """Build synthetic courses ``start..stop-1``. Each course is seeded from its
+    index, so the same index always yields the same document."""
+    courses = []
+    for index in range(start, stop):
+        rng = random.Random(index)
+        topic = rng.choice(TOPICS)
+        course_id = f"{SYNTHETIC_PREFIX}{index:06d}"
+        modules = []
+        for m in range(1, rng.randint(3, 6) + 1):
+            lessons = [
+                {
+                    "id": f"{course_id}-m{m}-l{l}",
+                    "title": f"{topic} {m}.{l}",
+                    "type": rng.choice(LESSON_TYPES),
+                    "duration": rng.choice([10, 15, 20, 30, 45]),
+                    "order": l,
+                    "content": f"Synthetic lesson {m}.{l} for {topic}. " * rng.randint(5, 20),
+                }
+                for l in range(1, rng.randint(3, 6) + 1)
+            ]
+            modules.append({
+                "id": f"{course_id}-m{m}",
+                "title": f"{topic} Module {m}",
+                "order": m,
+                "lessons": lessons,
+            })
+        courses.append({
+            "_id": course_id,
+            "id": course_id,
+            "title": f"{topic} #{index}",
+            "description": f"Synthetic {topic.lower()} course generated for load testing.",
+            "category": rng.choice(CATEGORIES),
+            "difficulty": rng.choice(DIFFICULTIES),
+            "duration_hours": rng.randint(5, 60),
+            "instructor_id": f"instructor-{rng.randint(1, 50):03d}",
+            "is_published": rng.random() < 0.9,
+            "accessibility_features": sorted(rng.sample(ACCESSIBILITY_FEATURES, rng.randint(1, 4))),
+            "tags": [topic.lower().replace(" ", "-"), "synthetic"],
+            "created_at": SYNTHETIC_EPOCH + timedelta(minutes=index),
+            "modules": modules,
+        })
+    return courses
+
+async def _seed_synthetic(collection, count: int, workers: Optional[int]) -> Dict[str, int]:
+    """Generate ``count`` synthetic courses across a process pool, writing each
+    chunk as soon as it is ready so generation and writes overlap."""
+    counts = empty_write_counts()
+    if count <= 0:
+        return counts
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunks = [
+            loop.run_in_executor(pool, generate_synthetic_courses, start, min(start + SYNTHETIC_CHUNK_SIZE, count))
+            for start in range(0, count, SYNTHETIC_CHUNK_SIZE)
+        ]
+        for chunk in asyncio.as_completed(chunks):
+            merge_write_counts(counts, await upsert_courses(collection, await chunk))
+    return counts
+
+# ==================== Entry point ====================
+async def seed_catalogue(
+    courses: Iterable[Dict[str, Any]] = (),
+    target: int = 0,
+    workers: Optional[int] = None,
+    reset: bool = False,
+    insert_only: Iterable[str] = INSERT_ONLY_FIELDS,
+) -> Dict[str, Any]:
+    """Upsert ``courses`` and, if ``target`` exceeds their number, pad the
+    catalogue with synthetic courses. Returns inserted/updated counts and the
+    elapsed time in seconds."""
+    started = time.perf_counter()
+    courses_col = get_courses_collection()
+
+    if reset:
+        await courses_col.delete_many({})
+        await get_course_outlines_collection().delete_many({})
+        # Split-out content would otherwise outlive its courses
+        await get_lessons_collection().delete_many({})
+        for section in CourseSection:
+            await get_course_section_collection(section.value).delete_many({})
+    await ensure_content_indexes()
+    await ensure_feature_indexes()
+    await ensure_enrollment_indexes()
+
+    docs = [with_stable_id(course, "course") for course in courses]
+    report = merge_write_counts(empty_write_counts(), await upsert_courses(courses_col, docs, insert_only))
+    merge_write_counts(report, await _seed_synthetic(courses_col, target - len(docs), workers))
+
+    report["total"] = report["inserted"] + report["updated"] + report["unchanged"] + report["failed"]
+    report["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+    return report
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"[OK] {report['total']} documents in {report['elapsed_seconds']}s: "
+        f"{report['inserted']} inserted, {report['updated']} updated, "
+        f"{report['unchanged']} unchanged, {report['failed']} failed"
+    )
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed the course catalogue")
+    parser.add_argument("--target", type=int, default=0, help="total number of courses to reach with synthetic data")
+    parser.add_argument("--workers", type=int, default=None, help="processes used to generate synthetic courses")
+    parser.add_argument("--with-fixtures", action="store_true", help="also upsert the hand-written seed courses")
+    args = parser.parse_args()
+
+    courses = []
+    if args.with_fixtures:
+        from backend_python.seed_complete_courses import ALL_COURSES
+        from backend_python.seed_more_courses import ADDITIONAL_COURSES
+        courses = ALL_COURSES + ADDITIONAL_COURSES
+
+    print_report(asyncio.run(seed_catalogue(courses, target=args.target, workers=args.workers)))
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,3 @@
-from gtts import gTTS
 from io import BytesIO
 
 def generate_tts(text: str, voice: str = "default") -> bytes:
@@ -7,6 +6,7 @@ def generate_tts(text: str, voice: str = "default") -> bytes:
     Returns audio bytes that can be saved and served.
     """
     # For quick dev, return empty bytes or call gTTS locally (not production).
+    from gtts import gTTS  # heavy optional dependency; only loaded when TTS is used
     mp3 = BytesIO()
     tts = gTTS(text)
     tts.write_to_fp(mp3)
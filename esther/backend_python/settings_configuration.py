@@ -1,5 +1,5 @@
 # esther/backend_python/config.py
-from typing import List
+from typing import Dict, List
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -41,4 +41,50 @@ class Settings(BaseSettings):
         "http://127.0.0.1:5173"
     ]
 
+    # Routers to mount (see router_registry.py). "all" mounts the default set;
+    # otherwise a comma-separated list such as "auth" or "auth,courses_mongo"
+    # for lean auth-only or catalogue-only nodes.
+    # Trade-off: the default stays "all" because the web app calls every
+    # router, and a smaller default would silently 404 its pages. It also
+    # means a cold start imports every router, SQLAlchemy included (about
+    # 2.0 s median here, against 1.1 s for "auth,courses_mongo", which never
+    # imports SQLAlchemy; python -m backend_python.profile_cold_start). Nodes that
+    # serve only part of the API should set a list to get the lazy startup.
+    ENABLED_ROUTERS: str | List[str] = "all"
+
+    # Cross-worker cache invalidation from Mongo change streams (event_bus.py).
+    # Polling is used instead when mongod is not a replica set.
+    CHANGE_FEED_ENABLED: bool = True
+    CHANGE_FEED_POLL_SECONDS: float = 5.0
+
+    # Budget for each section of GET /api/dashboard; a slower section is
+    # returned empty and marked "timeout" instead of holding up the rest.
+    DASHBOARD_SECTION_TIMEOUT_SECONDS: float = 1.5
+
+    # Application logs: JSON lines via a background writer (logging_setup.py).
+    # Below WARNING, listed loggers keep only this fraction of records.
+    LOG_LEVEL: str = "INFO"
+    LOG_SAMPLE_RATES: Dict[str, float] = {"backend_python.access": 0.1}
+
+    # Responses smaller than this are sent uncompressed (http_cache.py)
+    COMPRESSION_MIN_BYTES: int = 1024
+
+    # Token-bucket rate limits (rate_limit.py), "<count>/<second|minute|hour|day>"
+    # per policy. Policies missing from RATE_LIMITS are unlimited. The "sqlite"
+    # backend shares buckets between the workers of one host.
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"  # "memory" | "sqlite"
+    RATE_LIMIT_SQLITE_PATH: str = "/tmp/inclusive_learning_rate_limits.db"
+    RATE_LIMIT_MAX_KEYS: int = 100_000
+    # Only enable behind a proxy that sets X-Forwarded-For; clients can forge it
+    RATE_LIMIT_TRUST_FORWARDED: bool = False
+    RATE_LIMITS: Dict[str, str] = {
+        "login": "20/minute",          # per IP
+        "login_account": "5/minute",   # per email, across IPs
+        "signup": "5/minute",          # per IP
+        "refresh": "30/minute",        # per IP
+        "refresh_user": "10/minute",   # per user
+        "submit_quiz": "10/minute",    # per user
+    }
+
 settings = Settings()
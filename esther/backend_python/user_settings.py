@@ -0,0 +1,54 @@
+# backend_python/user_settings.py
+"""
+Per-user accessibility settings with an in-process cache.
+
+Settings are read on every page (font size, contrast, TTS), so reads are served
+from ``settings_cache`` and only ``save_accessibility_settings`` touches the
+cache on write.
+"""
+from typing import Any, Dict
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from backend_python.cache import TTLCache
+from backend_python.database import SessionLocal
+from backend_python.models import AccessibilitySettings
+
+settings_cache = TTLCache(maxsize=10000, ttl=900)
+
+def load_accessibility_settings(db: Session, user_id: str) -> Dict[str, Any]:
+    cached = settings_cache.get(user_id)
+    if cached is not None:
+        return cached
+    s = db.query(AccessibilitySettings).filter(AccessibilitySettings.user_id == user_id).first()
+    settings = (s.settings if s else None) or {}
+    settings_cache.set(user_id, settings)
+    return settings
+
+def save_accessibility_settings(db: Session, user_id: str, settings: Dict[str, Any]) -> Dict[str, Any]:
+    s = db.query(AccessibilitySettings).filter(AccessibilitySettings.user_id == user_id).first()
+    if not s:
+        s = AccessibilitySettings(user_id=user_id, settings=settings)
+        db.add(s)
+    else:
+        s.settings = settings
+    db.commit()
+    db.refresh(s)
+    saved = s.settings or {}
+    settings_cache.set(user_id, saved)
+    return saved
+
+def _load_with_new_session(user_id: str) -> Dict[str, Any]:
+    db = SessionLocal()
+    try:
+        return load_accessibility_settings(db, user_id)
+    finally:
+        db.close()
+
+async def get_accessibility_settings(user_id: str) -> Dict[str, Any]:
+    """Async accessor for handlers without a SQL session; cache hits skip the thread hop."""
+    cached = settings_cache.get(user_id)
+    if cached is not None:
+        return cached
+    return await run_in_threadpool(_load_with_new_session, user_id)